@@ -0,0 +1,117 @@
+# Compare Eager and Compiled Forward Passes of Sequential Networks #
+# -----------------------------------------------------------------#
+
+import timeit
+import argparse
+import tracemalloc
+
+import ivy
+from ivy.functional.backends.numpy.compilation import _CompiledFunction
+
+
+def _network(depth, width, in_size, out_size):
+    layers = [ivy.Linear(in_size, width)]
+    for _ in range(depth - 2):
+        layers.append(ivy.Linear(width, width))
+    layers.append(ivy.Linear(width, out_size))
+    return ivy.Sequential(*layers)
+
+
+def _measured_peak(fn):
+    """Peak memory allocated by one call of `fn`, as seen by tracemalloc."""
+    fn()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+    return peak
+
+
+def _memory(network, x):
+    print(
+        "\n{:<16}{:>8}{:>20}{:>18}{:>16}".format(
+            "buffers", "allocs", "planned peak (MB)", "peak (MB)", "measured (MB)"
+        )
+    )
+    for plan_memory in (False, True):
+        compiled = _CompiledFunction(network._call, [], [], plan_memory=plan_memory)
+        compiled(x, v=network.v)
+        memory = list(compiled.graphs.values())[0].memory
+        print(
+            "{:<16}{:>8}{:>20.3f}{:>18.3f}{:>16.3f}".format(
+                "on" if plan_memory else "off",
+                memory["allocations"],
+                memory["peak_bytes"] / 1e6,
+                memory["peak_bytes_without_buffers"] / 1e6,
+                _measured_peak(lambda: compiled(x, v=network.v)) / 1e6,
+            )
+        )
+
+
+def main(backend_str, depth, width, batch_size, number):
+    ivy.set_backend(backend_str)
+    in_size, out_size = 32, 10
+    x = ivy.random_normal(shape=(batch_size, in_size))
+    network = _network(depth, width, in_size, out_size)
+    compiled = ivy.compile(network._call)
+    eager_ret = network(x)
+    compiled_ret = compiled(x, v=network.v)
+    assert ivy.all(ivy.abs(eager_ret - compiled_ret) < 1e-5)
+    times = [
+        min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+        for fn in (lambda: network(x), lambda: compiled(x, v=network.v))
+    ]
+    graph = list(compiled.graphs.values())[0]
+    print(
+        "{:<8}{:>8}{:>8}{:>12}{:>14}{:>10}{:>8}{:>8}{:>9}".format(
+            "depth",
+            "width",
+            "batch",
+            "eager (us)",
+            "compiled (us)",
+            "speedup",
+            "ops",
+            "folded",
+            "dropped",
+        )
+    )
+    print(
+        "{:<8}{:>8}{:>8}{:>12.1f}{:>14.1f}{:>9.2f}x{:>8}{:>8}{:>9}".format(
+            depth,
+            width,
+            batch_size,
+            times[0],
+            times[1],
+            times[0] / times[1],
+            len(graph.ops),
+            graph.num_folded,
+            graph.num_dropped,
+        )
+    )
+    if backend_str == "numpy":
+        _memory(network, x)
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the forward pass of a Sequential network of Linear layers, "
+        "called eagerly and through ivy.compile."
+    )
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--depth", type=int, default=8, help="number of layers")
+    parser.add_argument("--width", type=int, default=64, help="hidden layer size")
+    parser.add_argument("--batch_size", type=int, default=16)
+    parser.add_argument(
+        "--number", type=int, default=200, help="calls per timing repeat"
+    )
+    parsed_args = parser.parse_args()
+    main(
+        parsed_args.backend,
+        parsed_args.depth,
+        parsed_args.width,
+        parsed_args.batch_size,
+        parsed_args.number,
+    )
@@ -0,0 +1,104 @@
+# Time the Convolutions of the Numpy Backend on ResNet and UNet Layer Shapes #
+# --------------------------------------------------------------------------#
+
+import timeit
+import argparse
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+# (name, function, input shape without the batch, filter shape, strides, padding),
+# all channel last
+_LAYERS = {
+    "resnet": [
+        ("stem 7x7/2", "conv2d", (224, 224, 3), (7, 7, 3, 64), 2, "SAME"),
+        ("conv2_x 1x1", "conv2d", (56, 56, 64), (1, 1, 64, 256), 1, "SAME"),
+        ("conv2_x 3x3", "conv2d", (56, 56, 64), (3, 3, 64, 64), 1, "SAME"),
+        ("conv3_x 3x3/2", "conv2d", (56, 56, 128), (3, 3, 128, 128), 2, "SAME"),
+        ("conv4_x 3x3", "conv2d", (14, 14, 256), (3, 3, 256, 256), 1, "SAME"),
+        ("conv5_x 3x3", "conv2d", (7, 7, 512), (3, 3, 512, 512), 1, "SAME"),
+        ("depthwise 3x3", "depthwise_conv2d", (56, 56, 128), (3, 3, 128), 1, "SAME"),
+    ],
+    "unet": [
+        ("enc1 3x3", "conv2d", (128, 128, 64), (3, 3, 64, 64), 1, "SAME"),
+        ("enc2 3x3", "conv2d", (64, 64, 128), (3, 3, 128, 128), 1, "SAME"),
+        ("enc3 3x3", "conv2d", (32, 32, 256), (3, 3, 256, 256), 1, "SAME"),
+        ("bottleneck 3x3", "conv2d", (16, 16, 512), (3, 3, 512, 512), 1, "SAME"),
+        ("up 2x2/2", "conv2d_transpose", (16, 16, 512), (2, 2, 512, 256), 2, "SAME"),
+        ("up 2x2/2", "conv2d_transpose", (32, 32, 256), (2, 2, 256, 128), 2, "SAME"),
+        ("3d enc 3x3x3", "conv3d", (32, 32, 32, 32), (3, 3, 3, 32, 32), 1, "SAME"),
+        (
+            "3d up 2x2x2/2",
+            "conv3d_transpose",
+            (16, 16, 16, 64),
+            (2, 2, 2, 64, 32),
+            2,
+            "SAME",
+        ),
+    ],
+}
+
+
+def _measured_peak(fn):
+    """Peak memory allocated by one call of `fn`, as seen by tracemalloc."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+    return peak
+
+
+def _macs(fn_name, x_shape, filter_shape, ret_shape):
+    """Multiply-accumulates of the layer, counted on the larger of the input and the
+    output, so that transposed convolutions are counted on their input."""
+    if fn_name == "depthwise_conv2d":
+        return np.prod(ret_shape) * np.prod(filter_shape[:-1])
+    if "transpose" in fn_name:
+        return np.prod(x_shape) * np.prod(filter_shape[:-2]) * filter_shape[-1]
+    return np.prod(ret_shape) * np.prod(filter_shape[:-1])
+
+
+def main(network, batch_size, number):
+    ivy.set_backend("numpy")
+    backend = ivy.current_backend()
+    print(
+        "{:<20}{:<20}{:>12}{:>12}{:>14}".format(
+            "layer", "function", "time (ms)", "GMAC/s", "peak (MB)"
+        )
+    )
+    for name, fn_name, x_shape, filter_shape, strides, padding in _LAYERS[network]:
+        x = np.random.uniform(size=(batch_size,) + x_shape).astype("float32")
+        filters = np.random.uniform(size=filter_shape).astype("float32")
+        fn = getattr(backend, fn_name)
+
+        def call():
+            return fn(x, filters, strides, padding)
+
+        ret = call()
+        t = min(timeit.repeat(call, number=number, repeat=3)) / number
+        print(
+            "{:<20}{:<20}{:>12.2f}{:>12.2f}{:>14.1f}".format(
+                name,
+                fn_name,
+                t * 1e3,
+                _macs(fn_name, x.shape, filter_shape, ret.shape) / t / 1e9,
+                _measured_peak(call) / 1e6,
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the numpy backend convolutions on the layer shapes of "
+        "ResNet-50 and UNet."
+    )
+    parser.add_argument("--network", type=str, default="resnet", choices=list(_LAYERS))
+    parser.add_argument("--batch_size", type=int, default=1)
+    parser.add_argument("--number", type=int, default=3, help="calls per timing repeat")
+    parsed_args = parser.parse_args()
+    main(parsed_args.network, parsed_args.batch_size, parsed_args.number)
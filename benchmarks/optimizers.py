@@ -0,0 +1,89 @@
+# Time the Fused Optimizer Steps Against the Per-Variable Steps on an MLP #
+# -----------------------------------------------------------------------#
+
+import timeit
+import argparse
+
+import numpy as np
+
+import ivy
+
+_OPTIMIZERS = {
+    "sgd": ivy.SGD,
+    "lars": ivy.LARS,
+    "adam": ivy.Adam,
+    "lamb": ivy.LAMB,
+}
+
+
+def _mlp_variables(depth, width):
+    """The weights and biases of an MLP with `depth` hidden layers of `width` units,
+    as a container with one array per variable."""
+    rng = np.random.default_rng(0)
+    return ivy.Container(
+        {
+            "layer{}".format(i): {
+                "w": ivy.array(rng.normal(size=(width, width)).astype("float32")),
+                "b": ivy.array(rng.normal(size=(width,)).astype("float32")),
+            }
+            for i in range(depth)
+        }
+    )
+
+
+def main(backend_str, optimizer, depth, widths, number):
+    ivy.set_backend(backend_str)
+    print(
+        "{:<10}{:>14}{:>16}{:>14}{:>10}".format(
+            "width", "parameters", "unfused (ms)", "fused (ms)", "speedup"
+        )
+    )
+    for width in widths:
+        grads = _mlp_variables(depth, width)
+        times = list()
+        for fused in (False, True):
+            opt = _OPTIMIZERS[optimizer](lr=1e-4, fused=fused)
+            v = _mlp_variables(depth, width)
+
+            def step():
+                nonlocal v
+                v = opt.step(v, grads)
+
+            step()
+            times.append(
+                min(timeit.repeat(step, number=number, repeat=3)) / number * 1e3
+            )
+        print(
+            "{:<10}{:>14}{:>16.3f}{:>14.3f}{:>9.2f}x".format(
+                width,
+                depth * (width * width + width),
+                times[0],
+                times[1],
+                times[0] / times[1],
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the optimizer step on the variables of an MLP, with and "
+        "without fusing the variables into flat buffers."
+    )
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument(
+        "--optimizer", type=str, default="adam", choices=list(_OPTIMIZERS)
+    )
+    parser.add_argument("--depth", type=int, default=16, help="hidden layers")
+    parser.add_argument(
+        "--widths", type=int, nargs="+", default=[8, 32, 128, 512, 1024]
+    )
+    parser.add_argument("--number", type=int, default=20, help="steps per repeat")
+    parsed_args = parser.parse_args()
+    main(
+        parsed_args.backend,
+        parsed_args.optimizer,
+        parsed_args.depth,
+        parsed_args.widths,
+        parsed_args.number,
+    )
@@ -0,0 +1,107 @@
+# Time the Batched Numpy Sampling Against the Per-Row Sampling #
+# -------------------------------------------------------------#
+
+import timeit
+import argparse
+
+import numpy as np
+
+import ivy
+
+
+def _multinomial_per_row(probs, num_samples, replace):
+    """The previous numpy multinomial, calling np.random.choice once per row."""
+    probs = probs / np.sum(probs, -1, keepdims=True, dtype="float64")
+    return np.stack(
+        [
+            np.random.choice(probs.shape[-1], num_samples, replace, p=prob)
+            for prob in probs
+        ]
+    )
+
+
+def _normal_cast(shape, dtype):
+    """The previous numpy random_normal, casting double precision draws."""
+    return np.asarray(np.random.normal(0.0, 1.0, shape), dtype=dtype)
+
+
+def _time(fn, number):
+    fn()
+    return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e3
+
+
+def main(batch_sizes, population_size, num_samples, number):
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    print(
+        "{:<12}{:>10}{:>16}{:>16}{:>10}".format(
+            "batch", "replace", "per row (ms)", "batched (ms)", "speedup"
+        )
+    )
+    for batch_size in batch_sizes:
+        probs = rng.random((batch_size, population_size))
+        native_probs = ivy.native_array(probs)
+        for replace in (True, False):
+            times = (
+                _time(
+                    lambda: _multinomial_per_row(probs, num_samples, replace), number
+                ),
+                _time(
+                    lambda: ivy.multinomial(
+                        population_size,
+                        num_samples,
+                        batch_size=batch_size,
+                        probs=native_probs,
+                        replace=replace,
+                    ),
+                    number,
+                ),
+            )
+            print(
+                "{:<12}{:>10}{:>16.3f}{:>16.3f}{:>9.2f}x".format(
+                    batch_size, str(replace), times[0], times[1], times[0] / times[1]
+                )
+            )
+    print()
+    print(
+        "{:<12}{:>10}{:>16}{:>16}{:>10}".format(
+            "size", "dtype", "cast (ms)", "native (ms)", "speedup"
+        )
+    )
+    for batch_size in batch_sizes:
+        shape = (batch_size, population_size)
+        times = (
+            _time(lambda: _normal_cast(shape, "float32"), number),
+            _time(lambda: ivy.random_normal(shape=shape, dtype="float32"), number),
+        )
+        print(
+            "{:<12}{:>10}{:>16.3f}{:>16.3f}{:>9.2f}x".format(
+                batch_size * population_size,
+                "float32",
+                times[0],
+                times[1],
+                times[0] / times[1],
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the numpy multinomial and normal sampling, batched over the "
+        "rows and drawn natively in single precision, against the previous per-row "
+        "and double precision sampling."
+    )
+    parser.add_argument(
+        "--batch_sizes", type=int, nargs="+", default=[1, 16, 256, 4096]
+    )
+    parser.add_argument("--population_size", type=int, default=1000)
+    parser.add_argument("--num_samples", type=int, default=16)
+    parser.add_argument("--number", type=int, default=10, help="calls per repeat")
+    parsed_args = parser.parse_args()
+    main(
+        parsed_args.batch_sizes,
+        parsed_args.population_size,
+        parsed_args.num_samples,
+        parsed_args.number,
+    )
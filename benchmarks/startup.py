@@ -0,0 +1,105 @@
+# Measure Import Time and Memory for Each Backend #
+# ------------------------------------------------#
+
+import sys
+import json
+import argparse
+import subprocess
+
+FW_STRS = ["numpy", "jax", "tensorflow", "torch"]
+
+# each measurement runs in a fresh interpreter, so that modules imported by one
+# measurement can't leak into the next one
+_CHILD_SCRIPT = """
+import sys
+import json
+import time
+import psutil
+
+backend = sys.argv[1]
+process = psutil.Process()
+rss_start = process.memory_info().rss
+start = time.perf_counter()
+import ivy
+import_time = time.perf_counter() - start
+rss_import = process.memory_info().rss
+start = time.perf_counter()
+if backend != "none":
+    ivy.set_backend(backend)
+set_backend_time = time.perf_counter() - start
+rss_backend = process.memory_info().rss
+frameworks = [fw for fw in ("jax", "tensorflow", "torch") if fw in sys.modules]
+print(
+    json.dumps(
+        {
+            "import_time": import_time,
+            "set_backend_time": set_backend_time,
+            "import_rss": rss_import - rss_start,
+            "backend_rss": rss_backend - rss_start,
+            "frameworks_loaded": frameworks,
+        }
+    )
+)
+"""
+
+
+def measure(backend):
+    proc = subprocess.run(
+        [sys.executable, "-c", _CHILD_SCRIPT, backend],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return None
+    return json.loads(proc.stdout.strip().split("\n")[-1])
+
+
+def main(backends, repeats):
+    print(
+        "{:<12}{:>12}{:>16}{:>14}{:>15}  {}".format(
+            "backend",
+            "import (s)",
+            "set_backend (s)",
+            "import (MB)",
+            "backend (MB)",
+            "frameworks loaded",
+        )
+    )
+    for backend in backends:
+        results = [measure(backend) for _ in range(repeats)]
+        results = [r for r in results if r is not None]
+        if not results:
+            print("{:<12}{:>12}".format(backend, "unavailable"))
+            continue
+        best = min(results, key=lambda r: r["import_time"] + r["set_backend_time"])
+        print(
+            "{:<12}{:>12.3f}{:>16.3f}{:>14.1f}{:>15.1f}  {}".format(
+                backend,
+                best["import_time"],
+                best["set_backend_time"],
+                best["import_rss"] / 1e6,
+                best["backend_rss"] / 1e6,
+                ", ".join(best["frameworks_loaded"]) or "-",
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the time and memory cost of importing ivy and setting "
+        "each backend."
+    )
+    parser.add_argument(
+        "--backends",
+        type=str,
+        default=",".join(["none"] + FW_STRS),
+        help="comma separated backends to measure, 'none' only imports ivy",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="number of fresh interpreters per backend, the fastest is reported",
+    )
+    parsed_args = parser.parse_args()
+    main(parsed_args.backends.split(","), parsed_args.repeats)
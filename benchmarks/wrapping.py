@@ -0,0 +1,82 @@
+# Compare the Fused Function Wrapper Against the Chained Decorators #
+# -----------------------------------------------------------------#
+
+import timeit
+import argparse
+
+import ivy
+from ivy.func_wrapper import FN_DECORATORS, _chain_decorators, _fuse_decorators
+
+
+def _ops(backend):
+    """Return (name, args, kwargs) for each benchmarked op, using small arrays so that
+    the wrapping overhead dominates."""
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.native_array([4.0, 5.0, 6.0])
+    m = ivy.ones((4, 4))
+    return [
+        ("abs", (x,), {}),
+        ("add", (x, y), {}),
+        ("multiply", (x, 2.0), {}),
+        ("add", (x, y), {"out": ivy.zeros(3)}),
+        ("matmul", (m, m), {}),
+        ("sum", (x,), {}),
+        ("concat", ([x, y],), {}),
+        ("zeros", ((3,),), {}),
+        ("ones_like", (x,), {}),
+        ("full", ((3,), 2.0), {}),
+    ]
+
+
+def _wrapped_pair(backend, name):
+    original = ivy.backend_handler.ivy_original_dict[name]
+    to_wrap = backend.__dict__[name]
+    decorators = [
+        attr
+        for attr in FN_DECORATORS
+        if hasattr(original, attr) and not hasattr(to_wrap, attr)
+    ]
+    return (
+        _chain_decorators(to_wrap, decorators),
+        _fuse_decorators(to_wrap, decorators),
+        decorators,
+    )
+
+
+def main(backend_str, number):
+    ivy.set_backend(backend_str)
+    backend = ivy.current_backend()
+    print(
+        "{:<12}{:>14}{:>14}{:>10}  {}".format(
+            "op", "chained (us)", "fused (us)", "speedup", "decorators"
+        )
+    )
+    for name, args, kwargs in _ops(backend):
+        chained, fused, decorators = _wrapped_pair(backend, name)
+        times = list()
+        for fn in (chained, fused):
+            times.append(
+                min(timeit.repeat(lambda: fn(*args, **kwargs), number=number, repeat=5))
+                / number
+                * 1e6
+            )
+        label = name + (" (out)" if "out" in kwargs else "")
+        print(
+            "{:<12}{:>14.2f}{:>14.2f}{:>9.2f}x  {}".format(
+                label, times[0], times[1], times[0] / times[1], len(decorators)
+            )
+        )
+    ivy.unset_backend()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time each op through the chained decorators and through the "
+        "fused wrapper."
+    )
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument(
+        "--number", type=int, default=2000, help="calls per timing repeat"
+    )
+    parsed_args = parser.parse_args()
+    main(parsed_args.backend, parsed_args.number)
@@ -1,15 +1,6 @@
 # global
-from typing import Union
-import jax.numpy as jnp
-import jax
-import jaxlib
-from jaxlib.xla_extension import Buffer
-import numpy as np
-import tensorflow as tf
-from tensorflow.python.types.core import Tensor
-from tensorflow.python.framework.tensor_shape import TensorShape
-import torch
 import warnings
+import numpy as np
 from ivy._version import __version__ as __version__
 
 warnings.filterwarnings("ignore", module="^(?!.*ivy).*$")
@@ -30,28 +21,28 @@ class Framework:
     pass
 
 
-NativeArray = Union[
-    jax.interpreters.xla._DeviceArray,
-    jaxlib.xla_extension.DeviceArray,
-    Buffer,
-    np.ndarray,
-    Tensor,
-    torch.Tensor,
-]
+# the native placeholders are replaced by the backend-specific types in
+# set_backend, which avoids importing every framework when ivy is imported
 
 
-NativeVariable = Union[
-    jax.interpreters.xla._DeviceArray, np.ndarray, Tensor, torch.Tensor
-]
+class NativeArray:
+    pass
 
 
-NativeDevice = Union[jaxlib.xla_extension.Device, str, torch.device]
+class NativeVariable:
+    pass
 
 
-NativeDtype = Union[jnp.dtype, np.dtype, tf.DType, torch.dtype, str]
+class NativeDevice:
+    pass
 
 
-NativeShape = Union[tuple, TensorShape, torch.Size]
+class NativeDtype:
+    pass
+
+
+class NativeShape:
+    pass
 
 
 class Container:
@@ -427,6 +418,9 @@ from .container import conversions as cont_conversions
 from .container import (
     ContainerBase,
     Container,
+    PackedContainer,
+    DataLoader,
+    SharedMemoryTransport,
     add_ivy_container_instance_methods,
 )
 from .backend_handler import (
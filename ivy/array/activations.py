@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Optional, Union
 
 # local
@@ -9,7 +8,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithActivations(abc.ABC):
+class ArrayWithActivations:
+    __slots__ = ()
+
     def relu(self: ivy.Array, /, *, out: Optional[ivy.Array] = None) -> ivy.Array:
         """
         ivy.Array instance method variant of ivy.relu. This method simply wraps the
@@ -62,50 +62,43 @@ class Array(
     ArrayWithStatistical,
     ArrayWithUtility,
 ):
+    # the metadata derived from the native array is computed on first access and then
+    # cached, so that creating an array only stores the native array and the backend
+    # it was created under, which the metadata is then computed with
+    __slots__ = (
+        "_data",
+        "_dtype",
+        "_device",
+        "_size",
+        "_is_variable",
+        "_backend",
+        "_framework",
+    )
+
     def __init__(self, data):
-        ArrayWithActivations.__init__(self)
-        ArrayWithCreation.__init__(self)
-        ArrayWithDataTypes.__init__(self)
-        ArrayWithDevice.__init__(self)
-        ArrayWithElementwise.__init__(self)
-        ArrayWithGeneral.__init__(self)
-        ArrayWithGradients.__init__(self)
-        ArrayWithImage.__init__(self)
-        ArrayWithLayers.__init__(self)
-        ArrayWithLinearAlgebra.__init__(self)
-        ArrayWithLosses.__init__(self)
-        ArrayWithManipulation.__init__(self)
-        ArrayWithNorms.__init__(self)
-        ArrayWithRandom.__init__(self)
-        ArrayWithSearching.__init__(self)
-        ArrayWithSet.__init__(self)
-        ArrayWithSorting.__init__(self)
-        ArrayWithStatistical.__init__(self)
-        ArrayWithUtility.__init__(self)
         self._init(data)
 
     def _init(self, data):
-        if ivy.is_ivy_array(data):
-            self._data = data.data
-        else:
+        if isinstance(data, Array):
+            data = data.data
+        elif not isinstance(data, ivy.NativeArray):
             ivy.assertions.check_true(
                 ivy.is_native_array(data), "data must be native array"
             )
-            self._data = data
-        self._shape = self._data.shape
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy."
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
-        self.backend = ivy.current_backend_str()
-        self._is_variable = ivy.is_variable(self._data)
+        self._data = data
+        self._dtype = None
+        self._device = None
+        self._size = None
+        self._is_variable = None
+        self._backend = None
+        self._framework = ivy.backend_stack[-1] if ivy.backend_stack else None
+
+    def _native_backend(self):
+        # the backend set when the array was created, otherwise the one inferred from
+        # the native array itself
+        if self._framework is None:
+            self._framework = ivy.current_backend(self._data)
+        return self._framework
 
     # Properties #
     # ---------- #
@@ -118,13 +111,24 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements"""
+        if self._dtype is None:
+            self._dtype = self._native_backend().dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = self._native_backend().dev(self._data)
         return self._device
 
+    @property
+    def backend(self) -> str:
+        """The backend of the native array being wrapped in self."""
+        if self._backend is None:
+            self._backend = self._native_backend().current_backend_str()
+        return self._backend
+
     @property
     def mT(self) -> ivy.Array:
         """
@@ -144,16 +148,19 @@ class Array(
     @property
     def ndim(self) -> int:
         """Number of array dimensions (axes)."""
-        return len(tuple(self._shape))
+        return len(tuple(self._data.shape))
 
     @property
     def shape(self) -> ivy.Shape:
         """Array dimensions."""
-        return ivy.Shape(self._shape)
+        return ivy.Shape(self._data.shape)
 
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            shape = self._data.shape
+            self._size = functools.reduce(mul, shape) if len(shape) > 0 else 0
         return self._size
 
     @property
@@ -173,6 +180,8 @@ class Array(
     @property
     def is_variable(self) -> bool:
         """Determine whether the array is a trainable variable or not."""
+        if self._is_variable is None:
+            self._is_variable = self._native_backend().is_variable(self._data)
         return self._is_variable
 
     # Setters #
@@ -223,14 +232,16 @@ class Array(
         dec_vals = ivy.array_decimal_values()
         rep = (
             ivy.vec_sig_fig(ivy.to_numpy(self._data), sig_fig)
-            if self._size > 0
+            if self.size > 0
             else ivy.to_numpy(self._data)
         )
+        dev_str = ivy.as_ivy_dev(self.device)
+        post_repr = ", dev={})".format(dev_str) if "gpu" in dev_str else ")"
         with np.printoptions(precision=dec_vals):
             return (
-                self._pre_repr
+                "ivy."
                 + rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
-                + self._post_repr.format(ivy.current_backend_str())
+                + post_repr
             )
 
     @_native_wrapper
@@ -255,7 +266,7 @@ class Array(
             self._data.__setitem__(query, val)
         except (AttributeError, TypeError):
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     @_native_wrapper
     def __contains__(self, key):
@@ -282,10 +293,13 @@ class Array(
         # get the required backend
         ivy.set_backend(state["backend"])
         ivy_array = ivy.array(state["data"])
+        self._init(ivy_array.data)
+        # compute the metadata while the backend of the array is set
+        self._backend = state["backend"]
+        self._dtype = ivy.dtype(self._data)
+        self._device = ivy.dev(self._data)
         ivy.unset_backend()
 
-        self.__dict__ = ivy_array.__dict__
-
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
         # backend.to_device(self, device)
@@ -1,5 +1,4 @@
 # global
-import abc
 from numbers import Number
 from typing import Optional, Union, List
 
@@ -11,7 +10,9 @@ import ivy
 # -------------------#
 
 
-class ArrayWithCreation(abc.ABC):
+class ArrayWithCreation:
+    __slots__ = ()
+
     def asarray(
         self: ivy.Array,
         /,
@@ -1,12 +1,13 @@
 # global
-import abc
 from typing import Tuple, Optional, List, Union
 
 # local
 import ivy
 
 
-class ArrayWithDataTypes(abc.ABC):
+class ArrayWithDataTypes:
+    __slots__ = ()
+
     def astype(
         self: ivy.Array,
         dtype: ivy.Dtype,
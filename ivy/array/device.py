@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Union, Optional, Any
 
 import ivy
@@ -8,7 +7,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithDevice(abc.ABC):
+class ArrayWithDevice:
+    __slots__ = ()
+
     def dev(
         self: ivy.Array, *, as_native: bool = False
     ) -> Union[ivy.Device, ivy.NativeDevice]:
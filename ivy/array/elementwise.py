@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Optional, Union
 
 # local
@@ -7,7 +6,9 @@ import ivy
 
 
 # noinspection PyUnresolvedReferences
-class ArrayWithElementwise(abc.ABC):
+class ArrayWithElementwise:
+    __slots__ = ()
+
     def abs(self: ivy.Array, *, out: Optional[ivy.Array] = None) -> ivy.Array:
         """
         ivy.Array instance method variant of ivy.abs. This method simply wraps the
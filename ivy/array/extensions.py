@@ -1,12 +1,13 @@
 # global
-import abc
 from typing import Optional
 
 # local
 import ivy
 
 
-class ArrayWithExtensions(abc.ABC):
+class ArrayWithExtensions:
+    __slots__ = ()
+
     def sinc(self: ivy.Array, *, out: Optional[ivy.Array] = None) -> ivy.Array:
         """
         ivy.Array instance method variant of ivy.sinc. This method simply wraps the
@@ -1,5 +1,4 @@
 # global
-import abc
 import numpy as np
 from numbers import Number
 from typing import Any, Iterable, Union, Optional, Dict, Callable, List, Tuple
@@ -10,7 +9,9 @@ from typing import Any, Iterable, Union, Optional, Dict, Callable, List, Tuple
 import ivy
 
 
-class ArrayWithGeneral(abc.ABC):
+class ArrayWithGeneral:
+    __slots__ = ()
+
     def is_native_array(
         self: ivy.Array,
         /,
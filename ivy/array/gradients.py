@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Union, Optional
 
 # local
@@ -8,7 +7,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithGradients(abc.ABC):
+class ArrayWithGradients:
+    __slots__ = ()
+
     def variable(self: ivy.Array) -> ivy.Array:
         """
         ivy.Array instance method variant of ivy.variable. This method simply wraps
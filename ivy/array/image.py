@@ -1,8 +1,7 @@
 # global
-import abc
 
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithImage(abc.ABC):
-    pass
+class ArrayWithImage:
+    __slots__ = ()
@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Optional, Tuple, Union, List, Callable
 
 # local
@@ -8,7 +7,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithLayers(abc.ABC):
+class ArrayWithLayers:
+    __slots__ = ()
+
     def linear(
         self: ivy.Array,
         weight: Union[ivy.Array, ivy.NativeArray],
@@ -31,6 +32,7 @@ class ArrayWithLayers(abc.ABC):
         *,
         scale: bool = True,
         dtype: ivy.Dtype = None,
+        rng: Optional["ivy.RNGStream"] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         return ivy.dropout(
@@ -38,6 +40,7 @@ class ArrayWithLayers(abc.ABC):
             prob,
             scale=scale,
             dtype=dtype,
+            rng=rng,
             out=out,
         )
 
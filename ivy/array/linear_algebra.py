@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Union, Optional, Literal, NamedTuple, Tuple, List, Sequence
 
 # local
@@ -8,7 +7,9 @@ import ivy
 inf = float("inf")
 
 
-class ArrayWithLinearAlgebra(abc.ABC):
+class ArrayWithLinearAlgebra:
+    __slots__ = ()
+
     def matmul(
         self: ivy.Array,
         x2: Union[ivy.Array, ivy.NativeArray],
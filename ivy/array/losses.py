@@ -1,12 +1,13 @@
 # global
-import abc
 from typing import Optional, Union
 
 # local
 import ivy
 
 
-class ArrayWithLosses(abc.ABC):
+class ArrayWithLosses:
+    __slots__ = ()
+
     def cross_entropy(
         self: ivy.Array,
         pred: Union[ivy.Array, ivy.NativeArray],
@@ -1,6 +1,5 @@
 # For Review
 # global
-import abc
 from typing import Optional, Union, Tuple, List, Iterable, Sequence
 from numbers import Number
 
@@ -10,7 +9,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithManipulation(abc.ABC):
+class ArrayWithManipulation:
+    __slots__ = ()
+
     def concat(
         self: ivy.Array,
         xs: Union[
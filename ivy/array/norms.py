@@ -1,6 +1,5 @@
 # global
 from typing import Optional, List
-import abc
 
 # local
 import ivy
@@ -8,7 +7,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithNorms(abc.ABC):
+class ArrayWithNorms:
+    __slots__ = ()
+
     def layer_norm(
         self: ivy.Array,
         normalized_idxs: List[int],
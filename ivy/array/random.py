@@ -1,12 +1,13 @@
 # global
-import abc
 from typing import Optional, Union
 
 # local
 import ivy
 
 
-class ArrayWithRandom(abc.ABC):
+class ArrayWithRandom:
+    __slots__ = ()
+
     def random_uniform(
         self: ivy.Array,
         /,
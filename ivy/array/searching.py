@@ -1,5 +1,4 @@
 # global
-import abc
 from numbers import Number
 from typing import Optional, Union, Tuple
 
@@ -7,7 +6,9 @@ from typing import Optional, Union, Tuple
 import ivy
 
 
-class ArrayWithSearching(abc.ABC):
+class ArrayWithSearching:
+    __slots__ = ()
+
     def argmax(
         self: ivy.Array,
         /,
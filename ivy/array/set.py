@@ -1,12 +1,13 @@
 # global
-import abc
 from typing import Optional, NamedTuple
 
 
 import ivy
 
 
-class ArrayWithSet(abc.ABC):
+class ArrayWithSet:
+    __slots__ = ()
+
     def unique_counts(self: ivy.Array) -> NamedTuple:
         """
         ivy.Array instance method variant of ivy.unique_counts. This method simply
@@ -1,5 +1,4 @@
 # global
-import abc
 from typing import Optional, Union
 
 # local
@@ -7,7 +6,9 @@ from typing import Optional, Union
 import ivy
 
 
-class ArrayWithSorting(abc.ABC):
+class ArrayWithSorting:
+    __slots__ = ()
+
     def argsort(
         self: ivy.Array,
         /,
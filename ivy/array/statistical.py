@@ -1,6 +1,5 @@
 # global
 from typing import Optional, Union, Sequence
-import abc
 
 # local
 import ivy
@@ -8,7 +7,9 @@ import ivy
 # ToDo: implement all methods here as public instance methods
 
 
-class ArrayWithStatistical(abc.ABC):
+class ArrayWithStatistical:
+    __slots__ = ()
+
     def min(
         self: ivy.Array,
         /,
@@ -1,12 +1,13 @@
 # global
 from typing import Optional, Union, Sequence
-import abc
 
 # local
 import ivy
 
 
-class ArrayWithUtility(abc.ABC):
+class ArrayWithUtility:
+    __slots__ = ()
+
     def all(
         self: ivy.Array,
         /,
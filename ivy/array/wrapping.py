@@ -8,6 +8,17 @@ from types import ModuleType
 TO_IGNORE = ["shape"]
 
 
+def _array_position(function_name: str):
+    """Return the position and name of the argument the array is passed as, and
+    whether it is the first entry of a sequence argument, such as the arrays passed to
+    `ivy.concat` or `ivy.stack`."""
+    array_spec = getattr(ivy.__dict__[function_name], "array_spec", None)
+    if not array_spec:
+        return 0, None, False
+    (position, name), *nested_idxs = array_spec[0]
+    return position, name, int in nested_idxs
+
+
 def _wrap_function(function_name: str) -> Callable:
     """Wraps the function called `function_name`.
 
@@ -31,28 +42,44 @@ def _wrap_function(function_name: str) -> Callable:
     ivy.array([1])
 
     """
-
-    def new_function(self, *args, **kwargs):
-        """Add the data of the current array from which the instance function is invoked
-        as the first arg parameter or kwarg parameter. Return the new function with
-        the name function_name and the new args variable or kwargs as the new inputs.
-        """
-        function = ivy.__dict__[function_name]
-        # gives us the position and name of the array argument
-        data_idx = function.array_spec[0]
-        if len(args) >= data_idx[0][0]:
-            args = ivy.copy_nest(args, to_mutable=True)
-            data_idx = [data_idx[0][0]] + [
-                0 if idx is int else idx for idx in data_idx[1:]
-            ]
-            ivy.insert_into_nest_at_index(args, data_idx, self._data)
-        else:
-            kwargs = ivy.copy_nest(kwargs, to_mutable=True)
-            data_idx = [data_idx[0][1]] + [
-                0 if idx is int else idx for idx in data_idx[1:]
-            ]
-            ivy.insert_into_nest_at_index(kwargs, data_idx, self._data)
-        return function(*args, **kwargs)
+    # the position of the array argument is fixed by the signature, so it is found
+    # once here rather than on every call
+    position, name, in_sequence = _array_position(function_name)
+
+    if in_sequence:
+
+        def new_function(self, *args, **kwargs):
+            """Add the data of the current array from which the instance function is
+            invoked as the first entry of the sequence argument. Return the new function
+            with the name function_name and the new args variable or kwargs as the new
+            inputs.
+            """
+            if len(args) > position:
+                args = (
+                    args[:position]
+                    + ([self._data, *args[position]],)
+                    + args[position + 1 :]
+                )
+            elif name in kwargs:
+                kwargs[name] = [self._data, *kwargs[name]]
+            else:
+                args = args + ([self._data],)
+            return ivy.__dict__[function_name](*args, **kwargs)
+
+    else:
+
+        def new_function(self, *args, **kwargs):
+            """Add the data of the current array from which the instance function is
+            invoked as the first arg parameter or kwarg parameter. Return the new
+            function with the name function_name and the new args variable or kwargs as
+            the new inputs.
+            """
+            if len(args) >= position:
+                return ivy.__dict__[function_name](
+                    *args[:position], self._data, *args[position:], **kwargs
+                )
+            kwargs[name] = self._data
+            return ivy.__dict__[function_name](*args, **kwargs)
 
     return new_function
 
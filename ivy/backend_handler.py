@@ -15,6 +15,10 @@ implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
 
+# wrapped ivy namespaces, keyed by (backend, backend version), which are built once
+# and then swapped into the ivy namespace whenever the backend is switched
+_dispatch_tables = dict()
+
 
 class ContextManager:
     def __init__(self, module):
@@ -222,6 +226,61 @@ def current_backend(*args, **kwargs):
     return importlib.import_module(_backend_dict[implicit_backend])
 
 
+def _refresh_ivy_original_dict():
+    """Re-capture the ivy namespace if it has been modified since it was last
+    captured, in which case the cached dispatch tables are discarded, as they were
+    built from the outdated namespace."""
+    global ivy_original_dict
+    if len(ivy.__dict__) == len(ivy_original_dict) and all(
+        k in ivy_original_dict and ivy_original_dict[k] is v
+        for k, v in ivy.__dict__.items()
+    ):
+        return
+    ivy_original_dict = ivy.__dict__.copy()
+    _dispatch_tables.clear()
+
+
+def _get_dispatch_table(backend):
+    """Return the wrapped ivy namespace for `backend`, building it on the first
+    request for the (backend, backend version) pair.
+
+    Parameters
+    ----------
+    backend
+        the backend module for which the dispatch table is returned.
+
+    Returns
+    -------
+    ret
+        tuple containing a dict from names in the ivy namespace to their wrapped
+        backend implementations, and the names which must be removed from the ivy
+        namespace as they are invalid data types for the backend.
+
+    """
+    key = (backend.current_backend_str(), str(backend.backend_version))
+    if key in _dispatch_tables:
+        return _dispatch_tables[key]
+    set_backend_to_specific_version(backend)
+    table = dict()
+    to_remove = list()
+    for k, v in ivy_original_dict.items():
+        if k not in backend.__dict__:
+            if k in backend.invalid_dtypes:
+                to_remove.append(k)
+                continue
+            backend.__dict__[k] = v
+        table[k] = _wrap_function(key=k, to_wrap=backend.__dict__[k], original=v)
+    _dispatch_tables[key] = (table, tuple(to_remove))
+    return _dispatch_tables[key]
+
+
+def _apply_dispatch_table(dispatch_table):
+    table, to_remove = dispatch_table
+    ivy.__dict__.update(table)
+    for k in to_remove:
+        ivy.__dict__.pop(k, None)
+
+
 def set_backend(backend: str):
     """Sets `backend` to be the global backend.
 
@@ -248,9 +307,8 @@ def set_backend(backend: str):
         "backend must be one from {}".format(list(_backend_dict.keys())),
     )
     ivy.locks["backend_setter"].acquire()
-    global ivy_original_dict
     if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+        _refresh_ivy_original_dict()
     if isinstance(backend, str):
         temp_stack = list()
         while backend_stack:
@@ -261,14 +319,7 @@ def set_backend(backend: str):
     if backend.current_backend_str() == "numpy":
         ivy.set_default_device("cpu")
     backend_stack.append(backend)
-    set_backend_to_specific_version(backend)
-    for k, v in ivy_original_dict.items():
-        if k not in backend.__dict__:
-            if k in backend.invalid_dtypes and k in ivy.__dict__:
-                del ivy.__dict__[k]
-                continue
-            backend.__dict__[k] = v
-        ivy.__dict__[k] = _wrap_function(key=k, to_wrap=backend.__dict__[k], original=v)
+    _apply_dispatch_table(_get_dispatch_table(backend))
 
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
@@ -310,9 +361,8 @@ def get_backend(backend: Optional[str] = None):
     # ToDo: change this so that it doesn't depend at all on the global ivy. Currently
     #  all backend-agnostic implementations returned in this module will still
     #  use the global ivy backend.
-    global ivy_original_dict
     if not backend_stack:
-        ivy_original_dict = ivy.__dict__.copy()
+        _refresh_ivy_original_dict()
     # current global backend is retrieved if backend isn't specified,
     # otherwise `backend` argument will be used
     if backend is None:
@@ -367,16 +417,10 @@ def unset_backend():
             ivy.unset_default_device()
         # the new backend is the backend that was set before the one we just removed
         # from the stack, or Ivy if there was no previously set backend
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        if backend_stack:
+            _apply_dispatch_table(_get_dispatch_table(backend_stack[-1]))
+        else:
+            ivy.__dict__.update(ivy_original_dict)
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
@@ -12,5 +12,14 @@ except ModuleNotFoundError:
 # local
 from .wrapping import add_ivy_container_instance_methods  # noqa
 from .container import ContainerBase, Container  # noqa
+from .packed import PackedContainer  # noqa
+from .transport import (  # noqa
+    SharedMemoryHandle,
+    SharedMemoryTransport,
+    from_shared_memory,
+    release_shared_memory,
+    to_shared_memory,
+)
+from .loader import DataLoader  # noqa
 
 colorama.init(strip=False)
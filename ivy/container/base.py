@@ -4,6 +4,9 @@
 import inspect
 from itertools import chain
 import re
+import bisect
+import fnmatch
+import weakref
 import abc
 import copy
 import termcolor
@@ -17,7 +20,9 @@ try:
 except ModuleNotFoundError:
     h5py = None
 import pickle
+import queue
 import random
+import threading
 from operator import mul
 from functools import reduce
 from typing import Union, Tuple
@@ -45,8 +50,144 @@ def _repr(x):
         return str(x)
 
 
+def _read_h5_dataset(dataset, slice_obj):
+    """Read the rows of an hdf5 dataset selected by slice_obj directly into a
+    preallocated numpy array."""
+    if not isinstance(slice_obj, slice) or not dataset.shape or dataset.dtype.hasobject:
+        return dataset[slice_obj]
+    num_rows = len(range(*slice_obj.indices(dataset.shape[0])))
+    ret = np.empty((num_rows,) + dataset.shape[1:], dtype=dataset.dtype)
+    if ret.size:
+        dataset.read_direct(ret, source_sel=slice_obj)
+    return ret
+
+
+# the first bytes of the files written by to_disk_as_mmap
+_mmap_magic = b"IVYMMAP1"
+
+
+def _mmap_data_offset(header_size, alignment):
+    """The offset of the array bytes in a file written by to_disk_as_mmap."""
+    return -(-(len(_mmap_magic) + 8 + header_size) // alignment) * alignment
+
+
+class _LazyH5File:
+    """An hdf5 file opened for lazy leaves, which is closed once each of them is
+    either loaded or discarded."""
+
+    def __init__(self, h5_obj):
+        weakref.finalize(self, h5_obj.close)
+
+
+class _LazyH5Leaf:
+    """A slice of an hdf5 dataset, which is only read into an array when the leaf
+    holding it is first accessed."""
+
+    __slots__ = ("dataset", "slice_obj", "ivyh", "h5_file")
+
+    def __init__(self, dataset, slice_obj, ivyh):
+        self.dataset = dataset
+        self.slice_obj = slice_obj
+        self.ivyh = ivyh
+        # the file opened for the leaves, if they hold the only references to it
+        self.h5_file = None
+
+    def load(self):
+        return ivy.default(self.ivyh, ivy).array(
+            _read_h5_dataset(self.dataset, self.slice_obj)
+        )
+
+
+def _hold_h5_file(cont, h5_file):
+    """Make each lazy leaf of `cont` hold `h5_file`."""
+    for value in dict.values(cont):
+        if isinstance(value, _LazyH5Leaf):
+            value.h5_file = h5_file
+        elif isinstance(value, dict):
+            _hold_h5_file(value, h5_file)
+
+
+def _prefetched(iterable, num_prefetch):
+    """Iterate over iterable, producing up to num_prefetch items ahead on a
+    background thread."""
+    items = queue.Queue(maxsize=num_prefetch)
+    stop = threading.Event()
+    done = object()
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put((item, None)):
+                    return
+        except Exception as e:
+            _put((done, e))
+            return
+        _put((done, None))
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, exception = items.get()
+            if item is done:
+                if exception is not None:
+                    raise exception
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+# the call plans of multi_map_in_static_method, keyed by the function and the
+# structure of its arguments
+_call_plans = dict()
+
+
+def _arg_kind(x):
+    if isinstance(x, ivy.Container):
+        return "container"
+    if isinstance(x, (list, tuple, dict)):
+        return "nest"
+    return None
+
+
+def _call_plan(fn, args, kwargs):
+    """Return whether `fn` accepts an out argument, and the positions of the
+    containers in `args` and the keys of the containers in `kwargs`. The positions
+    and keys are None when a container may be nested inside an argument."""
+    arg_kinds = tuple(_arg_kind(a) for a in args)
+    kwarg_kinds = tuple((k, _arg_kind(v)) for k, v in kwargs.items())
+    plan_key = (fn, arg_kinds, kwarg_kinds)
+    if plan_key in _call_plans:
+        return _call_plans[plan_key]
+    has_out = inspect.signature(fn).parameters.get("out") is not None
+    if "nest" in arg_kinds or any(kind == "nest" for _, kind in kwarg_kinds):
+        plan = (has_out, None, None)
+    else:
+        plan = (
+            has_out,
+            tuple(i for i, kind in enumerate(arg_kinds) if kind == "container"),
+            tuple(k for k, kind in kwarg_kinds if kind == "container"),
+        )
+    _call_plans[plan_key] = plan
+    return plan
+
+
 # noinspection PyMissingConstructor
 class ContainerBase(dict, abc.ABC):
+    # whether some leaves are hdf5 datasets which are yet to be read
+    _lazy_leaves = False
+
     def __init__(
         self,
         dict_in=None,
@@ -167,21 +308,26 @@ class ContainerBase(dict, abc.ABC):
         out=None,
         **kwargs,
     ) -> Union[Tuple[ivy.Container, ivy.Container], ivy.Container]:
-        arg_cont_idxs = ivy.nested_argwhere(
-            args, ivy.is_ivy_container, to_ignore=ivy.Container
-        )
-        kwarg_cont_idxs = ivy.nested_argwhere(
-            kwargs, ivy.is_ivy_container, to_ignore=ivy.Container
+        has_out, arg_slots, kwarg_slots = _call_plan(
+            ivy.__dict__[fn_name], args, kwargs
         )
-        # retrieve all the containers in args and kwargs
-        arg_conts = ivy.multi_index_nest(args, arg_cont_idxs)
+        if ivy.exists(arg_slots):
+            # the containers are all top-level arguments
+            arg_conts = [args[i] for i in arg_slots]
+            kwarg_conts = [kwargs[k] for k in kwarg_slots]
+        else:
+            arg_cont_idxs = ivy.nested_argwhere(
+                args, ivy.is_ivy_container, to_ignore=ivy.Container
+            )
+            kwarg_cont_idxs = ivy.nested_argwhere(
+                kwargs, ivy.is_ivy_container, to_ignore=ivy.Container
+            )
+            # retrieve all the containers in args and kwargs
+            arg_conts = ivy.multi_index_nest(args, arg_cont_idxs)
+            kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
         num_arg_conts = len(arg_conts)
-        kwarg_conts = ivy.multi_index_nest(kwargs, kwarg_cont_idxs)
         # Combine the retrieved containers from args and kwargs into a single list
-        with_out = (
-            inspect.signature(ivy.__dict__[fn_name]).parameters.get("out") is not None
-            and out is not None
-        )
+        with_out = has_out and out is not None
         if with_out:
             conts = arg_conts + kwarg_conts + [out]
         else:
@@ -192,21 +338,36 @@ class ContainerBase(dict, abc.ABC):
         # their backends irrespective of global ivy's backend
         fn = cont0.ivy.__dict__[fn_name]
 
-        def map_fn(vals, _):
-            if with_out:
-                out = vals[-1]
-                del vals[-1]
-            arg_vals = vals[:num_arg_conts]
-            a = ivy.copy_nest(args, to_mutable=True)
-            ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
-            kwarg_vals = vals[num_arg_conts:]
-            kw = ivy.copy_nest(kwargs, to_mutable=True)
-            ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
-            if with_out:
-                return fn(*a, out=out, **kw)
-            else:
+        if ivy.exists(arg_slots):
+
+            def map_fn(vals, _):
+                a = list(args)
+                for i, val in zip(arg_slots, vals):
+                    a[i] = val
+                kw = dict(kwargs)
+                for k, val in zip(kwarg_slots, vals[num_arg_conts:]):
+                    kw[k] = val
+                if with_out:
+                    return fn(*a, out=vals[-1], **kw)
                 return fn(*a, **kw)
 
+        else:
+
+            def map_fn(vals, _):
+                if with_out:
+                    out = vals[-1]
+                    del vals[-1]
+                arg_vals = vals[:num_arg_conts]
+                a = ivy.copy_nest(args, to_mutable=True)
+                ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
+                kwarg_vals = vals[num_arg_conts:]
+                kw = ivy.copy_nest(kwargs, to_mutable=True)
+                ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
+                if with_out:
+                    return fn(*a, out=out, **kw)
+                else:
+                    return fn(*a, **kw)
+
         # Replace each container in arg and kwarg with the arrays at the leaf
         # levels of that container using map_fn and call fn using those arrays
         # as inputs
@@ -1029,11 +1190,17 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
     ):
         """Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
 
+        Each dataset is read directly into a preallocated array, with a single read.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -1046,6 +1213,13 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is None, which
             results in the global ivy.
+        lazy
+            Whether to only read each dataset when its leaf is first accessed, keeping
+            the file open until then. Iterating over the items or values of a
+            sub-container reads all of its datasets, but copying it with ``dict``
+            keeps the placeholders of the datasets not yet read. A file opened from a
+            filepath is closed once each leaf is either read or discarded. Default is
+            False.
 
         Returns
         -------
@@ -1066,17 +1240,103 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys=alphabetical_keys,
+                    ivyh=ivyh,
+                    lazy=lazy,
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj])
-                )
+                if lazy:
+                    container_dict[key] = _LazyH5Leaf(value, slice_obj, ivyh)
+                else:
+                    container_dict[key] = ivy.default(ivyh, ivy).array(
+                        _read_h5_dataset(value, slice_obj)
+                    )
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
-        return ivy.Container(container_dict, ivyh=ivyh)
+        ret = ivy.Container(container_dict, ivyh=ivyh)
+        if lazy:
+            ret._lazy_leaves = any(
+                isinstance(value, _LazyH5Leaf) for value in container_dict.values()
+            )
+            if type(h5_obj_or_filepath) is str:
+                _hold_h5_file(ret, _LazyH5File(h5_obj))
+        elif type(h5_obj_or_filepath) is str:
+            h5_obj.close()
+        return ret
+
+    @staticmethod
+    def from_disk_as_hdf5_in_batches(
+        h5_obj_or_filepath, batch_size, alphabetical_keys=True, ivyh=None, prefetch=0
+    ):
+        """Load container objects from disk, as an h5py file, each holding the next
+        batch of rows of all the datasets in the file.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath where the container object is saved to disk, or h5 object.
+        batch_size
+            The number of rows of each dataset in each container. The last container
+            holds the remaining rows.
+        alphabetical_keys
+            Whether to sort the container keys alphabetically, or preserve the dict
+            order. Default is True.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is None, which
+            results in the global ivy.
+        prefetch
+            The number of batches to read ahead on a background thread, while the
+            current one is being used. Default is 0, reading each batch when it is
+            requested.
+
+        Returns
+        -------
+            Generator of the containers loaded from disk
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.arange(5), b={"c": ivy.arange(5) * 2})
+        >>> x.to_disk_as_hdf5("batches.hdf5")
+        >>> for batch in ivy.Container.from_disk_as_hdf5_in_batches(
+        ...     "batches.hdf5", 2
+        ... ):
+        ...     print(batch.b.c)
+        ivy.array([0, 2])
+        ivy.array([4, 6])
+        ivy.array([8])
+
+        """
+        ivy.assertions.check_exists(
+            h5py,
+            message="You must install python package h5py in order to load hdf5 \
+            files from disk into a container.",
+        )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj = h5py.File(h5_obj_or_filepath, "r")
+        else:
+            h5_obj = h5_obj_or_filepath
+        num_rows = ivy.Container.h5_file_size(h5_obj)[1]
+        batches = (
+            ivy.Container.from_disk_as_hdf5(
+                h5_obj,
+                slice(i, i + batch_size),
+                alphabetical_keys=alphabetical_keys,
+                ivyh=ivyh,
+            )
+            for i in range(0, num_rows, batch_size)
+        )
+        try:
+            if prefetch > 0:
+                yield from _prefetched(batches, prefetch)
+            else:
+                yield from batches
+        finally:
+            if type(h5_obj_or_filepath) is str:
+                h5_obj.close()
 
     @staticmethod
     def from_disk_as_pickled(pickle_filepath, ivyh=None):
@@ -1101,6 +1361,67 @@ class ContainerBase(dict, abc.ABC):
             ivyh=ivyh,
         ).to_ivy()
 
+    @staticmethod
+    def from_disk_as_mmap(mmap_filepath, mode="c", ivyh=None):
+        """Load container object from disk at the specified filepath, as a file
+        written by :meth:`to_disk_as_mmap`.
+
+        The arrays are views into a single memory map of the file, so no array bytes
+        are read when loading, and processes loading the same file share its pages in
+        the page cache. The views are passed to the backend without a copy wherever
+        the backend can wrap numpy memory, as numpy and torch do on the cpu.
+
+        Parameters
+        ----------
+        mmap_filepath
+            Filepath where the container object is saved to disk.
+        mode
+            The mode of the memory map, either 'r' for read-only arrays, or 'c' for
+            copy-on-write arrays, whose written pages are private to this process.
+            Writable modes which change the file itself are not allowed. Default is
+            'c'.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is None, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+
+        """
+        ivy.assertions.check_elem_in_list(mode, ["r", "c"])
+        with open(mmap_filepath, "rb") as mmap_file:
+            if mmap_file.read(len(_mmap_magic)) != _mmap_magic:
+                raise ivy.exceptions.IvyException(
+                    "{} was not written by ivy.Container.to_disk_as_mmap".format(
+                        mmap_filepath
+                    )
+                )
+            header_size = int.from_bytes(mmap_file.read(8), "little")
+            header = json.loads(mmap_file.read(header_size))
+        data_offset = _mmap_data_offset(header_size, header["alignment"])
+        local_ivy = ivy.default(ivyh, ivy)
+        buffer = None
+        container_dict = dict()
+        for leaf in header["leaves"]:
+            if "value" in leaf:
+                value = leaf["value"]
+            else:
+                if buffer is None:
+                    buffer = np.memmap(mmap_filepath, dtype=np.uint8, mode=mode)
+                start = data_offset + leaf["offset"]
+                value = local_ivy.asarray(
+                    buffer[start : start + leaf["nbytes"]]
+                    .view(leaf["dtype"])
+                    .reshape(leaf["shape"])
+                )
+            keys = leaf["key_chain"].split("/")
+            sub_dict = container_dict
+            for key in keys[:-1]:
+                sub_dict = sub_dict.setdefault(key, dict())
+            sub_dict[keys[-1]] = value
+        return ivy.Container(container_dict, ivyh=ivyh)
+
     @staticmethod
     def from_disk_as_json(json_filepath, ivyh=None):
         """Load container object from disk at the specified json filepath. If some
@@ -1192,8 +1513,11 @@ class ContainerBase(dict, abc.ABC):
                 ivy.Container.shuffle_h5_file(value, seed_value)
             elif isinstance(value, h5py.Dataset):
                 random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
+                # shuffle the row indices as random.shuffle would shuffle the rows, and
+                # permute the rows with one read and one write
+                permutation = list(range(value.shape[0]))
+                random.shuffle(permutation)
+                value[...] = value[()][permutation]
             else:
                 raise ivy.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
@@ -1422,6 +1746,48 @@ class ContainerBase(dict, abc.ABC):
             return sub_devs[0]
         return None
 
+    def _key_chain_index(self):
+        """Return the key chain index of the container, building it if it was
+        invalidated, or None if the index is not enabled."""
+        if not self.__dict__.get("_kc_index_enabled"):
+            return None
+        if self._kc_index is not None:
+            return self._kc_index
+        values = dict()
+        leaf_key_chains = list()
+
+        def _add(cont, key_chain):
+            # register this container with each sub-container, so that mutating any
+            # of them invalidates the index
+            owners = cont.__dict__.get("_kc_index_owners")
+            if owners is None:
+                owners = cont._kc_index_owners = dict()
+            owners[id(self)] = self_ref
+            for key, value in cont.items():
+                kc = key_chain + "/" + key if key_chain != "" else key
+                values[kc] = value
+                if isinstance(value, ivy.Container):
+                    _add(value, kc)
+                else:
+                    leaf_key_chains.append(kc)
+
+        self_ref = weakref.ref(self)
+        _add(self, "")
+        positions = {kc: i for i, kc in enumerate(leaf_key_chains)}
+        self._kc_index = (values, leaf_key_chains, sorted(leaf_key_chains), positions)
+        return self._kc_index
+
+    def _invalidate_key_chain_indices(self, keep=None):
+        """Invalidate the key chain indices of the containers holding this one,
+        except for the index of `keep`."""
+        owners = self.__dict__.get("_kc_index_owners")
+        if not owners or (len(owners) == 1 and id(keep) in owners):
+            return
+        for key in [key for key in owners if key != id(keep)]:
+            owner = owners.pop(key)()
+            if owner is not None:
+                owner._kc_index = None
+
     def _at_key_chains_input_as_seq(self, key_chains, ignore_key_errors=False):
         return_cont = ivy.Container(dict(), **self._config)
         for kc in key_chains:
@@ -1454,10 +1820,32 @@ class ContainerBase(dict, abc.ABC):
         return ivy.Container(return_dict, **self._config)
 
     def _prune_key_chains_input_as_seq(self, key_chains):
-        return_cont = self.copy()
-        for kc in key_chains:
-            return_cont = return_cont.prune_key_chain(kc)
-        return return_cont
+        if not key_chains:
+            return self.copy()
+        return self._prune_key_tuples(
+            set(tuple(re.split("[/.]", kc)) for kc in key_chains)
+        )
+
+    def _prune_key_tuples(self, key_tuples):
+        # prunes all the key chains in one pass, equivalent to calling
+        # prune_key_chain once for each of them
+        out_dict = dict()
+        for key, value in self.items():
+            if (key,) in key_tuples:
+                continue
+            if isinstance(value, ivy.Container):
+                sub_key_tuples = set(
+                    kt[1:] for kt in key_tuples if len(kt) > 1 and kt[0] == key
+                )
+                if sub_key_tuples:
+                    new_val = value._prune_key_tuples(sub_key_tuples)
+                else:
+                    new_val = value.to_dict()
+                if len(new_val) > 0:
+                    out_dict[key] = new_val
+            else:
+                out_dict[key] = value
+        return ivy.Container(out_dict, **self._config)
 
     def _prune_key_chains_input_as_dict(self, key_chains, return_cont=None):
         if return_cont is None:
@@ -1917,9 +2305,14 @@ class ContainerBase(dict, abc.ABC):
                     )
                 space_left = max_batch_size - starting_index
                 amount_to_write = min(this_batch_size, space_left)
-                h5_obj[key][
-                    starting_index : starting_index + amount_to_write
-                ] = value_as_np[0:amount_to_write]
+                end_index = starting_index + amount_to_write
+                if amount_to_write > 0:
+                    h5_obj[key].write_direct(
+                        np.ascontiguousarray(value_as_np[0:amount_to_write]),
+                        dest_sel=np.s_[starting_index:end_index],
+                    )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj.close()
 
     def to_disk_as_pickled(self, pickle_filepath):
         """Save container object to disk, as an pickled file, at the specified filepath.
@@ -1932,6 +2325,62 @@ class ContainerBase(dict, abc.ABC):
         """
         pickle.dump(self.to_native().to_dict(), open(pickle_filepath, "wb"))
 
+    def to_disk_as_mmap(self, mmap_filepath, alignment=64):
+        """Save container object to disk at the specified filepath, in a format which
+        :meth:`from_disk_as_mmap` loads without copying the arrays.
+
+        The file holds a json header with the key chain, dtype, shape and offset of
+        each array, followed by the raw bytes of the arrays, each starting at a
+        multiple of `alignment` bytes. Leaves which are not arrays are stored in the
+        header, and must be json-able.
+
+        Parameters
+        ----------
+        mmap_filepath
+            Filepath for where to save the container to disk.
+        alignment
+            The alignment in bytes of each array in the file. Default is 64.
+
+        """
+        leaves = list()
+        arrays = list()
+        offset = 0
+        for key_chain, value in self.to_iterator(include_empty=True):
+            if isinstance(value, ivy.Container):
+                leaves.append({"key_chain": key_chain, "value": {}})
+            elif self._ivy.is_array(value):
+                value = self._ivy.to_numpy(value)
+                offset = -(-offset // alignment) * alignment
+                leaves.append(
+                    {
+                        "key_chain": key_chain,
+                        "dtype": value.dtype.str,
+                        "shape": list(value.shape),
+                        "offset": offset,
+                        "nbytes": value.nbytes,
+                    }
+                )
+                arrays.append(value)
+                offset += value.nbytes
+            else:
+                ivy.assertions.check_true(
+                    _is_jsonable(value),
+                    message="leaf {} is neither an array nor json-able".format(
+                        key_chain
+                    ),
+                )
+                leaves.append({"key_chain": key_chain, "value": value})
+        header = json.dumps({"alignment": alignment, "leaves": leaves}).encode()
+        data_offset = _mmap_data_offset(len(header), alignment)
+        with open(mmap_filepath, "wb") as mmap_file:
+            mmap_file.write(_mmap_magic)
+            mmap_file.write(len(header).to_bytes(8, "little"))
+            mmap_file.write(header)
+            array_leaves = [leaf for leaf in leaves if "value" not in leaf]
+            for leaf, array in zip(array_leaves, arrays):
+                mmap_file.write(bytes(data_offset + leaf["offset"] - mmap_file.tell()))
+                mmap_file.write(np.ascontiguousarray(array).data)
+
     def to_jsonable(self, return_dict=None):
         """
 
@@ -2122,6 +2571,49 @@ class ContainerBase(dict, abc.ABC):
             new_dict[key] = new_value
         return ivy.Container(new_dict, **self._config)
 
+    def pack(self):
+        """Return the array leaves of the container packed into one contiguous flat
+        buffer per data type and device, where elementwise functions are applied with
+        one backend call per buffer. See :class:`ivy.PackedContainer`.
+
+        Returns
+        -------
+        ret
+            the packed container, which :meth:`ivy.PackedContainer.unpack` converts
+            back into a container.
+
+        """
+        return ivy.PackedContainer.pack(self)
+
+    def index_key_chains(self, enable=True):
+        """Enable or disable a flat index from each key chain of the container to its
+        value.
+
+        The index is built lazily on the next key chain query, and is rebuilt on the
+        following query whenever this container or any of its sub-containers is
+        mutated. With the index enabled, :meth:`at_key_chain`, :meth:`has_key_chain`
+        and :meth:`at_key_chains` are dict lookups, :meth:`set_at_key_chain` and
+        :meth:`set_at_key_chains` update leaves in-place without rebuilding the
+        index, and :meth:`all_key_chains`, :meth:`key_chains_containing` and
+        :meth:`key_chains_matching` read the key chains from the index.
+
+        Parameters
+        ----------
+        enable
+            Whether to enable the index. Default is True.
+
+        Returns
+        -------
+        ret
+            This container.
+
+        """
+        self._kc_index_enabled = enable
+        if not enable:
+            self._invalidate_key_chain_indices()
+        self._kc_index = None
+        return self
+
     def has_key(self, query_key):
         """Determine whether container object has specified key somewhere in the nested
         structure.
@@ -2137,25 +2629,10 @@ class ContainerBase(dict, abc.ABC):
             Boolean
 
         """
-        has_key = False
-
-        def map_fn(x, kc):
-            """
-
-            Parameters
-            ----------
-            x
-                param kc:
-            kc
-
-            """
-            nonlocal has_key
-            if query_key in kc:
-                has_key = True
-            return x
-
-        self.map(map_fn)
-        return has_key
+        index = self._key_chain_index()
+        if index is not None:
+            return any(query_key in kc for kc in index[1])
+        return any(query_key in kc for kc, _ in self.to_iterator())
 
     def has_key_chain(self, key_chain):
         """Determine whether container object has specified key-chain.
@@ -2171,6 +2648,9 @@ class ContainerBase(dict, abc.ABC):
             Boolean
 
         """
+        index = self._key_chain_index()
+        if index is not None and key_chain.replace(".", "/") in index[0]:
+            return True
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2450,6 +2930,11 @@ class ContainerBase(dict, abc.ABC):
             sub-container or value at specified key chain
 
         """
+        index = self._key_chain_index()
+        if index is not None:
+            ret = index[0].get(key_chain.replace(".", "/"), index)
+            if ret is not index:
+                return ret
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2509,6 +2994,9 @@ class ContainerBase(dict, abc.ABC):
             Default value = False)
 
         """
+        index = self._key_chain_index()
+        if index is not None and not include_empty:
+            return list(index[1])
         return [kc for kc, v in self.to_iterator(include_empty=include_empty)]
 
     def key_chains_containing(self, sub_str, include_empty=False):
@@ -2522,12 +3010,58 @@ class ContainerBase(dict, abc.ABC):
              (Default value = False)
 
         """
+        index = self._key_chain_index()
+        if index is not None and not include_empty:
+            return [kc for kc in index[1] if sub_str in kc]
         return [
             kc
             for kc, v in self.to_iterator(include_empty=include_empty)
             if sub_str in kc
         ]
 
+    def key_chains_matching(self, pattern):
+        """Return the leaf key chains matching a glob pattern, in container order.
+
+        Parameters
+        ----------
+        pattern
+            The glob pattern, as accepted by :func:`fnmatch.fnmatchcase`, where `*`
+            also matches across `/`. For instance, "layer0/*" matches all the key
+            chains under "layer0".
+
+        Returns
+        -------
+        ret
+            The matching key chains.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a={"w": ivy.array([1.]), "b": ivy.array([2.])},
+        ...                   c={"w": ivy.array([3.])})
+        >>> print(x.key_chains_matching("*/w"))
+        ['a/w', 'c/w']
+
+        """
+        index = self._key_chain_index()
+        if index is None:
+            return [
+                kc for kc, _ in self.to_iterator() if fnmatch.fnmatchcase(kc, pattern)
+            ]
+        # only the key chains starting with the literal prefix of the pattern can
+        # match, and these are contiguous in the sorted key chains
+        prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        sorted_key_chains = index[2]
+        matches = list()
+        for i in range(
+            bisect.bisect_left(sorted_key_chains, prefix), len(sorted_key_chains)
+        ):
+            kc = sorted_key_chains[i]
+            if not kc.startswith(prefix):
+                break
+            if fnmatch.fnmatchcase(kc, pattern):
+                matches.append(kc)
+        return sorted(matches, key=index[3].__getitem__)
+
     def set_at_keys(self, target_dict):
         """Set values of container object at specified keys.
 
@@ -2571,6 +3105,17 @@ class ContainerBase(dict, abc.ABC):
 
         """
         keys = re.split("[/.]", key_chain)
+        index = self._key_chain_index() if inplace else None
+        if index is not None and not isinstance(val, ivy.Container):
+            kc = "/".join(keys)
+            if kc in index[0] and not isinstance(index[0][kc], ivy.Container):
+                # replacing a leaf by a leaf keeps the structure, so the index can
+                # be updated rather than invalidated
+                sub_cont = self if len(keys) == 1 else index[0][kc.rpartition("/")[0]]
+                sub_cont._invalidate_key_chain_indices(keep=self)
+                dict.__setitem__(sub_cont, keys[-1], val)
+                index[0][kc] = val
+                return self
         if inplace:
             cont = self
         else:
@@ -2642,6 +3187,20 @@ class ContainerBase(dict, abc.ABC):
             new container with updated values at the key chains
 
         """
+        if return_dict is None and inplace and self._key_chain_index() is not None:
+            # leaves set one key chain at a time update the index rather than
+            # invalidating it
+
+            def _set(target, key_chain):
+                for k, v in target.items():
+                    kc = key_chain + "/" + k if key_chain != "" else k
+                    if isinstance(v, dict):
+                        _set(v, kc)
+                    else:
+                        self.set_at_key_chain(kc, v, inplace=True)
+
+            _set(target_dict, "")
+            return ivy.Container(self, **self._config)
         if return_dict is None:
             if inplace:
                 return_dict = self
@@ -3795,6 +4354,9 @@ class ContainerBase(dict, abc.ABC):
         except KeyError:
             # noinspection PyUnresolvedReferences
             ret = super.__getattr__(item)
+        if self._lazy_leaves and isinstance(ret, _LazyH5Leaf):
+            ret = ret.load()
+            dict.__setitem__(self, item, ret)
         return ret
 
     def __setattr__(self, name, value):
@@ -3869,6 +4431,9 @@ class ContainerBase(dict, abc.ABC):
                 ret = self.at_key_chain(query)
                 return ret
             ret = dict.__getitem__(self, query)
+            if self._lazy_leaves and isinstance(ret, _LazyH5Leaf):
+                ret = ret.load()
+                dict.__setitem__(self, query, ret)
             return ret
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
@@ -3909,8 +4474,56 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.set_at_key_chain(query, val, inplace=True)
         else:
+            self._invalidate_key_chain_indices()
             return dict.__setitem__(self, query, val)
 
+    def __delitem__(self, key):
+        self._invalidate_key_chain_indices()
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._invalidate_key_chain_indices()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._invalidate_key_chain_indices()
+        return dict.popitem(self)
+
+    def clear(self):
+        self._invalidate_key_chain_indices()
+        return dict.clear(self)
+
+    def setdefault(self, key, default=None):
+        self._invalidate_key_chain_indices()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._invalidate_key_chain_indices()
+        return dict.update(self, *args, **kwargs)
+
+    def _load_lazy_leaves(self):
+        for key, value in dict.items(self):
+            if isinstance(value, _LazyH5Leaf):
+                dict.__setitem__(self, key, value.load())
+        self._lazy_leaves = False
+
+    def get(self, key, default=None):
+        ret = dict.get(self, key, default)
+        if self._lazy_leaves and isinstance(ret, _LazyH5Leaf):
+            ret = ret.load()
+            dict.__setitem__(self, key, ret)
+        return ret
+
+    def items(self):
+        if self._lazy_leaves:
+            self._load_lazy_leaves()
+        return dict.items(self)
+
+    def values(self):
+        if self._lazy_leaves:
+            self._load_lazy_leaves()
+        return dict.values(self)
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.has_key_chain(key)
@@ -3921,6 +4534,9 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        # the key chain index holds weak references, and is rebuilt when needed
+        state_dict.pop("_kc_index_owners", None)
+        state_dict["_kc_index"] = None
         state_dict["_local_ivy"] = ivy.try_else_none(
             lambda: state_dict["_local_ivy"].current_backend_str()
         )
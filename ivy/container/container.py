@@ -519,6 +519,9 @@ class Container(
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        # the key chain index holds weak references, and is rebuilt when needed
+        state_dict.pop("_kc_index_owners", None)
+        state_dict["_kc_index"] = None
         state_dict["_local_ivy"] = ivy.try_else_none(
             lambda: state_dict["_local_ivy"].current_backend_str()
         )
@@ -66,6 +66,7 @@ class ContainerWithLayers(ContainerBase):
         *,
         scale: bool = True,
         dtype: ivy.Dtype = None,
+        rng: Optional["ivy.RNGStream"] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -78,6 +79,7 @@ class ContainerWithLayers(ContainerBase):
             prob,
             scale=scale,
             dtype=dtype,
+            rng=rng,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -92,6 +94,7 @@ class ContainerWithLayers(ContainerBase):
         *,
         scale: bool = True,
         dtype: ivy.Dtype = None,
+        rng: Optional["ivy.RNGStream"] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -103,6 +106,7 @@ class ContainerWithLayers(ContainerBase):
             prob,
             scale=scale,
             dtype=dtype,
+            rng=rng,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -0,0 +1,389 @@
+"""Data loader filling container queues with batches collated on worker processes."""
+
+# global
+import os
+import queue
+import traceback
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# local
+import ivy
+from .transport import (
+    _flatten,
+    _is_numeric,
+    _share_resource_tracker,
+    _to_numpy,
+    from_shared_memory,
+    release_shared_memory,
+    to_shared_memory,
+)
+
+
+# Helpers #
+# --------#
+
+
+def _stack_leaves(values):
+    if all(_is_numeric(v) for v in values):
+        return np.stack(values)
+    return list(values)
+
+
+def default_collate(samples: Sequence[Any]) -> dict:
+    """Stack each leaf of the samples along a new leading batch dimension.
+
+    Parameters
+    ----------
+    samples
+        the samples of the batch, each a nested dict or container with the same key
+        chains.
+
+    Returns
+    -------
+    ret
+        a dict of the key chains to the stacked leaves. Leaves which are not numbers
+        or numeric arrays are collated into lists.
+
+    """
+    flat = [dict(_flatten(sample)) for sample in samples]
+    return {
+        key_chain: _stack_leaves([_to_numpy(f[key_chain]) for f in flat])
+        for key_chain in flat[0]
+    }
+
+
+def _worker_loop(
+    worker_id, load_fn, transforms, collate_fn, seed, epoch, task_queue, out_queue, stop
+):
+    """Load, transform and collate the batches sent on `task_queue`, and put their
+    shared memory handles on the bounded `out_queue`, until a None task arrives."""
+    # forked workers would otherwise draw the same random transforms
+    np.random.seed((ivy.default(seed, os.getpid()) + worker_id) % 2**32)
+    while not stop.is_set():
+        try:
+            task = task_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if task is None:
+            break
+        task_epoch, batch_idx, indices = task
+        if task_epoch != epoch.value:
+            continue
+        try:
+            samples = list()
+            for idx in indices:
+                sample = load_fn(idx)
+                for transform in transforms:
+                    sample = transform(sample)
+                samples.append(sample)
+            item = (task_epoch, batch_idx, to_shared_memory(collate_fn(samples)), None)
+        except Exception:
+            item = (task_epoch, batch_idx, None, traceback.format_exc())
+        while True:
+            try:
+                out_queue.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                if stop.is_set() or task_epoch != epoch.value:
+                    if item[2] is not None:
+                        release_shared_memory(item[2])
+                    break
+
+
+class _WorkerQueue:
+    """The output queue of one worker, returning containers from `get`, as expected of
+    the queues of a container."""
+
+    def __init__(self, loader, worker_id):
+        self._loader = loader
+        self._worker_id = worker_id
+
+    def get(self, block=True, timeout=None):
+        return self._loader._get(self._worker_id, block, timeout)[1]
+
+
+# Data Loader #
+# ------------#
+
+
+class DataLoader:
+    """Load batches of samples on worker processes, and prefetch them as containers.
+
+    Each worker calls `load_fn` on the indices of its batches, applies the
+    `transforms` to each sample, collates the samples, and copies the array leaves of
+    the batch into a shared memory block, so that only the layout of the batch is
+    pickled. The batches are rebuilt as containers of views into the blocks, without
+    copying where the backend supports it.
+
+    The batches of an epoch are dealt out to the workers in turn, and each worker
+    holds at most `prefetch` batches ready, so that the batches are loaded in the
+    background while the previous ones are consumed, without unbounded memory use.
+
+    Examples
+    --------
+    >>> def load_fn(i):
+    ...     return {"x": np.full((2,), i, "float32"), "y": i}
+    >>> loader = ivy.DataLoader(load_fn, 8, 4, num_workers=2)
+    >>> for batch in loader:
+    ...     print(batch.shape)
+    [4]
+    [4]
+    >>> loader.close()
+
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[int], Any],
+        num_samples: int,
+        batch_size: int,
+        /,
+        *,
+        transforms: Optional[Sequence[Callable]] = None,
+        collate_fn: Optional[Callable] = None,
+        num_workers: int = 1,
+        prefetch: int = 2,
+        shuffle: bool = False,
+        drop_last: bool = False,
+        seed: Optional[int] = None,
+        context: Optional[str] = None,
+        timeout: Optional[float] = None,
+        ivyh=None,
+    ):
+        """Initialize the data loader. The worker processes are started on first use.
+
+        Parameters
+        ----------
+        load_fn
+            function loading the sample at an index, as a nested dict or container.
+            It is called on the worker processes, so must be picklable if the
+            processes are spawned.
+        num_samples
+            number of samples in the dataset.
+        batch_size
+            number of samples in each batch.
+        transforms
+            functions applied in turn to each sample, on the worker processes.
+            Default is None.
+        collate_fn
+            function collating the list of transformed samples of a batch into a
+            nested dict or container. Default is :func:`default_collate`.
+        num_workers
+            number of worker processes. Default is 1.
+        prefetch
+            maximum number of batches each worker holds ready. Default is 2.
+        shuffle
+            whether to shuffle the samples every epoch. Default is False.
+        drop_last
+            whether to drop the last batch if it is smaller than `batch_size`.
+            Default is False.
+        seed
+            seed of the shuffling and of numpy on the workers. Default is None.
+        context
+            the context of the multiprocessing, either fork, forkserver or spawn.
+            Default is None.
+        timeout
+            the timeout when waiting for a batch. Default is the global queue timeout.
+        ivyh
+            Handle to ivy module to use for the batch containers. Default is None.
+
+        """
+        ivy.assertions.check_greater(num_workers, 0)
+        ivy.assertions.check_greater(prefetch, 0)
+        ivy.assertions.check_greater(batch_size, 0)
+        self._load_fn = load_fn
+        self._num_samples = num_samples
+        self._batch_size = batch_size
+        self._transforms = list(ivy.default(transforms, []))
+        self._collate_fn = ivy.default(collate_fn, default_collate)
+        self._num_workers = num_workers
+        self._prefetch = prefetch
+        self._shuffle = shuffle
+        self._drop_last = drop_last
+        self._seed = seed
+        self._context = context
+        self._timeout = timeout
+        self._ivyh = ivyh
+        self._workers = None
+        self._epoch = None
+        self._num_epochs = 0
+        self._next_batch = 0
+        self._num_batches = 0
+
+    # Workers #
+    # --------#
+
+    def _start(self):
+        mp = ivy.multiprocessing(self._context)
+        _share_resource_tracker()
+        self._epoch = mp.Value("i", -1)
+        self._stop = mp.Event()
+        self._task_queues = list()
+        self._out_queues = list()
+        self._workers = list()
+        for worker_id in range(self._num_workers):
+            task_queue = mp.Queue()
+            out_queue = mp.Queue(maxsize=self._prefetch)
+            worker = mp.Process(
+                target=_worker_loop,
+                args=(
+                    worker_id,
+                    self._load_fn,
+                    self._transforms,
+                    self._collate_fn,
+                    self._seed,
+                    self._epoch,
+                    task_queue,
+                    out_queue,
+                    self._stop,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._task_queues.append(task_queue)
+            self._out_queues.append(out_queue)
+            self._workers.append(worker)
+
+    def _get(self, worker_id, block=True, timeout=None) -> Tuple[int, ivy.Container]:
+        """Return the index and container of the next batch of the current epoch
+        ready on the output queue of worker `worker_id`, discarding stale batches."""
+        if self._workers is None:
+            self._start_epoch()
+        timeout = ivy.default(
+            timeout, ivy.default(self._timeout, ivy.get_queue_timeout())
+        )
+        while True:
+            epoch, batch_idx, handle, error = self._out_queues[worker_id].get(
+                block, timeout
+            )
+            if epoch != self._epoch.value:
+                if handle is not None:
+                    release_shared_memory(handle)
+                continue
+            if error is not None:
+                raise ivy.exceptions.IvyException(
+                    "DataLoader worker {} failed to load batch {}:\n{}".format(
+                        worker_id, batch_idx, error
+                    )
+                )
+            return batch_idx, from_shared_memory(handle, ivyh=self._ivyh)
+
+    def _start_epoch(self):
+        if self._workers is None:
+            self._start()
+        order = np.arange(self._num_samples)
+        if self._shuffle:
+            rng = np.random.default_rng(
+                None if self._seed is None else self._seed + self._num_epochs
+            )
+            order = rng.permutation(self._num_samples)
+        batches = [
+            order[i : i + self._batch_size].tolist()
+            for i in range(0, self._num_samples, self._batch_size)
+        ]
+        if self._drop_last and batches and len(batches[-1]) < self._batch_size:
+            batches = batches[:-1]
+        # workers skip the tasks of abandoned epochs, and their ready batches are
+        # discarded on arrival
+        self._epoch.value = self._num_epochs
+        for batch_idx, indices in enumerate(batches):
+            self._task_queues[batch_idx % self._num_workers].put(
+                (self._num_epochs, batch_idx, indices)
+            )
+        self._num_epochs += 1
+        self._next_batch = 0
+        self._num_batches = len(batches)
+
+    # Consumption #
+    # ------------#
+
+    def next_nowait(self) -> ivy.Container:
+        """Return the next batch if it is ready, without waiting.
+
+        Returns
+        -------
+        ret
+            the next batch of the epoch.
+
+        Raises
+        ------
+        queue.Empty
+            if the next batch is still being loaded.
+        StopIteration
+            if the epoch is over.
+
+        """
+        return self._next(block=False)
+
+    def _next(self, block=True):
+        if self._workers is None:
+            self._start_epoch()
+        if self._next_batch >= self._num_batches:
+            raise StopIteration
+        _, batch = self._get(self._next_batch % self._num_workers, block)
+        self._next_batch += 1
+        return batch
+
+    def __iter__(self) -> Iterator[ivy.Container]:
+        self._start_epoch()
+        return self
+
+    def __next__(self) -> ivy.Container:
+        return self._next()
+
+    def __len__(self):
+        if self._drop_last:
+            return self._num_samples // self._batch_size
+        return -(-self._num_samples // self._batch_size)
+
+    @property
+    def queues(self) -> List[_WorkerQueue]:
+        """The output queues of the workers, each returning the containers of the
+        batches of one worker in turn."""
+        return [_WorkerQueue(self, i) for i in range(self._num_workers)]
+
+    def as_container(self) -> ivy.Container:
+        """Return a container loading from the queues of the workers, indexed by the
+        samples of the next batch of each worker in turn."""
+        if self._workers is None:
+            self._start_epoch()
+        return ivy.Container(
+            queues=self.queues,
+            queue_load_sizes=[self._batch_size] * self._num_workers,
+            queue_timeout=ivy.default(self._timeout, ivy.get_queue_timeout()),
+            ivyh=self._ivyh,
+        )
+
+    # Shutdown #
+    # ---------#
+
+    def close(self):
+        """Stop the worker processes, and free the blocks of the unconsumed
+        batches."""
+        if self._workers is None:
+            return
+        self._stop.set()
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=1.0)
+        for out_queue in self._out_queues:
+            while True:
+                try:
+                    handle = out_queue.get(timeout=0.1)[2]
+                except queue.Empty:
+                    break
+                if handle is not None:
+                    release_shared_memory(handle)
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+        self._workers = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,417 @@
+"""Packed representation of the array leaves of a Container."""
+
+# global
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# local
+import ivy
+
+
+# Helpers #
+# --------#
+
+
+class _Leaf:
+    """The position of one leaf of a packed container. Array leaves are a slice
+    of the flat buffer `group`, while other leaves are held as they are, with `group`
+    set to None."""
+
+    __slots__ = ("key_chain", "group", "start", "stop", "shape", "value")
+
+    def __init__(self, key_chain, group=None, start=0, stop=0, shape=(), value=None):
+        self.key_chain = key_chain
+        self.group = group
+        self.start = start
+        self.stop = stop
+        self.shape = shape
+        self.value = value
+
+
+def _nest_key_chains(leaves: Dict[str, Any]) -> dict:
+    """Build a nested dict from a dict of key chains to leaves."""
+    ret = dict()
+    for key_chain, value in leaves.items():
+        keys = key_chain.split("/")
+        d = ret
+        for key in keys[:-1]:
+            d = d.setdefault(key, dict())
+        d[keys[-1]] = value
+    return ret
+
+
+# the elementwise functions which packed containers expose as methods
+_ELEMENTWISE_FUNCTIONS = frozenset(
+    [
+        "abs",
+        "acos",
+        "acosh",
+        "add",
+        "asin",
+        "asinh",
+        "atan",
+        "atan2",
+        "atanh",
+        "bitwise_and",
+        "bitwise_invert",
+        "bitwise_left_shift",
+        "bitwise_or",
+        "bitwise_right_shift",
+        "bitwise_xor",
+        "ceil",
+        "cos",
+        "cosh",
+        "deg2rad",
+        "divide",
+        "equal",
+        "erf",
+        "exp",
+        "expm1",
+        "floor",
+        "floor_divide",
+        "greater",
+        "greater_equal",
+        "isfinite",
+        "isinf",
+        "isnan",
+        "less",
+        "less_equal",
+        "log",
+        "log10",
+        "log1p",
+        "log2",
+        "logaddexp",
+        "logical_and",
+        "logical_not",
+        "logical_or",
+        "logical_xor",
+        "maximum",
+        "minimum",
+        "multiply",
+        "negative",
+        "not_equal",
+        "positive",
+        "pow",
+        "rad2deg",
+        "reciprocal",
+        "remainder",
+        "round",
+        "sign",
+        "sin",
+        "sinh",
+        "sqrt",
+        "square",
+        "subtract",
+        "tan",
+        "tanh",
+        "trunc",
+        "trunc_divide",
+    ]
+)
+
+
+# Packed Container #
+# -----------------#
+
+
+class PackedContainer:
+    """The array leaves of a container, packed into one contiguous flat buffer per
+    data type and device.
+
+    The structure of the container, that is the key chain, buffer, offset and shape
+    of each leaf, is frozen when packing, and shared with every packed container
+    derived from it. Elementwise functions are applied to each flat buffer with a
+    single backend call, instead of once per leaf, and return a new packed container
+    with the same structure, where the leaves which aren't arrays are passed through
+    unchanged. The leaves are views into the buffers where the backend supports views,
+    and are only gathered into a Container on calling :meth:`unpack`.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([[3.]])})
+    >>> packed = x.pack()
+    >>> print(len(packed.buffers))
+    1
+    >>> print((packed * 2 + 1).unpack())
+    {
+        a: ivy.array([3., 5.]),
+        b: {
+            c: ivy.array([[7.]])
+        }
+    }
+
+    """
+
+    def __init__(
+        self,
+        buffers: List[ivy.Array],
+        leaves: Tuple[_Leaf],
+        config: Optional[dict] = None,
+    ):
+        self._buffers = buffers
+        self._leaves = leaves
+        self._config = ivy.default(config, dict())
+
+    # Conversion #
+    # -----------#
+
+    @staticmethod
+    def pack(container: ivy.Container) -> "PackedContainer":
+        """Pack the array leaves of `container` into one flat buffer per data type
+        and device.
+
+        Parameters
+        ----------
+        container
+            the container to pack.
+
+        Returns
+        -------
+        ret
+            the packed container.
+
+        """
+        local_ivy = container.ivy
+        groups = dict()
+        leaves = list()
+        flat = list()
+        sizes = list()
+        for key_chain, value in container.to_iterator():
+            if not local_ivy.is_array(value):
+                leaves.append(_Leaf(key_chain, value=value))
+                continue
+            group_key = (local_ivy.dtype(value, as_native=False), local_ivy.dev(value))
+            if group_key not in groups:
+                groups[group_key] = len(flat)
+                flat.append(list())
+                sizes.append(0)
+            group = groups[group_key]
+            size = 1
+            for dim in value.shape:
+                size *= dim
+            leaves.append(
+                _Leaf(
+                    key_chain,
+                    group,
+                    sizes[group],
+                    sizes[group] + size,
+                    tuple(value.shape),
+                )
+            )
+            sizes[group] += size
+            flat[group].append(local_ivy.reshape(value, (-1,)))
+        buffers = [local_ivy.concat(xs, axis=0) for xs in flat]
+        return PackedContainer(buffers, tuple(leaves), container.config)
+
+    def unpack(self) -> ivy.Container:
+        """Return a container with the same structure as the packed one, where each
+        array leaf is a view into its buffer.
+
+        Returns
+        -------
+        ret
+            the unpacked container.
+
+        """
+        return ivy.Container(
+            _nest_key_chains({leaf.key_chain: self[leaf] for leaf in self._leaves}),
+            **self._config,
+        )
+
+    # Properties #
+    # -----------#
+
+    @property
+    def buffers(self) -> List[ivy.Array]:
+        """The flat buffers, one per data type and device of the packed leaves."""
+        return self._buffers
+
+    @property
+    def key_chains(self) -> List[str]:
+        """The key chains of the leaves, in the order they were packed."""
+        return [leaf.key_chain for leaf in self._leaves]
+
+    # Mapping #
+    # --------#
+
+    def identical_structure(self, other: "PackedContainer") -> bool:
+        """Whether `other` packs the same leaves at the same buffer offsets."""
+        return self._leaves is other._leaves or (
+            len(self._leaves) == len(other._leaves)
+            and all(
+                a.key_chain == b.key_chain
+                and a.group == b.group
+                and a.start == b.start
+                and a.stop == b.stop
+                and a.shape == b.shape
+                for a, b in zip(self._leaves, other._leaves)
+            )
+        )
+
+    @staticmethod
+    def multi_map_buffers(
+        func: Callable, args: List[Any], kwargs: Optional[dict] = None
+    ) -> "PackedContainer":
+        """Call `func` once per flat buffer, with each packed container in `args` and
+        `kwargs` replaced by its corresponding buffer.
+
+        Parameters
+        ----------
+        func
+            the function to call, which must be elementwise, and return an array with
+            as many elements as the buffers.
+        args
+            the positional arguments of `func`, containing at least one packed
+            container. All the packed containers must have an identical structure.
+        kwargs
+            the keyword arguments of `func`. Default is None.
+
+        Returns
+        -------
+        ret
+            a packed container of the returns, with the same structure, or a tuple of
+            them if `func` returns a tuple. The leaves which aren't arrays are those of
+            the first packed container, unchanged.
+
+        """
+        kwargs = ivy.default(kwargs, dict())
+        packed = [
+            x
+            for x in list(args) + list(kwargs.values())
+            if isinstance(x, PackedContainer)
+        ]
+        ivy.assertions.check_exists(
+            packed, message="no packed containers found in arguments"
+        )
+        packed0 = packed[0]
+        ivy.assertions.check_true(
+            all(packed0.identical_structure(x) for x in packed[1:]),
+            message="packed containers must have an identical structure",
+        )
+
+        def _at(x, i):
+            return x._buffers[i] if isinstance(x, PackedContainer) else x
+
+        buffers = [
+            func(
+                *[_at(a, i) for a in args],
+                **{k: _at(v, i) for k, v in kwargs.items()},
+            )
+            for i in range(len(packed0._buffers))
+        ]
+        if buffers and isinstance(buffers[0], tuple):
+            return tuple(
+                PackedContainer(list(b), packed0._leaves, packed0._config)
+                for b in zip(*buffers)
+            )
+        return PackedContainer(buffers, packed0._leaves, packed0._config)
+
+    def map_buffers(self, func: Callable) -> "PackedContainer":
+        """Call `func` once per flat buffer, and return the packed container of the
+        returns, with the same structure."""
+        return PackedContainer.multi_map_buffers(func, [self])
+
+    def reduce_leaves(self, func: Callable) -> "PackedContainer":
+        """Call `func` on each array leaf, and return a packed container with the same
+        structure, where every element of a leaf holds the scalar returned for it.
+
+        Parameters
+        ----------
+        func
+            the function to call on each array leaf, returning a scalar array.
+
+        Returns
+        -------
+        ret
+            a packed container of the returns, repeated over the elements of each leaf.
+
+        """
+        values = [list() for _ in self._buffers]
+        repeats = [list() for _ in self._buffers]
+        for leaf in self._leaves:
+            if leaf.group is None:
+                continue
+            values[leaf.group].append(ivy.reshape(func(self[leaf]), (1,)))
+            repeats[leaf.group].append(leaf.stop - leaf.start)
+        buffers = [
+            ivy.repeat(ivy.concat(v, axis=0), r, axis=0)
+            for v, r in zip(values, repeats)
+        ]
+        return PackedContainer(buffers, self._leaves, self._config)
+
+    # Built-ins #
+    # ----------#
+
+    def __getitem__(self, query):
+        leaf = query
+        if not isinstance(query, _Leaf):
+            leaf = next(
+                (leaf for leaf in self._leaves if leaf.key_chain == query), None
+            )
+            if leaf is None:
+                raise KeyError(query)
+        if leaf.group is None:
+            return leaf.value
+        return ivy.reshape(
+            self._buffers[leaf.group][leaf.start : leaf.stop], leaf.shape
+        )
+
+    def __len__(self):
+        return len(self._leaves)
+
+    def __getattr__(self, item):
+        # elementwise functions are applied to each buffer in one call
+        if item not in _ELEMENTWISE_FUNCTIONS:
+            raise AttributeError(
+                "'PackedContainer' object has no attribute '{}'".format(item)
+            )
+
+        def _fn(*args, **kwargs):
+            return PackedContainer.multi_map_buffers(
+                ivy.__dict__[item], [self] + list(args), kwargs
+            )
+
+        return _fn
+
+    def __neg__(self):
+        return self.map_buffers(lambda x: -x)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self.map_buffers(abs)
+
+    def __add__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a + b, [self, other])
+
+    def __radd__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a + b, [other, self])
+
+    def __sub__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a - b, [self, other])
+
+    def __rsub__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a - b, [other, self])
+
+    def __mul__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a * b, [self, other])
+
+    def __rmul__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a * b, [other, self])
+
+    def __truediv__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a / b, [self, other])
+
+    def __rtruediv__(self, other):
+        return PackedContainer.multi_map_buffers(lambda a, b: a / b, [other, self])
+
+    def __pow__(self, power):
+        return PackedContainer.multi_map_buffers(lambda a, b: a**b, [self, power])
+
+    def __rpow__(self, power):
+        return PackedContainer.multi_map_buffers(lambda a, b: a**b, [power, self])
+
+    def __repr__(self):
+        return "PackedContainer({} leaves, {} buffers)".format(
+            len(self._leaves), len(self._buffers)
+        )
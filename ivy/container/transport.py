@@ -0,0 +1,280 @@
+"""Transport of containers across processes through shared memory blocks."""
+
+# global
+import os
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+import numpy as np
+
+# local
+import ivy
+from .packed import _nest_key_chains
+
+
+# Helpers #
+# --------#
+
+# the byte alignment of each array leaf within a shared memory block, and the size
+# of the block header, which holds the count of receivers yet to attach the block
+_alignment = 64
+
+# blocks whose arrays were all released, closed once their buffers are unexported
+_released_blocks = list()
+
+
+class _SharedBlock(np.ndarray):
+    """The bytes of a shared memory block. Leaves are views of this array, and numpy
+    stops collapsing the base of a view at a change of type, so this array is alive
+    exactly as long as any leaf, or any view of a leaf."""
+
+
+def _flatten(nest, key_chain=""):
+    """Return the (key chain, leaf) pairs of a nested dict or container."""
+    if not isinstance(nest, dict):
+        return [(key_chain, nest)]
+    ret = list()
+    for key, value in nest.items():
+        ret += _flatten(value, key_chain + "/" + key if key_chain else key)
+    return ret
+
+
+def _to_numpy(x):
+    if isinstance(x, (np.ndarray, np.number, np.bool_, bool, int, float, complex)):
+        return np.asarray(x)
+    if ivy.is_array(x):
+        return ivy.to_numpy(x)
+    return x
+
+
+def _is_numeric(x):
+    return isinstance(x, np.ndarray) and x.dtype.kind in "biufc"
+
+
+def _share_resource_tracker():
+    """Start the tracker of the shared memory blocks before any worker process, so
+    that the workers share it, and blocks created by one process and unlinked by
+    another are not reported as leaked."""
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+
+        resource_tracker.ensure_running()
+
+
+def _close_released_blocks():
+    for shm in list(_released_blocks):
+        try:
+            shm.close()
+        except BufferError:
+            continue
+        _released_blocks.remove(shm)
+
+
+def _release_reference(shm, num_receivers, lock):
+    """Decrement the count of receivers yet to attach the block `shm`, and unlink the
+    block once every receiver has attached it. The mapped memory is only freed once
+    each receiver closes its mapping."""
+    if num_receivers == 1:
+        shm.unlink()
+        return
+    ivy.assertions.check_exists(
+        lock, message="a lock is needed to share a block between several receivers"
+    )
+    count = np.ndarray((1,), np.int64, buffer=shm.buf)
+    with lock:
+        count[0] -= 1
+        last = count[0] == 0
+    del count
+    if last:
+        shm.unlink()
+
+
+# Handles #
+# --------#
+
+
+class SharedMemoryHandle:
+    """The picklable handle of a nest held in a shared memory block, that is the name
+    of the block, the key chain, dtype, shape and offset of each array leaf, the other
+    leaves as they are, and the number of receivers of the block."""
+
+    __slots__ = ("name", "leaves", "values", "num_receivers")
+
+    def __init__(self, name, leaves, values, num_receivers=1):
+        self.name = name
+        self.leaves = leaves
+        self.values = values
+        self.num_receivers = num_receivers
+
+    def __repr__(self):
+        return "SharedMemoryHandle({}, {} arrays, {} receivers)".format(
+            self.name, len(self.leaves), self.num_receivers
+        )
+
+
+def to_shared_memory(x: Any, /, *, num_receivers: int = 1) -> SharedMemoryHandle:
+    """Copy the numeric array leaves of the nest `x` into one new shared memory block.
+
+    Parameters
+    ----------
+    x
+        the container or nested dict to copy.
+    num_receivers
+        the number of calls to :func:`from_shared_memory` or
+        :func:`release_shared_memory` on the handle, after which the block is
+        unlinked. Default is 1.
+
+    Returns
+    -------
+    ret
+        the handle to rebuild the nest from, which only holds the layout of the
+        array leaves, and the other leaves.
+
+    """
+    ivy.assertions.check_greater(num_receivers, 0)
+    leaves = list()
+    arrays = list()
+    values = dict()
+    size = _alignment
+    for key_chain, value in _flatten(x):
+        value = _to_numpy(value)
+        if not _is_numeric(value):
+            values[key_chain] = value
+            continue
+        size = -(-size // _alignment) * _alignment
+        leaves.append((key_chain, value.dtype.str, value.shape, size))
+        arrays.append(value)
+        size += value.nbytes
+    if not leaves:
+        return SharedMemoryHandle(None, leaves, values, num_receivers)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        np.ndarray((1,), np.int64, buffer=shm.buf)[0] = num_receivers
+        for (_, dtype, shape, offset), value in zip(leaves, arrays):
+            np.ndarray(shape, dtype, buffer=shm.buf, offset=offset)[...] = value
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    # the block outlives this mapping, until the last receiver unlinks it
+    shm.close()
+    return SharedMemoryHandle(shm.name, leaves, values, num_receivers)
+
+
+def from_shared_memory(
+    handle: SharedMemoryHandle, /, *, lock=None, ivyh=None
+) -> ivy.Container:
+    """Rebuild the container of a handle returned by :func:`to_shared_memory`, with
+    array leaves viewing the shared memory block, without copying where the backend
+    supports it.
+
+    The block stays mapped in this process until every array leaf viewing it is
+    released, and is unlinked once all the receivers of the handle rebuilt it.
+
+    Parameters
+    ----------
+    handle
+        the handle of the block.
+    lock
+        the multiprocessing lock guarding the count of receivers, only needed if the
+        handle has several receivers. Default is None.
+    ivyh
+        Handle to ivy module to use for the container. Default is None.
+
+    Returns
+    -------
+    ret
+        the rebuilt container.
+
+    """
+    _close_released_blocks()
+    local_ivy = ivy.default(ivyh, ivy)
+    values = dict(handle.values)
+    if handle.name is not None:
+        shm = shared_memory.SharedMemory(name=handle.name)
+        _release_reference(shm, handle.num_receivers, lock)
+        block = np.ndarray((shm.size,), np.uint8, buffer=shm.buf).view(_SharedBlock)
+        weakref.finalize(block, _released_blocks.append, shm)
+        for key_chain, dtype, shape, offset in handle.leaves:
+            nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+            leaf = block[offset : offset + nbytes].view(np.ndarray).view(dtype)
+            values[key_chain] = local_ivy.asarray(leaf.reshape(shape))
+    return ivy.Container(_nest_key_chains(values), ivyh=ivyh)
+
+
+def release_shared_memory(handle: SharedMemoryHandle, /, *, lock=None):
+    """Give up the reference of one receiver to the block of `handle`, without
+    rebuilding its container.
+
+    Parameters
+    ----------
+    handle
+        the handle of the block.
+    lock
+        the multiprocessing lock guarding the count of receivers, only needed if the
+        handle has several receivers. Default is None.
+
+    """
+    if handle.name is None:
+        return
+    try:
+        shm = shared_memory.SharedMemory(name=handle.name)
+    except FileNotFoundError:
+        return
+    try:
+        _release_reference(shm, handle.num_receivers, lock)
+    finally:
+        shm.close()
+
+
+# Transport #
+# ----------#
+
+
+class SharedMemoryTransport:
+    """Send containers between processes through shared memory blocks, pickling only
+    their structure.
+
+    The transport holds the lock guarding the count of receivers of each block, so
+    it must be created before the processes using it, and passed to them on
+    creation, rather than through a queue. Each block is unlinked once all its
+    receivers have attached it, and each receiver keeps its mapping open for as long
+    as any of its array leaves is alive.
+
+    Examples
+    --------
+    >>> transport = ivy.SharedMemoryTransport()
+    >>> x = ivy.Container(a=ivy.array([0., 1.]), b={"c": ivy.array([[2]])})
+    >>> handle = transport.put(x, num_receivers=2)
+    >>> print(transport.get(handle).b.c)
+    ivy.array([[2]])
+    >>> transport.release(handle)
+
+    """
+
+    def __init__(self, context: Optional[str] = None):
+        """Initialize the transport.
+
+        Parameters
+        ----------
+        context
+            the context of the multiprocessing, either fork, forkserver or spawn.
+            Default is None.
+
+        """
+        _share_resource_tracker()
+        self._lock = ivy.multiprocessing(context).Lock()
+
+    def put(self, x: Any, /, *, num_receivers: int = 1) -> SharedMemoryHandle:
+        """Copy the array leaves of `x` into a shared memory block, and return the
+        handle to send to the `num_receivers` receiving processes."""
+        return to_shared_memory(x, num_receivers=num_receivers)
+
+    def get(self, handle: SharedMemoryHandle, /, *, ivyh=None) -> ivy.Container:
+        """Rebuild the container of `handle`, viewing its shared memory block."""
+        return from_shared_memory(handle, lock=self._lock, ivyh=ivyh)
+
+    def release(self, handle: SharedMemoryHandle, /):
+        """Give up the reference to the block of `handle` without rebuilding it."""
+        release_shared_memory(handle, lock=self._lock)
@@ -1,7 +1,7 @@
 import ivy
 import functools
 from types import FunctionType
-from typing import Callable
+from typing import Callable, List
 
 
 # for wrapping (sequence matters)
@@ -21,22 +21,129 @@ FN_DECORATORS = [
 # --------#
 
 
+# while a function is traced by ivy.compile, the tracer which records each backend
+# call made by the wrapped functions
+_tracer = None
+
+# leaves of these types can never be arrays, so the backend needn't be asked
+_NON_ARRAY_TYPES = (int, float, bool, complex, str, type(None))
+
+
+def _is_array(x):
+    if isinstance(x, ivy.Array):
+        return ivy.is_native_array(x.data)
+    if type(x) in _NON_ARRAY_TYPES:
+        return False
+    return ivy.is_native_array(x)
+
+
+def _is_nest(x):
+    return isinstance(x, tuple) or type(x) is list or type(x) is dict
+
+
+def _to_native_leaf(x):
+    if isinstance(x, ivy.Array):
+        return x.data
+    if isinstance(x, ivy.Container):
+        return ivy.to_native(x)
+    return x
+
+
+def _scan_leaf(x, convert, state):
+    # the state is [first array, container found, check for containers,
+    # find first array]
+    if state[1]:
+        return x
+    if state[2] and isinstance(x, ivy.Container):
+        state[1] = True
+        return x
+    if convert is not None:
+        x = convert(x)
+    if state[3] and _is_array(x):
+        state[0] = x
+        state[3] = False
+    return x
+
+
+def _scan_nest(x, convert, state):
+    if state[1]:
+        return x
+    if isinstance(x, tuple):
+        ret = [_scan_nest(v, convert, state) for v in x]
+        if convert is None or all(r is v for r, v in zip(ret, x)):
+            return x
+        if hasattr(x, "_fields"):
+            return type(x)(*ret)
+        return type(x)(ret)
+    if type(x) is list:
+        ret = [_scan_nest(v, convert, state) for v in x]
+        if convert is None or all(r is v for r, v in zip(ret, x)):
+            return x
+        return ret
+    if type(x) is dict:
+        ret = {k: _scan_nest(v, convert, state) for k, v in x.items()}
+        if convert is None or all(ret[k] is v for k, v in x.items()):
+            return x
+        return ret
+    return _scan_leaf(x, convert, state)
+
+
+def _scan_args(args, kwargs, convert=None, find_first=False, check_containers=False):
+    """Scan the positional and keyword arguments of a function call once, optionally
+    converting each leaf, finding the first array and checking for containers.
+
+    The top level of the arguments is checked first, and the arguments are only
+    traversed recursively if a tuple, list or dict is passed. Any ivy.Container is
+    treated as a leaf.
+
+    Parameters
+    ----------
+    args
+        The positional arguments to scan.
+    kwargs
+        The keyword arguments to scan.
+    convert
+        Function applied to each leaf which is not a container. Default is None.
+    find_first
+        Whether to find the first array, searching the positional arguments before
+        the keyword arguments. Default is False.
+    check_containers
+        Whether to check for ivy.Container instances, in which case the scan stops at
+        the first container found. Default is False.
+
+    Returns
+    -------
+    ret
+        the converted positional and keyword arguments, the first array or None, and
+        whether a container was found. The arguments are returned unchanged if a
+        container was found, or if no leaf was changed by `convert`.
+    """
+    state = [None, False, check_containers, find_first]
+    if any(_is_nest(v) for v in args) or any(_is_nest(v) for v in kwargs.values()):
+        new_args = _scan_nest(args, convert, state)
+        new_kwargs = _scan_nest(kwargs, convert, state)
+    elif convert is None:
+        for v in args:
+            _scan_leaf(v, None, state)
+        for v in kwargs.values():
+            _scan_leaf(v, None, state)
+        return args, kwargs, state[0], state[1]
+    else:
+        new_args = tuple([_scan_leaf(v, convert, state) for v in args])
+        new_kwargs = {k: _scan_leaf(v, convert, state) for k, v in kwargs.items()}
+    if state[1]:
+        return args, kwargs, None, True
+    return new_args, new_kwargs, state[0], False
+
+
 def _get_first_array(*args, **kwargs):
-    # ToDo: make this more efficient, with function ivy.nested_nth_index_where
-    arr = None
-    if args:
-        arr_idxs = ivy.nested_argwhere(args, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(args, arr_idxs[0])
-        else:
-            arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-            if arr_idxs:
-                arr = ivy.index_nest(kwargs, arr_idxs[0])
-    elif kwargs:
-        arr_idxs = ivy.nested_argwhere(kwargs, ivy.is_array, stop_after_n_found=1)
-        if arr_idxs:
-            arr = ivy.index_nest(kwargs, arr_idxs[0])
-    return arr
+    return _scan_args(args, kwargs, find_first=True)[2]
+
+
+def _outputs_to_ivy(ret):
+    if _is_nest(ret):
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+    return ivy.to_ivy(ret)
 
 
 # Array Handling #
@@ -73,9 +180,7 @@ def inputs_to_native_arrays(fn: Callable) -> Callable:
             del kwargs["out"]
             has_out = True
         # convert all arrays in the inputs to ivy.NativeArray instances
-        new_args, new_kwargs = ivy.args_to_native(
-            *args, **kwargs, include_derived={tuple: True}
-        )
+        new_args, new_kwargs, _, _ = _scan_args(args, kwargs, convert=_to_native_leaf)
         # add the original out argument back to the keyword arguments
         if has_out:
             new_kwargs["out"] = out
@@ -145,7 +250,7 @@ def outputs_to_ivy_arrays(fn: Callable) -> Callable:
         if not ivy.get_array_mode():
             return ret
         # convert all arrays in the return to `ivy.Array` instances
-        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+        return _outputs_to_ivy(ret)
 
     new_fn.outputs_to_ivy_arrays = True
     return new_fn
@@ -381,12 +486,11 @@ def handle_nestable(fn: Callable) -> Callable:
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        cont_fn = getattr(ivy.Container, "static_" + fn_name)
-        if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+        if (
+            ivy.get_nestable_mode()
+            and _scan_args(args, kwargs, check_containers=True)[3]
         ):
-            return cont_fn(*args, **kwargs)
+            return getattr(ivy.Container, "static_" + fn_name)(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
         # the passed arguments, returning an ivy or a native array.
@@ -396,6 +500,151 @@ def handle_nestable(fn: Callable) -> Callable:
     return new_fn
 
 
+# Fused Wrapping #
+# ---------------#
+
+
+def _chain_decorators(fn: Callable, decorators: List[str]) -> Callable:
+    """Wrap `fn` with each of `decorators` in turn, producing one nested closure per
+    decorator. This is the reference behaviour which `_fuse_decorators` reproduces."""
+    for attr in decorators:
+        fn = getattr(ivy, attr)(fn)
+    return fn
+
+
+def _fuse_decorators(fn: Callable, decorators: List[str]) -> Callable:
+    """Wrap `fn` with a single closure which has the combined behaviour of applying
+    each of `decorators` in turn, as done by `_chain_decorators`.
+
+    The arguments are traversed once per call, and in this single pass ivy.Container
+    instances are detected, arrays are converted, integer arrays are promoted and the
+    first array is found for the dtype and device inference. Only the work required by
+    `decorators` is done, which is decided when `fn` is wrapped.
+
+    Parameters
+    ----------
+    fn
+        the function to wrap.
+    decorators
+        the names of the decorators to fuse, ordered as in FN_DECORATORS.
+
+    Returns
+    -------
+    ret
+        the wrapped function, with the attribute of each fused decorator set.
+    """
+    fn_name = fn.__name__
+    nestable = "handle_nestable" in decorators
+    handle_out = "handle_out_argument" in decorators
+    handle_out_in_backend = hasattr(fn, "support_native_out")
+    args_to_native = "inputs_to_native_arrays" in decorators
+    args_to_ivy = "inputs_to_ivy_arrays" in decorators
+    outputs_to_ivy = "outputs_to_ivy_arrays" in decorators
+    ints_to_float = "integer_arrays_to_float" in decorators
+    dtype_inferred = "infer_dtype" in decorators
+    device_inferred = "infer_device" in decorators
+    extract_out = handle_out or args_to_native or args_to_ivy
+
+    def _convert_leaf(x, array_mode):
+        if args_to_ivy:
+            x = ivy.to_ivy(x)
+        if args_to_native and array_mode:
+            x = _to_native_leaf(x)
+        if ints_to_float and _is_array(x) and ivy.is_int_dtype(x.dtype):
+            if ivy.is_ivy_array(x):
+                x = ivy.asarray(x, dtype=ivy.default_float_dtype())
+            else:
+                x = ivy.native_array(x, dtype=ivy.default_float_dtype(as_native=True))
+        return x
+
+    # leaf conversions with and without array mode, or None if nothing is converted
+    converters = dict()
+    for array_mode in (True, False):
+        if args_to_ivy or (args_to_native and array_mode) or ints_to_float:
+            converters[array_mode] = functools.partial(
+                _convert_leaf, array_mode=array_mode
+            )
+        else:
+            converters[array_mode] = None
+
+    def _call(args, kwargs):
+        array_mode = (args_to_native or outputs_to_ivy) and ivy.get_array_mode()
+        check_containers = nestable and ivy.get_nestable_mode()
+        out = kwargs.pop("out", None) if extract_out else None
+        dtype = kwargs.pop("dtype", None) if dtype_inferred else None
+        device = kwargs.pop("device", None) if device_inferred else None
+        find_first = (dtype_inferred and dtype is None) or (
+            device_inferred and device is None
+        )
+        convert = converters[array_mode]
+        new_args, new_kwargs, first_array, container_found = args, kwargs, None, False
+        if check_containers and isinstance(out, ivy.Container):
+            container_found = True
+        elif check_containers or find_first or convert is not None:
+            new_args, new_kwargs, first_array, container_found = _scan_args(
+                args, kwargs, convert, find_first, check_containers
+            )
+        if container_found:
+            # a container was found, so the container version of the function is
+            # called with the arguments as they were passed
+            for k, v in (("out", out), ("dtype", dtype), ("device", device)):
+                if v is not None:
+                    kwargs[k] = v
+            return getattr(ivy.Container, "static_" + fn_name)(*args, **kwargs)
+        args, kwargs = new_args, new_kwargs
+        if dtype_inferred:
+            kwargs["dtype"] = ivy.default_dtype(
+                dtype=dtype, item=first_array, as_native=True
+            )
+        if device_inferred:
+            kwargs["device"] = ivy.default_device(
+                device, item=first_array, as_native=True
+            )
+        if out is not None:
+            if not handle_out:
+                kwargs["out"] = out
+            elif handle_out_in_backend:
+                # the backend writes into the native out array directly, so the
+                # return doesn't need to be converted to an ivy.Array first
+                kwargs["out"] = ivy.to_native(out)
+                if _tracer is None:
+                    ret = fn(*args, **kwargs)
+                else:
+                    ret = _tracer.record(fn, args, kwargs)
+                out.data = ivy.to_native(ret)
+                return out
+        if _tracer is None:
+            ret = fn(*args, **kwargs)
+        else:
+            ret = _tracer.record(fn, args, kwargs)
+        if outputs_to_ivy and array_mode:
+            ret = _outputs_to_ivy(ret)
+        if handle_out and out is not None:
+            return ivy.inplace_update(out, ret)
+        return ret
+
+    if "handle_exceptions" in decorators:
+
+        @functools.wraps(fn)
+        def new_fn(*args, **kwargs):
+            try:
+                return _call(args, kwargs)
+            except (IndexError, ValueError) as e:
+                raise ivy.exceptions.IvyError(fn_name, str(e))
+            except Exception as e:
+                raise ivy.exceptions.IvyBackendException(fn_name, str(e))
+
+    else:
+
+        @functools.wraps(fn)
+        def new_fn(*args, **kwargs):
+            return _call(args, kwargs)
+
+    for attr in decorators:
+        setattr(new_fn, attr, True)
+    return new_fn
+
+
 # Functions #
 
 
@@ -441,8 +690,12 @@ def _wrap_function(key: str, to_wrap: Callable, original: Callable) -> Callable:
         docstring_attr = ["__annotations__", "__doc__"]
         for attr in docstring_attr:
             setattr(to_wrap, attr, getattr(original, attr))
-        # wrap decorators
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        # wrap decorators, fused into a single wrapper
+        decorators = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        if decorators:
+            to_wrap = _fuse_decorators(to_wrap, decorators)
     return to_wrap
@@ -3,6 +3,7 @@
 # global
 import jax
 import jax.lax as jlax
+import jax.numpy as jnp
 import jaxlib
 from jaxlib.xla_extension import Buffer
 from ivy.functional.backends.jax import JaxArray
@@ -55,6 +56,29 @@ def execute_with_gradients(func, xs, retain_grads=False):
     return (y, grads, *rest)
 
 
+def gradient_function(func, retain_grads=False, jit=True):
+    def grad_fn(xs):
+        func_ret = func(xs)
+        if isinstance(func_ret, tuple):
+            y = func_ret[0]
+            rest = func_ret[1:]
+        else:
+            y = func_ret
+            rest = tuple()
+        y = ivy.to_native(y)
+        return jnp.reshape(y, []), (y, ivy.to_native(rest, nested=True))
+
+    grad_fn = jax.value_and_grad(grad_fn, has_aux=True)
+    if jit:
+        grad_fn = jax.jit(grad_fn)
+
+    def callback_fn(xs):
+        (_, (y, rest)), grads = grad_fn(xs)
+        return y, grads, ivy.to_ivy(rest, nested=True)
+
+    return callback_fn
+
+
 def value_and_grad(func):
     grad_fn = lambda xs: ivy.to_native(func(xs))
 
@@ -9,6 +9,8 @@ from typing import Optional, Union, Sequence
 # local
 import ivy
 from ivy.functional.ivy.random import (
+    RNGStream,
+    _rng_stream,
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
@@ -22,6 +24,20 @@ from ivy.functional.backends.jax.device import to_device
 RNG = jax.random.PRNGKey(0)
 
 
+def _key_of(rng, seed=None):
+    """A key drawn from the stream `rng` or the default stream of the thread, or else
+    split from the global key."""
+    rng = _rng_stream(rng, seed)
+    if rng is not None:
+        # a key holds two 32-bit words, which are taken from one 64-bit seed, as
+        # PRNGKey only keeps 32 bits of its seed unless 64-bit types are enabled
+        seed = rng.next_seed(64)
+        return jnp.array([seed >> 32, seed & 0xFFFFFFFF], dtype=jnp.uint32)
+    global RNG
+    RNG, rng_input = jax.random.split(RNG)
+    return rng_input
+
+
 def random_uniform(
     *,
     low: Union[float, JaxArray] = 0.0,
@@ -29,11 +45,11 @@ def random_uniform(
     shape: Optional[Union[ivy.NativeShape, Sequence[int]]] = None,
     device: jaxlib.xla_extension.Device,
     dtype: jnp.dtype,
+    rng: Optional[RNGStream] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     shape = _check_bounds_and_get_shape(low, high, shape)
-    global RNG
-    RNG, rng_input = jax.random.split(RNG)
+    rng_input = _key_of(rng)
     return to_device(
         jax.random.uniform(rng_input, shape, minval=low, maxval=high, dtype=dtype),
         device,
@@ -48,12 +64,12 @@ def random_normal(
     device: jaxlib.xla_extension.Device,
     dtype: jnp.dtype,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
-    global RNG
-    RNG, rng_input = jax.random.split(RNG)
+    rng_input = _key_of(rng, seed)
     if seed is not None:
         jax.random.PRNGKey(seed)
     return (
@@ -76,10 +92,10 @@ def multinomial(
     replace: bool = True,
     device: jaxlib.xla_extension.Device,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    global RNG
-    RNG, rng_input = jax.random.split(RNG)
+    rng_input = _key_of(rng, seed)
     if seed is not None:
         jax.random.PRNGKey(seed)
     if probs is None:
@@ -117,6 +133,7 @@ def randint(
     device: jaxlib.xla_extension.Device,
     dtype: Optional[Union[jnp.dtype, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[JaxArray] = None,
 ) -> JaxArray:
     if not dtype:
@@ -124,8 +141,7 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
-    global RNG
-    RNG, rng_input = jax.random.split(RNG)
+    rng_input = _key_of(rng, seed)
     if seed is not None:
         jax.random.PRNGKey(seed)
     return to_device(jax.random.randint(rng_input, shape, low, high, dtype), device)
@@ -138,10 +154,14 @@ def seed(*, seed_value: int = 0) -> None:
 
 
 def shuffle(
-    x: JaxArray, /, *, seed: Optional[int] = None, out: Optional[JaxArray] = None
+    x: JaxArray,
+    /,
+    *,
+    seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
+    out: Optional[JaxArray] = None,
 ) -> JaxArray:
-    global RNG
-    RNG, rng_input = jax.random.split(RNG)
+    rng_input = _key_of(rng, seed)
     if seed is not None:
         jax.random.PRNGKey(seed)
     return jax.random.shuffle(rng_input, x)
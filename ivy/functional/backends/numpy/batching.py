@@ -0,0 +1,614 @@
+"""Batching transform behind the numpy vmap.
+
+Rather than calling the function once per example, the function is traced once on the
+first example, using the same recorder as `compile`, and each recorded backend function
+is then called once for the whole batch. Batched arrays carry the mapped axis first,
+so elementwise functions only need their operands aligned, reductions and other
+functions taking an axis have it shifted past the batch axis, and matmul broadcasts
+over the batch. Functions without a batching rule, and random functions, which draw
+independently for each example, are called once per example and stacked. The whole
+function is only called once per example when its control flow depends on the mapped
+inputs, when it computes arrays whose shapes depend on their values, such as by
+indexing with a boolean mask, or when it writes to arrays in place.
+
+The function must compute its outputs with ivy functions, as arrays computed by
+calling numpy directly can't be traced, and are treated as constants of the batch.
+"""
+
+# global
+import inspect
+import functools
+import numpy as np
+
+# local
+import ivy
+from ivy import func_wrapper
+from ivy.functional.backends.numpy.compilation import (
+    _Graph,
+    _GuardFailure,
+    _MISSING,
+    _NATIVE_LEAF,
+    _NATIVE_TYPES,
+    _at_path,
+    _fill,
+    _is_random,
+    _leaf_paths,
+    _map_leaves,
+    _rebuild,
+    _record,
+    _same,
+    _signature,
+)
+
+
+# Helpers #
+# --------#
+
+# the number of traces cached per vectorized function, beyond which unseen signatures
+# are mapped with a loop
+_MAX_PLANS = 64
+
+_LOOP = object()
+
+
+class _Unbatchable(Exception):
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def _fn_signature(fn):
+    return inspect.signature(fn)
+
+
+def _shift(axis):
+    """Shift a non-negative axis of an example past the batch axis, negative axes
+    count from the end and are unchanged."""
+    if isinstance(axis, (list, tuple)):
+        return axis.__class__(_shift(a) for a in axis)
+    return axis + 1 if axis >= 0 else axis
+
+
+def _per_example_ndim(x, batched):
+    return np.ndim(x) - (id(x) in batched)
+
+
+def _bind(fn, args, kwargs):
+    bound = _fn_signature(fn).bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound
+
+
+def _call_bound(fn, bound):
+    return fn(*bound.args, **bound.kwargs)
+
+
+def _take(nest, i, batched):
+    """Return `nest` with each batched array replaced by its `i`th example."""
+    if id(nest) in batched:
+        return nest[i, ...]
+    if nest.__class__ in (list, tuple):
+        return nest.__class__(_take(x, i, batched) for x in nest)
+    if nest.__class__ is dict:
+        return {k: _take(v, i, batched) for k, v in nest.items()}
+    return nest
+
+
+def _stack(results):
+    """Stack the leaves of a sequence of equally structured returns."""
+    template = _map_leaves(results[0], lambda x: None if x is None else _NATIVE_LEAF)
+    paths = [p for p, x in _leaf_paths(results[0], (), []) if x is not None]
+    return _rebuild(
+        template,
+        [np.stack([ivy.to_native(_at_path(r, p)) for r in results]) for p in paths],
+    )
+
+
+# Batching Rules #
+# ---------------#
+
+# each rule is called with the arguments of the example function, where the batched
+# arrays have the batch axis first, and returns the batched return, raising
+# _Unbatchable for arguments it doesn't handle
+
+
+def _elementwise(fn, args, kwargs, batched, size):
+    leaves = [
+        x for x in list(args) + list(kwargs.values()) if isinstance(x, np.ndarray)
+    ]
+    ndim = max(_per_example_ndim(x, batched) for x in leaves)
+
+    def _align(x):
+        # batched operands of lower rank broadcast against the trailing axes of the
+        # others, so the batch axis needs to stay in front of all of them
+        if id(x) not in batched or x.ndim - 1 == ndim:
+            return x
+        return x.reshape(x.shape[:1] + (1,) * (ndim + 1 - x.ndim) + x.shape[1:])
+
+    return fn(*[_align(a) for a in args], **{k: _align(v) for k, v in kwargs.items()})
+
+
+def _trailing(fn, args, kwargs, batched, size):
+    # functions of the last two axes, which already broadcast over leading ones
+    if _per_example_ndim(args[0], batched) < 2 or id(args[0]) not in batched:
+        raise _Unbatchable
+    return fn(*args, **kwargs)
+
+
+def _axis_rule(names, none):
+    """Return a rule shifting the axis arguments `names` of a function of one array,
+    where an axis of None means all axes if `none` is "all", is left as is if `none`
+    is "keep", and isn't supported otherwise."""
+
+    def rule(fn, args, kwargs, batched, size):
+        bound = _bind(fn, args, kwargs)
+        x = next(iter(bound.arguments.values()))
+        if id(x) not in batched:
+            raise _Unbatchable
+        for name in names:
+            axis = bound.arguments[name]
+            if axis is None:
+                if none == "keep":
+                    continue
+                if none != "all":
+                    raise _Unbatchable
+                axis = tuple(range(x.ndim - 1))
+            bound.arguments[name] = _shift(axis)
+        return _call_bound(fn, bound)
+
+    return rule
+
+
+def _squeeze(fn, args, kwargs, batched, size):
+    bound = _bind(fn, args, kwargs)
+    x = bound.arguments["x"]
+    if id(x) not in batched:
+        raise _Unbatchable
+    axis = bound.arguments["axis"]
+    if axis is None:
+        axis = tuple(i for i, d in enumerate(x.shape[1:]) if d == 1)
+    bound.arguments["axis"] = _shift(axis)
+    return _call_bound(fn, bound)
+
+
+def _reshape(fn, args, kwargs, batched, size):
+    bound = _bind(fn, args, kwargs)
+    if id(bound.arguments["x"]) not in batched:
+        raise _Unbatchable
+    bound.arguments["shape"] = (size,) + tuple(bound.arguments["shape"])
+    return _call_bound(fn, bound)
+
+
+def _permute_dims(fn, args, kwargs, batched, size):
+    bound = _bind(fn, args, kwargs)
+    x = bound.arguments["x"]
+    if id(x) not in batched:
+        raise _Unbatchable
+    ndim = x.ndim - 1
+    bound.arguments["axes"] = (0,) + tuple(
+        a % ndim + 1 for a in bound.arguments["axes"]
+    )
+    return _call_bound(fn, bound)
+
+
+def _join(fn, args, kwargs, batched, size):
+    # concat and stack, with the arrays not mapped repeated for each example
+    bound = _bind(fn, args, kwargs)
+    xs = next(iter(bound.arguments.values()))
+    if bound.arguments["axis"] is None:
+        raise _Unbatchable
+    bound.arguments[next(iter(bound.arguments))] = [
+        x if id(x) in batched else np.broadcast_to(x, (size,) + np.shape(x)) for x in xs
+    ]
+    bound.arguments["axis"] = _shift(bound.arguments["axis"])
+    return _call_bound(fn, bound)
+
+
+def _get_item(fn, args, kwargs, batched, size):
+    x, query = _bind(fn, args, kwargs).arguments.values()
+    if id(x) not in batched or any(
+        id(q) in batched for _, q in _leaf_paths(query, (), [])
+    ):
+        raise _Unbatchable
+    if not isinstance(query, tuple):
+        query = (query,)
+    return fn(x, (slice(None),) + query)
+
+
+def _matmul(fn, args, kwargs, batched, size):
+    bound = _bind(fn, args, kwargs)
+    x1, x2 = bound.arguments["x1"], bound.arguments["x2"]
+    if bound.arguments["out"] is not None:
+        raise _Unbatchable
+    operands = list()
+    for x, transpose in (
+        (x1, bound.arguments["transpose_a"]),
+        (x2, bound.arguments["transpose_b"]),
+    ):
+        is_batched = id(x) in batched
+        if transpose is True:
+            # the numpy backend reverses all the axes of each example
+            x = (
+                np.transpose(x, (0,) + tuple(range(x.ndim - 1, 0, -1)))
+                if is_batched
+                else np.transpose(x)
+            )
+        operands.append((x, is_batched))
+    (x1, b1), (x2, b2) = operands
+    n1, n2 = x1.ndim - b1, x2.ndim - b2
+    if b1 and n1 == 1:
+        x1 = x1[:, None, :]
+    if b2 and n2 == 1:
+        x2 = x2[..., None]
+    if b1 and b2 and n1 == n2 == 1:
+        return np.asarray(np.matmul(x1, x2)[:, 0, 0])
+    # stacks of matrices broadcast from the right, so the batch axis of the operand
+    # with fewer of them is kept in front with singleton axes
+    r1, r2 = max(n1, 2), max(n2, 2)
+    if b1 and r1 < r2:
+        x1 = x1.reshape(x1.shape[:1] + (1,) * (r2 - r1) + x1.shape[1:])
+    elif b2 and r2 < r1:
+        x2 = x2.reshape(x2.shape[:1] + (1,) * (r1 - r2) + x2.shape[1:])
+    ret = np.matmul(x1, x2)
+    if b1 and n1 == 1:
+        ret = ret[..., 0, :] if n2 > 1 else ret[..., 0]
+    if b2 and n2 == 1:
+        ret = ret[..., 0]
+    return ret
+
+
+def _vecdot(fn, args, kwargs, batched, size):
+    x1, x2 = args[:2]
+    if _per_example_ndim(x1, batched) != 1 or _per_example_ndim(x2, batched) != 1:
+        raise _Unbatchable
+    x1, x2 = ivy.promote_types_of_inputs(x1, x2)
+    return np.einsum("...i,...i->...", x1, x2)
+
+
+_ELEMENTWISE = [
+    "abs",
+    "acos",
+    "acosh",
+    "add",
+    "asin",
+    "asinh",
+    "atan",
+    "atan2",
+    "atanh",
+    "bitwise_and",
+    "bitwise_invert",
+    "bitwise_left_shift",
+    "bitwise_or",
+    "bitwise_right_shift",
+    "bitwise_xor",
+    "ceil",
+    "cos",
+    "cosh",
+    "deg2rad",
+    "divide",
+    "equal",
+    "erf",
+    "exp",
+    "expm1",
+    "floor",
+    "floor_divide",
+    "greater",
+    "greater_equal",
+    "isfinite",
+    "isinf",
+    "isnan",
+    "less",
+    "less_equal",
+    "log",
+    "log10",
+    "log1p",
+    "log2",
+    "logaddexp",
+    "logical_and",
+    "logical_not",
+    "logical_or",
+    "logical_xor",
+    "maximum",
+    "minimum",
+    "multiply",
+    "negative",
+    "not_equal",
+    "positive",
+    "pow",
+    "rad2deg",
+    "reciprocal",
+    "remainder",
+    "round",
+    "sign",
+    "sin",
+    "sinh",
+    "sqrt",
+    "square",
+    "subtract",
+    "tan",
+    "tanh",
+    "trunc",
+    # activations
+    "gelu",
+    "leaky_relu",
+    "relu",
+    "sigmoid",
+    "softplus",
+    # others
+    "astype",
+    "clip",
+    "copy_array",
+    "full_like",
+    "ones_like",
+    "stop_gradient",
+    "where",
+    "zeros_like",
+]
+
+_RULES = dict.fromkeys(_ELEMENTWISE, _elementwise)
+_RULES.update(
+    {
+        "matrix_transpose": _trailing,
+        "tril": _trailing,
+        "triu": _trailing,
+        "matmul": _matmul,
+        "vecdot": _vecdot,
+        "reshape": _reshape,
+        "permute_dims": _permute_dims,
+        "squeeze": _squeeze,
+        "concat": _join,
+        "stack": _join,
+        "get_item": _get_item,
+        "swapaxes": _axis_rule(("axis0", "axis1"), None),
+        "expand_dims": _axis_rule(("axis",), None),
+        "split": _axis_rule(("axis",), None),
+        "unstack": _axis_rule(("axis",), None),
+        "roll": _axis_rule(("axis",), None),
+        "argmax": _axis_rule(("axis",), None),
+        "argmin": _axis_rule(("axis",), None),
+        "argsort": _axis_rule(("axis",), None),
+        "sort": _axis_rule(("axis",), None),
+        "cumsum": _axis_rule(("axis",), None),
+        "cumprod": _axis_rule(("axis",), None),
+        "vector_norm": _axis_rule(("axis",), None),
+        "one_hot": _axis_rule(("axis",), "keep"),
+        "all": _axis_rule(("axis",), "all"),
+        "any": _axis_rule(("axis",), "all"),
+        "flip": _axis_rule(("axis",), "all"),
+        "log_softmax": _axis_rule(("axis",), "all"),
+        "max": _axis_rule(("axis",), "all"),
+        "mean": _axis_rule(("axis",), "all"),
+        "min": _axis_rule(("axis",), "all"),
+        "prod": _axis_rule(("axis",), "all"),
+        "softmax": _axis_rule(("axis",), "all"),
+        "std": _axis_rule(("axis",), "all"),
+        "sum": _axis_rule(("axis",), "all"),
+        "var": _axis_rule(("axis",), "all"),
+    }
+)
+
+
+# functions returning arrays whose shapes depend on the values of their arguments,
+# which the traced function may read as constants
+_DATA_DEPENDENT_SHAPES = {
+    "argwhere",
+    "nonzero",
+    "unique_all",
+    "unique_counts",
+    "unique_inverse",
+    "unique_values",
+}
+
+
+def _has_data_dependent_shape(op, batched, values):
+    if op.fn.__name__ == "get_item":
+        # indexing with a boolean mask
+        return any(
+            s in batched and np.asarray(values[s]).dtype == bool for s in op.in_slots
+        )
+    return op.fn.__name__ in _DATA_DEPENDENT_SHAPES
+
+
+def _loop_rule(fn, args, kwargs, batched, size):
+    return _stack(
+        [fn(*_take(args, i, batched), **_take(kwargs, i, batched)) for i in range(size)]
+    )
+
+
+# Plan #
+# -----#
+
+
+class _Step:
+    """A recorded op, with the rule used to call it for the whole batch, or None if
+    it doesn't depend on the mapped inputs."""
+
+    __slots__ = ("op", "rule", "shapes")
+
+    def __init__(self, op, rule, values):
+        self.op = op
+        self.rule = rule
+        # the shape and dtype of each array returned for one example
+        self.shapes = [
+            (np.shape(values[s]), np.asarray(values[s]).dtype)
+            for _, s, _ in op.out_paths
+        ]
+
+
+class _Plan:
+    """The ops recorded for one example signature, and whether each of their arrays
+    is batched."""
+
+    def __init__(self, tracer, out_slots, out_template, in_batched):
+        self.num_inputs = tracer.num_inputs
+        self.out_slots = out_slots
+        self.out_template = out_template
+        self.in_batched = in_batched
+        self.env = [None] * len(tracer.values)
+        for slot, x in tracer.constants.items():
+            self.env[slot] = x
+        batched = set(i for i, b in enumerate(in_batched) if b)
+        self.steps = list()
+        live = set(map(id, _Graph._eliminate_dead_ops(tracer.ops, out_slots)))
+        for op in tracer.ops:
+            is_batched = _is_random(op.fn) or any(s in batched for s in op.in_slots)
+            if is_batched:
+                if _has_data_dependent_shape(op, batched, tracer.values):
+                    # the shape may have been read even if the array itself is unused
+                    raise _Unbatchable
+                batched.update(s for _, s, _ in op.out_paths)
+            if id(op) not in live:
+                continue
+            rule = None
+            if is_batched:
+                if op.guards:
+                    # control flow which depends on the mapped inputs
+                    raise _Unbatchable
+                rule = (
+                    _loop_rule
+                    if _is_random(op.fn)
+                    else _RULES.get(op.fn.__name__, _loop_rule)
+                )
+            self.steps.append(_Step(op, rule, tracer.values))
+        self.out_batched = [s in batched for s in out_slots]
+
+    def __call__(self, inputs, size):
+        env = self.env[:]
+        env[: self.num_inputs] = inputs
+        # the batched arrays are held until the call returns, keeping their ids unique
+        batched = {id(x): x for x, b in zip(inputs, self.in_batched) if b}
+        for step in self.steps:
+            op = step.op
+            args, kwargs = _fill(op.args, env), _fill(op.kwargs, env)
+            if step.rule is None:
+                ret = op.fn(*args, **kwargs)
+                for path, value in op.guards:
+                    if not _same(_at_path(ret, path), value):
+                        raise _GuardFailure
+            else:
+                ret = self._call_batched(step, args, kwargs, batched, size)
+            for path, slot, is_ivy in op.out_paths:
+                x = _at_path(ret, path)
+                env[slot] = x.data if is_ivy else x
+                if step.rule is not None:
+                    batched[id(env[slot])] = env[slot]
+            for slot in op.free:
+                env[slot] = None
+        outs = list()
+        for slot, is_batched in zip(self.out_slots, self.out_batched):
+            x = env[slot]
+            outs.append(x if is_batched else np.stack([x] * size))
+        return outs
+
+    @staticmethod
+    def _call_batched(step, args, kwargs, batched, size):
+        if step.rule is not _loop_rule:
+            try:
+                ret = step.rule(step.op.fn, args, kwargs, batched, size)
+                if all(
+                    np.shape(x) == (size,) + shape and np.asarray(x).dtype == dtype
+                    for (path, _, is_ivy), (shape, dtype) in zip(
+                        step.op.out_paths, step.shapes
+                    )
+                    for x in [ivy.to_native(_at_path(ret, path))]
+                ):
+                    return ret
+            except Exception:
+                pass
+            # the rule doesn't cover these arguments, so the op is called once per
+            # example from now on
+            step.rule = _loop_rule
+        return _loop_rule(step.op.fn, args, kwargs, batched, size)
+
+
+def _plan(func, examples, in_batched):
+    """Trace `func` on one example and return its plan and return, or _LOOP if it
+    can't be batched."""
+    args = [ivy.Array(x) if isinstance(x, np.ndarray) else x for x in examples]
+    inputs = list()
+    for x in examples:
+        _signature(x, inputs, [])
+    tracer, ret = _record(func, args, {}, inputs)
+    out_template = _map_leaves(ret, lambda x: _NATIVE_LEAF if x is not None else None)
+    out_slots = list()
+    for _, x in _leaf_paths(ret, (), []):
+        if x is None:
+            continue
+        if isinstance(x, ivy.Array):
+            x = x.data
+        slot = tracer.slots.get(id(x))
+        if slot is None or not isinstance(x, _NATIVE_TYPES):
+            # computed outside of the ivy functions, so it can't be batched
+            return _LOOP, ret
+        out_slots.append(slot)
+    if any(op.effect for op in tracer.ops):
+        return _LOOP, ret
+    mapped = [x for x, b in zip(inputs, in_batched) if b]
+    for x in tracer.constants.values():
+        # a view of a mapped input, taken by indexing it with numpy directly
+        if any(np.may_share_memory(x, m) for m in mapped):
+            return _LOOP, ret
+    try:
+        return _Plan(tracer, out_slots, out_template, in_batched), ret
+    except _Unbatchable:
+        return _LOOP, ret
+
+
+# Vectorization #
+# --------------#
+
+
+def _loop(func, args, in_axes, size):
+    """Call `func` once per example and stack the returns."""
+    results = list()
+    for i in range(size):
+        results.append(
+            func(*[a if axis is None else a[i] for a, axis in zip(args, in_axes)])
+        )
+    return _stack(results)
+
+
+def _move_out_axes(ret, out_axes):
+    if not out_axes:
+        return ret
+    return _map_leaves(ret, lambda x: x if x is None else np.moveaxis(x, 0, out_axes))
+
+
+def vectorize(func, args, in_axes, out_axes, plans):
+    """Map `func` over the batch of `args`, whose mapped axes were moved first,
+    caching a plan in `plans` per example signature."""
+    size = next(a.shape[0] for a, axis in zip(args, in_axes) if axis is not None)
+    if func_wrapper._tracer is not None or size == 0:
+        return _move_out_axes(_loop(func, args, in_axes, size), out_axes)
+    examples = [a if axis is None else a[0, ...] for a, axis in zip(args, in_axes)]
+    inputs, in_batched = list(), list()
+    sig = list()
+    for x, axis in zip(examples, in_axes):
+        num_inputs = len(inputs)
+        sig.append(_signature(x, inputs, []))
+        in_batched += [axis is not None] * (len(inputs) - num_inputs)
+    key = (
+        tuple(sig),
+        tuple(in_batched),
+        tuple((np.shape(x), np.asarray(x).dtype) for x in inputs),
+    )
+    try:
+        plan = plans.get(key, _MISSING)
+    except TypeError:
+        # an unhashable argument can't be part of a signature
+        plan = _LOOP
+    if plan is _MISSING and len(plans) < _MAX_PLANS:
+        plan, _ = _plan(func, examples, in_batched)
+        plans[key] = plan
+    if plan is _MISSING or plan is _LOOP:
+        return _move_out_axes(_loop(func, args, in_axes, size), out_axes)
+    batch_inputs = list()
+    for a, axis in zip(args, in_axes):
+        if axis is None:
+            _signature(a, batch_inputs, [])
+        else:
+            batch_inputs.append(a)
+    try:
+        outs = plan(batch_inputs, size)
+    except _GuardFailure:
+        return _move_out_axes(_loop(func, args, in_axes, size), out_axes)
+    return _move_out_axes(_rebuild(plan.out_template, outs), out_axes)
@@ -1,11 +1,763 @@
-"""Collection of Numpy compilation functions."""
+"""Collection of Numpy compilation functions.
+
+Numpy has no compiler of its own, so `compile` traces the function instead. The first
+call for each combination of input shapes and dtypes is run eagerly, while every
+backend function it calls is recorded into a graph. Later calls with the same
+signature replay the graph, calling the numpy backend functions directly with native
+arrays, so none of the ivy wrapping is repeated. While the graph is built, operations
+which only depend on constants are folded, unless the arrays they create are returned
+or written to, operations which don't contribute to the outputs are dropped, and each intermediate array is released as soon as its last
+consumer has run. Intermediate arrays created by functions supporting a native out
+argument are written into a pool of buffers, allocated once and reused by every replay.
+"""
 
 # global
+import threading
+import functools
 from typing import Callable, Any, Union, Sequence, Iterable, Optional
 import logging
+import numpy as np
+
+# local
+import ivy
+from ivy import func_wrapper
+
+
+# Helpers #
+# --------#
+
+# the number of graphs cached per compiled function, beyond which the function is
+# called eagerly for unseen signatures
+_MAX_GRAPHS = 64
+
+_IVY_LEAF = object()
+_NATIVE_LEAF = object()
+_MISSING = object()
+
+_NATIVE_TYPES = (np.ndarray, np.generic)
+
+# functions which only inspect the type, shape, dtype or device of arrays, all of which
+# are fixed by the signature of a graph, so they needn't be recorded
+_QUERIES = {
+    "is_native_array",
+    "is_ivy_array",
+    "is_array",
+    "is_variable",
+    "dtype",
+    "dev",
+    "shape",
+    "get_num_dims",
+}
+
+
+# tracing sets the global tracer of the wrapped functions and patches ivy.Array, so
+# only one function is traced at a time
+_trace_lock = threading.RLock()
+
+
+class _GuardFailure(Exception):
+    pass
+
+
+class _Ref:
+    """A reference to a slot of the graph environment, in place of an array."""
+
+    __slots__ = ("slot", "wrap")
+
+    def __init__(self, slot, wrap):
+        self.slot = slot
+        self.wrap = wrap
+
+
+class _Op:
+    """A recorded call of a backend function."""
+
+    __slots__ = (
+        "fn",
+        "args",
+        "kwargs",
+        "in_slots",
+        "out_paths",
+        "guards",
+        "effect",
+        "free",
+    )
+
+    def __init__(self, fn, args, kwargs, in_slots, out_paths, guards, effect):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.in_slots = in_slots
+        # (path, slot, is_ivy_array) for each array returned
+        self.out_paths = out_paths
+        # (path, value) for each non-array value returned which depends on the inputs
+        self.guards = guards
+        self.effect = effect
+        # the slots which can be released once the op has run
+        self.free = ()
+
+
+def _signature(nest, leaves, holders):
+    """Append the native arrays of `nest` to `leaves`, and the ivy.Array holding each
+    of them or None to `holders`, and return a hashable description of its structure,
+    which includes the non-array leaves."""
+    if isinstance(nest, ivy.Array):
+        leaves.append(nest.data)
+        holders.append(nest)
+        return _IVY_LEAF
+    if isinstance(nest, _NATIVE_TYPES):
+        leaves.append(nest)
+        holders.append(None)
+        return _NATIVE_LEAF
+    if isinstance(nest, (list, tuple)):
+        return nest.__class__, tuple(_signature(x, leaves, holders) for x in nest)
+    if isinstance(nest, dict):
+        return nest.__class__, tuple(
+            (k, _signature(v, leaves, holders)) for k, v in nest.items()
+        )
+    return nest.__class__, nest
+
+
+def _leaf_paths(nest, path, paths):
+    """Append (path, leaf) to `paths` for each leaf of `nest`."""
+    if isinstance(nest, (list, tuple)):
+        for i, x in enumerate(nest):
+            _leaf_paths(x, path + (i,), paths)
+    elif isinstance(nest, dict):
+        for k, v in nest.items():
+            _leaf_paths(v, path + (k,), paths)
+    else:
+        paths.append((path, nest))
+    return paths
+
+
+def _at_path(nest, path):
+    for p in path:
+        nest = nest[p]
+    return nest
+
+
+def _fill(template, env):
+    """Return `template` with each reference replaced by the array it refers to."""
+    if template.__class__ is _Ref:
+        x = env[template.slot]
+        return ivy.Array(x) if template.wrap else x
+    if template.__class__ is list:
+        return [_fill(x, env) for x in template]
+    if template.__class__ is tuple:
+        return tuple(_fill(x, env) for x in template)
+    if template.__class__ is dict:
+        return {k: _fill(v, env) for k, v in template.items()}
+    return template
+
+
+def _map_leaves(nest, fn):
+    """Return `nest` with each leaf replaced by `fn(leaf)`."""
+    if isinstance(nest, ivy.Container):
+        return ivy.Container(
+            {k: _map_leaves(v, fn) for k, v in nest.items()}, **nest._config
+        )
+    if isinstance(nest, dict):
+        return nest.__class__((k, _map_leaves(v, fn)) for k, v in nest.items())
+    if isinstance(nest, tuple) and hasattr(nest, "_fields"):
+        return nest.__class__(*(_map_leaves(x, fn) for x in nest))
+    if isinstance(nest, (list, tuple)):
+        return nest.__class__(_map_leaves(x, fn) for x in nest)
+    return fn(nest)
+
+
+def _strip_arrays(leaf):
+    if isinstance(leaf, ivy.Array):
+        return _IVY_LEAF
+    if isinstance(leaf, _NATIVE_TYPES):
+        return _NATIVE_LEAF
+    return leaf
+
+
+def _rebuild(template, arrays):
+    """Return `template` with its array placeholders replaced by the next of
+    `arrays`."""
+    if template is _NATIVE_LEAF:
+        return arrays[0]
+    if template is _IVY_LEAF:
+        return ivy.Array(arrays[0])
+    arrays = iter(arrays)
+
+    def _fill_leaf(leaf):
+        if leaf is _IVY_LEAF:
+            return ivy.Array(next(arrays))
+        if leaf is _NATIVE_LEAF:
+            return next(arrays)
+        return leaf
+
+    return _map_leaves(template, _fill_leaf)
+
+
+def _has_refs(template):
+    if template.__class__ is _Ref:
+        return True
+    if template.__class__ in (list, tuple):
+        return any(_has_refs(x) for x in template)
+    if template.__class__ is dict:
+        return any(_has_refs(x) for x in template.values())
+    return False
+
+
+def _same(x, y):
+    try:
+        return x.__class__ is y.__class__ and bool(x == y)
+    except Exception:
+        return False
+
+
+def _setitem(x, query, val):
+    x.__setitem__(query, ivy.to_native(val))
+
+
+_setitem.effect = True
+
+
+def _is_query(fn):
+    name = fn.__name__
+    return name in _QUERIES or (name.startswith("is_") and name.endswith("_dtype"))
+
+
+def _is_random(fn):
+    return getattr(fn, "__module__", "").rsplit(".", 1)[-1] == "random"
+
+
+def _has_effect(fn, kwargs):
+    return (
+        getattr(fn, "effect", False)
+        or fn.__name__.startswith("inplace_")
+        or kwargs.get("out", None) is not None
+    )
+
+
+# Tracing #
+# --------#
+
+
+class _Tracer:
+    """Records the backend functions called while a function runs eagerly."""
+
+    def __init__(self, inputs):
+        self._thread_id = threading.get_ident()
+        self._depth = 0
+        self.num_inputs = len(inputs)
+        self.slots = dict()
+        self.values = list()
+        self.constants = dict()
+        # the constants which no recorded function created
+        self.captured = set()
+        self.untraced = False
+        self.dynamic = set()
+        self.ops = list()
+        self.num_folded = 0
+        # the op creating each folded constant, and the folded constants written to
+        self.folded = dict()
+        self.folded_ops = list()
+        self.written = set()
+        for x in inputs:
+            if id(x) not in self.slots:
+                self.slots[id(x)] = len(self.values)
+                self.dynamic.add(len(self.values))
+            self.values.append(x)
+
+    def _slot(self, x):
+        slot = self.slots.get(id(x))
+        if slot is None:
+            # an array which wasn't created by a recorded function, such as the
+            # weights of a module, is captured as a constant
+            slot = self._new_slot(x)
+            self.constants[slot] = x
+            self.captured.add(slot)
+        return slot
+
+    def is_untraced(self, slot):
+        """Whether a captured constant was possibly computed from the inputs, as
+        numpy scalars are the result of a computation, and views of an input are taken
+        by indexing it directly."""
+        if slot not in self.captured:
+            return False
+        x = self.values[slot]
+        return isinstance(x, np.generic) or any(
+            isinstance(i, np.ndarray) and np.may_share_memory(x, i)
+            for i in self.values[: self.num_inputs]
+        )
+
+    def _new_slot(self, x):
+        slot = len(self.values)
+        self.slots[id(x)] = slot
+        # holding on to every array keeps their ids unique for the whole trace
+        self.values.append(x)
+        return slot
+
+    def _template(self, nest, in_slots):
+        if isinstance(nest, ivy.Array):
+            slot = self._slot(nest.data)
+            in_slots.append(slot)
+            return _Ref(slot, True)
+        if isinstance(nest, _NATIVE_TYPES):
+            slot = self._slot(nest)
+            in_slots.append(slot)
+            return _Ref(slot, False)
+        if nest.__class__ in (list, tuple):
+            return nest.__class__(self._template(x, in_slots) for x in nest)
+        if nest.__class__ is dict:
+            return {k: self._template(v, in_slots) for k, v in nest.items()}
+        return nest
+
+    def record(self, fn, args, kwargs):
+        if self._depth or threading.get_ident() != self._thread_id or _is_query(fn):
+            return fn(*args, **kwargs)
+        self._depth += 1
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            self._depth -= 1
+        in_slots = list()
+        args_template = self._template(args, in_slots)
+        kwargs_template = self._template(kwargs, in_slots)
+        effect = _has_effect(fn, kwargs)
+        dynamic = any(s in self.dynamic for s in in_slots)
+        self.untraced = self.untraced or any(self.is_untraced(s) for s in in_slots)
+        if not (dynamic or effect or _is_random(fn)):
+            # the op only depends on constants, so its outputs are constants too
+            self.num_folded += 1
+            out_paths = list()
+            for path, x in _leaf_paths(ret, (), []):
+                is_ivy = isinstance(x, ivy.Array)
+                if is_ivy:
+                    x = x.data
+                if isinstance(x, _NATIVE_TYPES):
+                    slot = self._new_slot(x)
+                    self.constants[slot] = x
+                    out_paths.append((path, slot, is_ivy))
+            op = _Op(fn, args_template, kwargs_template, in_slots, out_paths, [], False)
+            self.folded.update((slot, op) for _, slot, _ in out_paths)
+            self.folded_ops.append(op)
+            return ret
+        if effect:
+            self._mark_written(args, kwargs)
+        out_paths, guards = list(), list()
+        for path, x in _leaf_paths(ret, (), []):
+            is_ivy = isinstance(x, ivy.Array)
+            if is_ivy:
+                x = x.data
+            if isinstance(x, _NATIVE_TYPES):
+                slot = self._new_slot(x)
+                self.dynamic.add(slot)
+                out_paths.append((path, slot, is_ivy))
+            elif x is not None and dynamic:
+                # python values computed from the inputs, such as the result of
+                # ivy.to_scalar, can steer the control flow of the traced function,
+                # so replays check that they are unchanged
+                guards.append((path, x))
+        self.ops.append(
+            _Op(fn, args_template, kwargs_template, in_slots, out_paths, guards, effect)
+        )
+        return ret
+
+    def _mark_written(self, args, kwargs):
+        """Mark the constants sharing memory with the array an op writes to as
+        dynamic, so that the ops reading them afterwards are recorded."""
+        target = kwargs.get("out", None)
+        if target is None and args:
+            target = args[0]
+        if isinstance(target, ivy.Array):
+            target = target.data
+        if not isinstance(target, np.ndarray):
+            return
+        for slot in self.constants:
+            if slot not in self.dynamic and np.may_share_memory(
+                self.values[slot], target
+            ):
+                self.dynamic.add(slot)
+                if slot in self.folded:
+                    self.written.add(slot)
+
+    def unfold(self, slots):
+        """Return the folded ops creating the constants written to or in `slots`,
+        along with those creating their folded arguments, in the order they were
+        called. Their outputs are no longer constants, so that each replay creates
+        them afresh rather than sharing the arrays of the trace."""
+        pending = [s for s in slots if s in self.folded] + list(self.written)
+        unfolded = set()
+        while pending:
+            op = self.folded[pending.pop()]
+            if id(op) not in unfolded:
+                unfolded.add(id(op))
+                pending.extend(s for s in op.in_slots if s in self.folded)
+        ops = [op for op in self.folded_ops if id(op) in unfolded]
+        for op in ops:
+            for _, slot, _ in op.out_paths:
+                del self.constants[slot]
+        self.num_folded -= len(ops)
+        return ops
+
+    def _read(self, fn, x):
+        return self.record(fn, (x.data,), {})
+
+    def patches(self):
+        """Return the ivy.Array methods which read or write array values directly, in
+        versions which are recorded."""
+        return {
+            "__bool__": lambda x: self._read(bool, x),
+            "__float__": lambda x: self._read(float, x),
+            "__int__": lambda x: self._read(int, x),
+            "__setitem__": lambda x, query, val: self.record(
+                _setitem, (x.data, query, val), {}
+            ),
+        }
+
+
+def _record(fn, args, kwargs, inputs):
+    """Call `fn` eagerly while recording it, and return the tracer and the return."""
+    with _trace_lock:
+        tracer = _Tracer(inputs)
+        patches = tracer.patches()
+        originals = {k: ivy.Array.__dict__[k] for k in patches}
+        func_wrapper._tracer = tracer
+        for k, v in patches.items():
+            setattr(ivy.Array, k, v)
+        try:
+            ret = fn(*args, **kwargs)
+        finally:
+            func_wrapper._tracer = None
+            for k, v in originals.items():
+                setattr(ivy.Array, k, v)
+    return tracer, ret
+
+
+def _trace(fn, args, kwargs, inputs, holders, plan_memory=True):
+    """Call `fn` eagerly while recording it, and return the graph and the return."""
+    tracer, ret = _record(fn, args, kwargs, inputs)
+    out_slots, out_template = list(), _map_leaves(ret, _strip_arrays)
+    for _, x in _leaf_paths(ret, (), []):
+        if isinstance(x, ivy.Array):
+            x = x.data
+        if isinstance(x, _NATIVE_TYPES):
+            out_slots.append(tracer._slot(x))
+    # ivy.Array inputs can be given new data, for example by functions writing to them
+    # as their out argument, which replays need to repeat
+    rebinds = [
+        (i, tracer._slot(x.data))
+        for i, x in enumerate(holders)
+        if x is not None and x.data is not inputs[i]
+    ]
+    return _Graph(tracer, out_slots, out_template, rebinds, plan_memory), ret
+
+
+# Graph #
+# ------#
+
+
+class _Graph:
+    """The operations recorded for one signature of a traced function."""
+
+    def __init__(self, tracer, out_slots, out_template, rebinds, plan_memory=True):
+        self.num_inputs = tracer.num_inputs
+        self.out_slots = out_slots
+        self.out_template = out_template
+        self.rebinds = rebinds
+        self.num_slots = len(tracer.values)
+        # the arrays returned or written to can't be shared by the calls, so the ops
+        # creating them are replayed, ahead of the others as they only read constants
+        ops = tracer.unfold(out_slots + [s for _, s in rebinds]) + tracer.ops
+        self.num_folded = tracer.num_folded
+        self.constants = tracer.constants
+        self.ops = self._eliminate_dead_ops(ops, out_slots + [s for _, s in rebinds])
+        self.num_dropped = len(ops) - len(self.ops)
+        self.untraced = self._reads_untraced_values(tracer, out_slots, rebinds)
+        self.replayable = self._guards_precede_effects(self.ops) and not self.untraced
+        self._plan_lifetimes()
+        self._plan_buffers(tracer.values, plan_memory)
+        self._lower()
+
+    @staticmethod
+    def _eliminate_dead_ops(ops, out_slots):
+        live = set(out_slots)
+        kept = list()
+        for op in reversed(ops):
+            if op.effect or op.guards or any(s in live for _, s, _ in op.out_paths):
+                live.update(op.in_slots)
+                kept.append(op)
+        return kept[::-1]
+
+    @staticmethod
+    def _reads_untraced_values(tracer, out_slots, rebinds):
+        """Whether a value returned or held by the inputs, or consumed by an op, was
+        possibly computed from the inputs without a recorded function, for example by
+        operating on a native array with numpy directly. Replays would otherwise
+        return or consume the value of the trace as a constant."""
+        return tracer.untraced or any(
+            tracer.is_untraced(s) for s in out_slots + [s for _, s in rebinds]
+        )
+
+    @staticmethod
+    def _guards_precede_effects(ops):
+        # a failed guard falls back to calling the function eagerly, which would
+        # repeat any side effect already replayed
+        effect_seen = False
+        for op in ops:
+            if op.guards and effect_seen:
+                return False
+            effect_seen = effect_seen or op.effect
+        return True
+
+    def _plan_lifetimes(self):
+        kept = set(range(self.num_inputs)) | set(self.constants) | set(self.out_slots)
+        kept.update(s for _, s in self.rebinds)
+        last_use = dict()
+        for i, op in enumerate(self.ops):
+            for _, slot, _ in op.out_paths:
+                last_use[slot] = i
+            for slot in op.in_slots:
+                last_use[slot] = i
+        free = [list() for _ in self.ops]
+        for slot, i in last_use.items():
+            if slot not in kept:
+                free[i].append(slot)
+        for op, slots in zip(self.ops, free):
+            op.free = tuple(slots)
+        self._kept = kept
+        self._last_use = last_use
+
+    def _plan_buffers(self, values, plan_memory):
+        """Assign the arrays created by ops which can write to an out argument to a
+        pool of buffers, which is allocated once and reused by every replay. A buffer
+        is handed to another op once the array it holds, and every view of that array,
+        has been consumed for the last time.
+
+        The arrays returned, or held by the inputs after the call, are never placed in
+        buffers, as the next replay would overwrite them.
+        """
+        # the slot owning the memory of each slot, which differs for views
+        owner = dict()
+        for op in self.ops:
+            ins = [s for s in op.in_slots if isinstance(values[s], np.ndarray)]
+            for _, slot, _ in op.out_paths:
+                owner[slot] = slot
+                for s in ins:
+                    if np.may_share_memory(values[slot], values[s]):
+                        owner[slot] = owner.get(s, s)
+                        break
+        end, kept = dict(), set()
+        for slot, i in self._last_use.items():
+            o = owner.get(slot, slot)
+            end[o] = max(end.get(o, -1), i)
+        for slot in self._kept:
+            kept.add(owner.get(slot, slot))
+        pool, active, buffers = dict(), list(), list()
+        sizes, pooled = list(), set()
+        for i, op in enumerate(self.ops):
+            for entry in [a for a in active if a[0] < i]:
+                active.remove(entry)
+                pool.setdefault(entry[1], list()).append(entry[2])
+            fresh = [
+                slot
+                for _, slot, _ in op.out_paths
+                if owner[slot] == slot and isinstance(values[slot], _NATIVE_TYPES)
+            ]
+            sizes.append([(slot, values[slot].nbytes) for slot in fresh])
+            if not (
+                plan_memory
+                and getattr(op.fn, "support_native_out", False)
+                and len(op.out_paths) == 1
+                and op.out_paths[0][0] == ()
+                and isinstance(values[op.out_paths[0][1]], np.ndarray)
+                and "out" not in op.kwargs
+                and fresh
+                and fresh[0] not in kept
+            ):
+                continue
+            x = values[fresh[0]]
+            key = (x.shape, x.dtype)
+            if pool.get(key):
+                buffer = pool[key].pop()
+            else:
+                buffer = np.empty(x.shape, x.dtype)
+                buffers.append(buffer)
+            op.kwargs = dict(op.kwargs, out=buffer)
+            pooled.add(fresh[0])
+            active.append((end[fresh[0]], key, buffer))
+        self.buffers = buffers
+        self._lock = threading.Lock() if buffers else None
+        self.memory = self._memory_report(sizes, end, kept, pooled)
+
+    def _memory_report(self, sizes, end, kept, pooled):
+        """The allocations and the peak memory of intermediate arrays per replay, with
+        and without the buffers."""
+        buffer_bytes = sum(b.nbytes for b in self.buffers)
+        peaks = list()
+        for exclude in (set(), pooled):
+            live, peak = dict(), 0
+            for i, op_sizes in enumerate(sizes):
+                live.update((s, n) for s, n in op_sizes if s not in exclude)
+                peak = max(peak, sum(live.values()))
+                for s in [s for s in live if end.get(s, i) <= i and s not in kept]:
+                    del live[s]
+            peaks.append(peak)
+        num_allocations = sum(len(op_sizes) for op_sizes in sizes)
+        return {
+            "allocations_without_buffers": num_allocations,
+            "allocations": num_allocations - len(pooled),
+            "peak_bytes_without_buffers": peaks[0],
+            "peak_bytes": peaks[1] + buffer_bytes,
+            "buffer_bytes": buffer_bytes,
+        }
+
+    def _lower(self):
+        """Turn each op into a function of the environment, with the arguments which
+        don't need rebuilding resolved ahead of time."""
+        self._steps = [_make_step(op) for op in self.ops]
+        self._base_env = [None] * self.num_slots
+        for slot, x in self.constants.items():
+            self._base_env[slot] = x
+
+    def __call__(self, inputs, holders):
+        if self._lock is None:
+            return self._replay(inputs, holders)
+        # the buffers are shared by every replay
+        with self._lock:
+            return self._replay(inputs, holders)
+
+    def _replay(self, inputs, holders):
+        env = self._base_env[:]
+        env[: self.num_inputs] = inputs
+        for step in self._steps:
+            step(env)
+        for i, slot in self.rebinds:
+            holders[i].data = env[slot]
+        return _rebuild(self.out_template, [env[s] for s in self.out_slots])
+
+
+def _make_step(op):
+    fn, free, guards, out_paths = op.fn, op.free, op.guards, op.out_paths
+    args, kwargs = list(op.args), op.kwargs
+    # arrays passed directly are looked up, anything nesting arrays is rebuilt
+    args_refs = [
+        (i, a.slot) for i, a in enumerate(args) if a.__class__ is _Ref and not a.wrap
+    ]
+    args_nests = [
+        (i, a)
+        for i, a in enumerate(args)
+        if _has_refs(a) and not (a.__class__ is _Ref and not a.wrap)
+    ]
+    kwargs_nests = [(k, v) for k, v in kwargs.items() if _has_refs(v)]
+    single_out = len(out_paths) == 1 and out_paths[0][0] == () and not out_paths[0][2]
+
+    def step(env):
+        a = args[:]
+        for i, slot in args_refs:
+            a[i] = env[slot]
+        for i, template in args_nests:
+            a[i] = _fill(template, env)
+        if kwargs_nests:
+            kw = dict(kwargs)
+            for k, template in kwargs_nests:
+                kw[k] = _fill(template, env)
+            ret = fn(*a, **kw)
+        else:
+            ret = fn(*a, **kwargs)
+        if single_out:
+            env[out_paths[0][1]] = ret
+        else:
+            for path, slot, is_ivy in out_paths:
+                x = _at_path(ret, path)
+                env[slot] = x.data if is_ivy else x
+        for path, value in guards:
+            if not _same(_at_path(ret, path), value):
+                raise _GuardFailure
+        for slot in free:
+            env[slot] = None
+
+    return step
+
+
+class _CompiledFunction:
+    """A function which is traced into a graph once per input signature."""
+
+    def __init__(self, fn, static_argnums, static_argnames, plan_memory=True):
+        functools.update_wrapper(self, fn)
+        self._fn = fn
+        self._plan_memory = plan_memory
+        self._static_argnums = frozenset(static_argnums)
+        self._static_argnames = frozenset(static_argnames)
+        self._graphs = dict()
+
+    def _signature(self, args, kwargs, inputs, holders):
+        args_sig = tuple(
+            (a.__class__, a)
+            if i in self._static_argnums
+            else _signature(a, inputs, holders)
+            for i, a in enumerate(args)
+        )
+        kwargs_sig = tuple(
+            (
+                k,
+                (v.__class__, v)
+                if k in self._static_argnames
+                else _signature(v, inputs, holders),
+            )
+            for k, v in sorted(kwargs.items())
+        )
+        ids = [id(x) for x in inputs]
+        aliases = None
+        if len(set(ids)) < len(ids):
+            aliases = tuple(ids.index(i) for i in ids)
+        return (
+            args_sig,
+            kwargs_sig,
+            tuple((x.shape, x.dtype) for x in inputs),
+            aliases,
+        )
+
+    @property
+    def graphs(self):
+        """The graphs traced so far, keyed by input signature."""
+        return self._graphs
+
+    def __call__(self, *args, **kwargs):
+        if func_wrapper._tracer is not None:
+            # called from within another function being traced, which records the
+            # backend calls made
+            return self._fn(*args, **kwargs)
+        inputs, holders = list(), list()
+        key = self._signature(args, kwargs, inputs, holders)
+        try:
+            graph = self._graphs.get(key, _MISSING)
+        except TypeError:
+            # an unhashable argument can't be part of a signature
+            return self._fn(*args, **kwargs)
+        if graph is _MISSING:
+            if len(self._graphs) >= _MAX_GRAPHS:
+                return self._fn(*args, **kwargs)
+            graph, ret = _trace(
+                self._fn, args, kwargs, inputs, holders, self._plan_memory
+            )
+            if not graph.replayable:
+                logging.warning(
+                    "{} {}, so it is always called eagerly with these inputs.".format(
+                        getattr(self._fn, "__name__", self._fn),
+                        "computes values from its inputs outside of the ivy functions"
+                        if graph.untraced
+                        else "reads values computed from its inputs after updating "
+                        "arrays in place",
+                    )
+                )
+                graph = None
+            self._graphs[key] = graph
+            return ret
+        if graph is None:
+            return self._fn(*args, **kwargs)
+        try:
+            return graph(inputs, holders)
+        except _GuardFailure:
+            return self._fn(*args, **kwargs)
 
 
-# noinspection PyUnusedLocal
 def compile(
     func: Callable,
     /,
@@ -15,8 +767,10 @@ def compile(
     static_argnums: Optional[Union[int, Iterable[int]]] = None,
     static_argnames: Optional[Union[str, Iterable[str]]] = None,
 ) -> Callable:
-    logging.warning(
-        "Numpy does not support compiling functions.\n"
-        "Now returning the unmodified function."
+    if isinstance(static_argnums, int):
+        static_argnums = [static_argnums]
+    if isinstance(static_argnames, str):
+        static_argnames = [static_argnames]
+    return _CompiledFunction(
+        func, ivy.default(static_argnums, []), ivy.default(static_argnames, [])
     )
-    return func
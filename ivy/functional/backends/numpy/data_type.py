@@ -16,7 +16,6 @@ ivy_dtype_dict = {
     np.dtype("uint16"): "uint16",
     np.dtype("uint32"): "uint32",
     np.dtype("uint64"): "uint64",
-    np.dtype("bfloat16"): "bfloat16",
     np.dtype("float16"): "float16",
     np.dtype("float32"): "float32",
     np.dtype("float64"): "float64",
@@ -35,6 +34,12 @@ ivy_dtype_dict = {
     np.bool_: "bool",
 }
 
+# numpy only understands bfloat16 once jax or tensorflow has registered it
+try:
+    ivy_dtype_dict[np.dtype("bfloat16")] = "bfloat16"
+except TypeError:
+    pass
+
 native_dtype_dict = {
     "int8": np.dtype("int8"),
     "int16": np.dtype("int16"),
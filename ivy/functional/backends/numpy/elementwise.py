@@ -50,7 +50,7 @@ def add(
     x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     if alpha not in (1, None):
         x2 = multiply(x2, alpha)
-    return np.add(x1, x2)
+    return np.add(x1, x2, out=out)
 
 
 add.support_native_out = True
@@ -605,7 +605,7 @@ def subtract(
     x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     if alpha not in (1, None):
         x2 = multiply(x2, alpha)
-    return np.subtract(x1, x2)
+    return np.subtract(x1, x2, out=out)
 
 
 subtract.support_native_out = True
@@ -11,6 +11,7 @@ from numbers import Number
 # local
 import ivy
 from ivy.functional.backends.numpy.device import _to_device
+from ivy.functional.backends.numpy.batching import vectorize
 
 
 def array_equal(x0: np.ndarray, x1: np.ndarray, /) -> bool:
@@ -313,6 +314,9 @@ def vmap(
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: Optional[int] = 0,
 ) -> Callable:
+    # the batching plans, per signature of one example
+    plans = dict()
+
     @ivy.to_native_arrays_and_back
     def _vmap(*args):
 
@@ -356,37 +360,16 @@ def vmap(
                 in_axes, message="single value in_axes should not be None"
             )
 
-        # Handling None in in_axes by broadcasting the axis_size
-        if isinstance(in_axes, (tuple, list)) and None in in_axes:
-            none_axis_index = list()
-            for index, axis in enumerate(in_axes):
-                if axis is None:
-                    none_axis_index.append(index)
-
-            for none_mapped_axis in none_axis_index:
-                args[none_mapped_axis] = np.broadcast_to(
-                    args[none_mapped_axis],
-                    (tuple(axis_size) + args[none_mapped_axis].shape),
-                )
-
         # set up the axis to be mapped to index zero.
-        if isinstance(in_axes, (tuple, list)):
-            for i in range(len(in_axes)):
-                if in_axes[i] is not None:
-                    args[i] = np.moveaxis(args[i], in_axes[i], 0)
-        elif isinstance(in_axes, int):
-            args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
-
-        if out_axes:
-            res = np.moveaxis(res, 0, out_axes)
-
-        return res
+        if isinstance(in_axes, int):
+            axes = [in_axes] * len(args)
+        else:
+            axes = list(in_axes)
+        for i, axis in enumerate(axes):
+            if axis is not None:
+                args[i] = np.moveaxis(args[i], axis, 0)
+
+        # traced once and called for the whole batch, see batching.py
+        return vectorize(func, args, axes, out_axes, plans)
 
     return _vmap
@@ -39,6 +39,25 @@ def execute_with_gradients(func, xs, retain_grads=False):
     return (y, None, *rest)
 
 
+def gradient_function(func, retain_grads=False, jit=True):
+    logging.warning(
+        "NumPy does not support autograd, "
+        "'gradient_function' returns None in place of function gradients."
+    )
+
+    def callback_fn(xs):
+        func_ret = func(xs)
+        if isinstance(func_ret, tuple):
+            y = func_ret[0]
+            rest = func_ret[1:]
+        else:
+            y = func_ret
+            rest = tuple()
+        return ivy.to_native(y), None, rest
+
+    return callback_fn
+
+
 def value_and_grad(func):
     logging.warning(
         "NumPy does not support autograd, 'value_and_grad' "
@@ -9,13 +9,186 @@ from typing import Union, Tuple, Optional, List
 import ivy
 
 
-def _add_dilations(x, dilations, axis):
-    return np.insert(
+def _dilate(x, dilations):
+    """Insert `dilations - 1` zeros between the elements of each spatial axis of the
+    channel-last input `x`."""
+    dims = len(dilations)
+    spatial = [(x.shape[i + 1] - 1) * dilations[i] + 1 for i in range(dims)]
+    res = np.zeros((x.shape[0], *spatial, x.shape[-1]), dtype=x.dtype)
+    res[(slice(None), *[slice(None, None, d) for d in dilations])] = x
+    return res
+
+
+def _windows(x, filter_shape, strides, dilations, feature_group_count):
+    """Return a strided view of the windows of the padded channel-last input `x`, of
+    shape B x OH x OW x KH x KW x G x I, without copying it. Dilated filters step
+    through `x` with larger strides, rather than being inflated with zeros."""
+    dims = len(filter_shape)
+    out_spatial = [
+        (x.shape[i + 1] - (filter_shape[i] - 1) * dilations[i] - 1) // strides[i] + 1
+        for i in range(dims)
+    ]
+    input_dim = x.shape[-1] // feature_group_count
+    return np.lib.stride_tricks.as_strided(
         x,
-        [i for i in range(1, x.shape[axis])] * (dilations - 1),
-        values=0,
-        axis=axis,
+        (x.shape[0], *out_spatial, *filter_shape, feature_group_count, input_dim),
+        (
+            x.strides[0],
+            *[x.strides[i + 1] * strides[i] for i in range(dims)],
+            *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+            x.strides[-1] * input_dim,
+            x.strides[-1],
+        ),
+        writeable=False,
+    )
+
+
+def _conv(x, filters, strides, padding, dilations, feature_group_count=1):
+    """Convolve the channel-last input `x` with `filters` of shape
+    KH x KW x I x O, for any number of spatial dimensions.
+
+    The windows of `x` are gathered into an im2col matrix per group, which is then
+    multiplied by the flattened filters of the group, so the output channels are only
+    ever materialised in the result. Depthwise convolutions, with one input channel
+    per group, are instead contracted directly over the strided view of the windows.
+    """
+    dims = filters.ndim - 2
+    filter_shape = list(filters.shape[:dims])
+    pad_specific = [
+        ivy.handle_padding(
+            x.shape[i + 1],
+            strides[i],
+            (filter_shape[i] - 1) * dilations[i] + 1,
+            padding,
+        )
+        for i in range(dims)
+    ]
+    if any(pad_specific):
+        x = np.pad(
+            x,
+            [
+                (0, 0),
+                *[(pad // 2, pad - pad // 2) for pad in pad_specific],
+                (0, 0),
+            ],
+            "constant",
+        )
+    # B x OH x OW x KH x KW x G x I
+    windows = _windows(x, filter_shape, strides, dilations, feature_group_count)
+    out_spatial = windows.shape[1 : dims + 1]
+    input_dim = windows.shape[-1]
+    output_dim = filters.shape[-1]
+    # KH x KW x I x G x (O / G)
+    filters = filters.reshape(
+        *filter_shape,
+        input_dim,
+        feature_group_count,
+        output_dim // feature_group_count,
+    )
+    if input_dim == 1 and feature_group_count > 1:
+        out_letters = "bcdefg"[: dims + 1]
+        kernel_letters = "hijklm"[:dims]
+        # B x OH x OW x G x (O / G)
+        res = np.einsum(
+            "{0}{1}zn,{1}nzo->{0}zo".format(out_letters, kernel_letters),
+            windows,
+            filters,
+        )
+        return res.reshape(x.shape[0], *out_spatial, output_dim)
+    # G x (B * OH * OW) x (KH * KW * I), which is the only copy made of the input
+    cols = np.moveaxis(windows, -2, 0).reshape(
+        feature_group_count, -1, int(np.prod(filter_shape)) * input_dim
     )
+    # G x (KH * KW * I) x (O / G)
+    weights = np.moveaxis(
+        filters.reshape(-1, feature_group_count, output_dim // feature_group_count),
+        1,
+        0,
+    )
+    # G x (B * OH * OW) x (O / G)
+    res = np.matmul(cols, weights)
+    return np.moveaxis(res, 0, 1).reshape(x.shape[0], *out_spatial, output_dim)
+
+
+def _conv_transpose(
+    x, filters, strides, padding, dilations, output_shape, feature_group_count=1
+):
+    """Transposed convolution of the channel-last input `x` with `filters` of shape
+    KH x KW x I x O, where `output_shape` is the output spatial shape.
+
+    Each input position is multiplied by the filters of its group in one matrix
+    product, and the products are then scatter-added into the output for each filter
+    position (col2im), so the input is never inflated with zeros. Each group of input
+    channels produces its own O output channels, matching the grouped convolutions of
+    the other backends.
+    """
+    dims = filters.ndim - 2
+    filter_shape = list(filters.shape[:dims])
+    in_spatial = list(x.shape[1:-1])
+    dilated_filter_shape = [(k - 1) * d + 1 for k, d in zip(filter_shape, dilations)]
+    if output_shape is None:
+        output_shape = [
+            ivy.deconv_length(
+                in_spatial[i], strides[i], filter_shape[i], padding, dilations[i]
+            )
+            for i in range(dims)
+        ]
+    input_dim = x.shape[-1] // feature_group_count
+    output_dim = filters.shape[-1]
+    # G x (B * IH * IW) x I
+    x = np.moveaxis(x.reshape(-1, feature_group_count, input_dim), 1, 0)
+    # G x I x (KH * KW * O)
+    weights = np.transpose(
+        filters.reshape(-1, feature_group_count, input_dim, output_dim), (1, 2, 0, 3)
+    ).reshape(feature_group_count, input_dim, -1)
+    # G x B x IH x IW x KH x KW x O
+    cols = np.matmul(x, weights).reshape(
+        feature_group_count, -1, *in_spatial, *filter_shape, output_dim
+    )
+    # the untrimmed output, B x FH x FW x G x O
+    full_spatial = [
+        (in_spatial[i] - 1) * strides[i] + dilated_filter_shape[i] for i in range(dims)
+    ]
+    res = np.zeros(
+        (cols.shape[1], *full_spatial, feature_group_count, output_dim),
+        dtype=cols.dtype,
+    )
+    for k in np.ndindex(*filter_shape):
+        res[
+            (
+                slice(None),
+                *[
+                    slice(
+                        k[i] * dilations[i],
+                        k[i] * dilations[i] + (in_spatial[i] - 1) * strides[i] + 1,
+                        strides[i],
+                    )
+                    for i in range(dims)
+                ],
+            )
+        ] += np.moveaxis(cols[(Ellipsis, *k, slice(None))], 0, -2)
+    res = res.reshape(*res.shape[:-2], -1)
+    # trim the padding from the start of each axis, and fill any remainder of the
+    # requested output shape with zeros
+    pad_specific = [
+        ivy.handle_padding(
+            output_shape[i], strides[i], dilated_filter_shape[i], padding
+        )
+        for i in range(dims)
+    ]
+    res = res[
+        (
+            slice(None),
+            *[
+                slice(pad // 2, pad // 2 + size)
+                for pad, size in zip(pad_specific, output_shape)
+            ],
+        )
+    ]
+    extra_pad = [size - res.shape[i + 1] for i, size in enumerate(output_shape)]
+    if any(extra_pad):
+        res = np.pad(res, [(0, 0), *[(0, pad) for pad in extra_pad], (0, 0)])
+    return res
 
 
 def conv1d(
@@ -35,20 +208,7 @@ def conv1d(
         dilations = dilations[0]
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
-    x_shape = (1,) + x.shape
-    filter_shape = (1,) + filters.shape
-    x_strides = (x.strides[0],) + x.strides
-    filter_strides = (filters.strides[0],) + filters.strides
-    x = np.lib.stride_tricks.as_strided(x, shape=x_shape, strides=x_strides)
-    filters = np.lib.stride_tricks.as_strided(
-        filters, shape=filter_shape, strides=filter_strides
-    )
-    x = np.transpose(x, (1, 0, 2, 3))
-    res = conv2d(x, filters, strides, padding, data_format="NHWC", dilations=dilations)
-    res = np.transpose(res, (1, 0, 2, 3))
-    res = np.lib.stride_tricks.as_strided(
-        res, shape=res.shape[1:], strides=res.strides[1:]
-    )
+    res = _conv(x, filters, [strides], padding, [dilations])
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
     return res
@@ -72,33 +232,9 @@ def conv1d_transpose(
         dilations = dilations[0]
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
-    if output_shape is not None:
-        if len(output_shape) == 1:
-            output_shape = [1, x.shape[0], output_shape[0], x.shape[-1]]
-        else:
-            output_shape = [1] + output_shape
-    x_shape = (1,) + x.shape
-    filter_shape = (1,) + filters.shape
-    x_strides = (x.strides[0],) + x.strides
-    filter_strides = (filters.strides[0],) + filters.strides
-    x = np.lib.stride_tricks.as_strided(x, shape=x_shape, strides=x_strides)
-    filters = np.lib.stride_tricks.as_strided(
-        filters, shape=filter_shape, strides=filter_strides
-    )
-    x = np.transpose(x, (1, 0, 2, 3))
-    res = conv2d_transpose(
-        x,
-        filters,
-        strides,
-        padding,
-        output_shape=output_shape,
-        data_format="NHWC",
-        dilations=dilations,
-    )
-    res = np.transpose(res, (1, 0, 2, 3))
-    res = np.lib.stride_tricks.as_strided(
-        res, shape=res.shape[1:], strides=res.strides[1:]
-    )
+    if output_shape is not None and len(output_shape) != 1:
+        output_shape = output_shape[1:-1]
+    res = _conv_transpose(x, filters, [strides], padding, [dilations], output_shape)
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
     return res
@@ -125,58 +261,9 @@ def conv2d(
     elif len(dilations) == 1:
         dilations = [dilations[0]] * 2
 
-    # adding dilations
-    if dilations[1] > 1:
-        filters = _add_dilations(filters, dilations[1], axis=1)
-    if dilations[0] > 1:
-        filters = _add_dilations(filters, dilations[0], axis=0)
-
-    filter_shape = list(filters.shape[0:2])
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
-
-    x_shape = list(x.shape[1:3])
-    pad_h = ivy.handle_padding(x_shape[0], strides[0], filter_shape[0], padding)
-    pad_w = ivy.handle_padding(x_shape[1], strides[1], filter_shape[1], padding)
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[1],
-        x.strides[2] * strides[0],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides, padding, dilations)
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
     return res
@@ -199,52 +286,10 @@ def conv2d_transpose(
 
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
+    if output_shape is not None and len(output_shape) != 2:
+        output_shape = output_shape[1:-1]
 
-    if output_shape is None:
-        new_h = ivy.deconv_length(
-            x.shape[1], strides[0], filters.shape[0], padding, dilations[0]
-        )
-        new_w = ivy.deconv_length(
-            x.shape[2], strides[1], filters.shape[1], padding, dilations[1]
-        )
-        output_shape = [x.shape[0], new_h, new_w, filters.shape[-1]]
-    elif len(output_shape) == 2:
-        output_shape = [x.shape[0]] + output_shape + [filters.shape[-1]]
-    if strides[1] > 1:
-        x = _add_dilations(x, strides[1], axis=2)
-    if strides[0] > 1:
-        x = _add_dilations(x, strides[0], axis=1)
-
-    if dilations[1] > 1:
-        filters = _add_dilations(filters, dilations[1], axis=1)
-    if dilations[0] > 1:
-        filters = _add_dilations(filters, dilations[0], axis=0)
-
-    pad_h = ivy.handle_padding(output_shape[1], strides[0], filters.shape[0], padding)
-    pad_w = ivy.handle_padding(output_shape[2], strides[1], filters.shape[1], padding)
-
-    extra_h = max(0, output_shape[1] - (x.shape[1] + filters.shape[0] - 1 - pad_h))
-    extra_w = max(0, output_shape[2] - (x.shape[2] + filters.shape[1] - 1 - pad_w))
-    pad_h_top = filters.shape[0] - 1 - (pad_h // 2)
-    pad_h_bot = filters.shape[0] - 1 - (pad_h - pad_h // 2)
-    pad_w_left = filters.shape[1] - 1 - (pad_w // 2)
-    pad_w_right = filters.shape[1] - 1 - (pad_w - pad_w // 2)
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_h_top, pad_h_bot + extra_h),
-            (pad_w_left, pad_w_right + extra_w),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x = np.flip(x, (1, 2))
-    res = np.flip(
-        conv2d(x, filters, 1, "VALID", data_format="NHWC", dilations=1),
-        (1, 2),
-    )
+    res = _conv_transpose(x, filters, strides, padding, dilations, output_shape)
     if data_format == "NCHW":
         res = np.transpose(res, (0, 3, 1, 2))
     return res
@@ -264,37 +309,16 @@ def depthwise_conv2d(
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
 
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
-    depth = x.shape[0]
-    filters = np.transpose(filters, (2, 0, 1))
-    x = np.expand_dims(x, -1)
-    filters = np.expand_dims(filters, (-1, -2))
-    x_shape = x[0].shape
-    filter_shape = filters[0].shape
-    filter_h = filter_shape[0] + (filter_shape[0] - 1) * (dilations[0] - 1)
-    filter_w = filter_shape[1] + (filter_shape[1] - 1) * (dilations[1] - 1)
-    if padding == "VALID":
-        out_height = np.ceil(float(x_shape[1] - filter_h + 1) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2] - filter_w + 1) / float(strides[1]))
-    else:
-        out_height = np.ceil(float(x_shape[1]) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2]) / float(strides[1]))
-    if data_format == "NHWC":
-        outputs = np.empty([x_shape[0], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x_shape[0], 0, int(out_height), int(out_width)], x.dtype)
-    for i in range(depth):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
+    # a grouped convolution with one group per channel
+    filters = np.expand_dims(filters, -2)
+    res = _conv(
+        x, filters, strides, padding, dilations, feature_group_count=x.shape[-1]
+    )
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -314,67 +338,9 @@ def conv3d(
     if isinstance(dilations, int):
         dilations = [dilations] * 3
 
-    # adding dilations
-    if dilations[1] > 1:
-        filters = _add_dilations(filters, dilations[1], axis=1)
-    if dilations[0] > 1:
-        filters = _add_dilations(filters, dilations[0], axis=0)
-    if dilations[2] > 1:
-        filters = _add_dilations(filters, dilations[2], axis=2)
-
-    filter_shape = list(filters.shape[0:3])
-
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
-
-    x_shape = list(x.shape[1:4])
-    pad_d = ivy.handle_padding(x_shape[0], strides[0], filter_shape[0], padding)
-    pad_h = ivy.handle_padding(x_shape[1], strides[1], filter_shape[1], padding)
-    pad_w = ivy.handle_padding(x_shape[2], strides[2], filter_shape[2], padding)
-
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_d // 2, pad_d - pad_d // 2),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "constant",
-    )
-
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[2],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[0],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv(x, filters, strides, padding, dilations)
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
     return res
@@ -396,69 +362,10 @@ def conv3d_transpose(
         x = np.transpose(x, (0, 2, 3, 4, 1))
     strides = [strides] * 3 if isinstance(strides, int) else strides
     dilations = [dilations] * 3 if isinstance(dilations, int) else dilations
-    if output_shape is None:
-        new_d = ivy.deconv_length(
-            x.shape[1], strides[0], filters.shape[0], padding, dilations[0]
-        )
-        new_h = ivy.deconv_length(
-            x.shape[2], strides[1], filters.shape[1], padding, dilations[1]
-        )
-        new_w = ivy.deconv_length(
-            x.shape[3], strides[2], filters.shape[2], padding, dilations[2]
-        )
-        output_shape = [x.shape[0], new_d, new_h, new_w, filters.shape[-1]]
-    elif len(output_shape) == 3:
-        output_shape = [x.shape[0]] + output_shape + [filters.shape[-1]]
-
-    if strides[2] > 1:
-        x = _add_dilations(x, strides[2], axis=3)
-    if strides[1] > 1:
-        x = _add_dilations(x, strides[1], axis=2)
-    if strides[0] > 1:
-        x = _add_dilations(x, strides[0], axis=1)
-
-    if dilations[2] > 1:
-        filters = _add_dilations(filters, dilations[2], axis=2)
-    if dilations[1] > 1:
-        filters = _add_dilations(filters, dilations[1], axis=1)
-    if dilations[0] > 1:
-        filters = _add_dilations(filters, dilations[0], axis=0)
-
-    pad_d = ivy.handle_padding(output_shape[1], strides[0], filters.shape[0], padding)
-    pad_h = ivy.handle_padding(output_shape[2], strides[1], filters.shape[1], padding)
-    pad_w = ivy.handle_padding(output_shape[3], strides[2], filters.shape[2], padding)
-    extra_d = max(0, output_shape[1] - (x.shape[1] + filters.shape[0] - 1 - pad_d))
-    extra_h = max(0, output_shape[2] - (x.shape[2] + filters.shape[1] - 1 - pad_h))
-    extra_w = max(0, output_shape[3] - (x.shape[3] + filters.shape[2] - 1 - pad_w))
-    pad_d_top = filters.shape[0] - 1 - (pad_d // 2)
-    pad_d_bot = filters.shape[0] - 1 - (pad_d - pad_d // 2)
-    pad_h_top = filters.shape[1] - 1 - (pad_h // 2)
-    pad_h_bot = filters.shape[1] - 1 - (pad_h - pad_h // 2)
-    pad_w_left = filters.shape[2] - 1 - (pad_w // 2)
-    pad_w_right = filters.shape[2] - 1 - (pad_w - pad_w // 2)
-
-    if filters.shape[0] == 1:
-        pad_d_top, pad_d_bot = pad_d_bot, pad_d_top
-    if filters.shape[1] == 1:
-        pad_h_top, pad_h_bot = pad_h_bot, pad_h_top
-    if filters.shape[2] == 1:
-        pad_w_left, pad_w_right = pad_w_right, pad_w_left
-    x = np.pad(
-        x,
-        [
-            (0, 0),
-            (pad_d_top, pad_d_bot + extra_d),
-            (pad_h_top, pad_h_bot + extra_h),
-            (pad_w_left, pad_w_right + extra_w),
-            (0, 0),
-        ],
-        "constant",
-    )
-    x = np.flip(x, (1, 2, 3))
-    res = np.flip(
-        conv3d(x, filters, 1, "VALID", data_format="NDHWC", dilations=1),
-        (1, 2, 3),
-    )
+    if output_shape is not None and len(output_shape) != 3:
+        output_shape = output_shape[1:-1]
+
+    res = _conv_transpose(x, filters, strides, padding, dilations, output_shape)
     if data_format == "NCDHW":
         res = np.transpose(res, (0, 4, 1, 2, 3))
     return res
@@ -487,71 +394,17 @@ def conv_general_dilated(
     if data_format == "channel_first":
         x = np.transpose(x, (0, *range(2, dims + 2), 1))
 
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
-        if x_dilations[j] > 1:
-            x = _add_dilations(x, x_dilations[j], axis=j + 1)
-
-    filter_shape = list(filters.shape[0:dims])
+    if any(d > 1 for d in x_dilations):
+        x = _dilate(x, x_dilations)
 
-    x_shape = list(x.shape[1 : dims + 1])
-    pad_specific = [
-        ivy.handle_padding(x_shape[i], strides[i], filter_shape[i], padding)
-        for i in range(dims)
-    ]
-    pad_list = [
-        (pad_specific[i] // 2, pad_specific[i] - pad_specific[i] // 2)
-        for i in range(dims)
-    ]
-    x = np.pad(
+    res = _conv(
         x,
-        [
-            (0, 0),
-            *pad_list,
-            (0, 0),
-        ],
-        "constant",
+        filters,
+        strides,
+        padding,
+        dilations,
+        feature_group_count=feature_group_count,
     )
-    x_shape = x.shape
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[dims - i] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
 
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
@@ -572,76 +425,79 @@ def conv_general_transpose(
     feature_group_count: int = 1,
     out: np.ndarray = None,
 ) -> np.ndarray:
-
     if data_format == "channel_first":
         x = np.transpose(x, (0, *range(2, dims + 2), 1))
     strides = [strides] * dims if isinstance(strides, int) else strides
     dilations = [dilations] * dims if isinstance(dilations, int) else dilations
-    if output_shape is None:
-        new_shape = [
-            ivy.deconv_length(
-                x.shape[i + 1], strides[i], filters.shape[i], padding, dilations[i]
-            )
-            for i in range(dims)
-        ]
-        output_shape = [x.shape[0], *new_shape, filters.shape[-1]]
-    elif len(output_shape) == dims:
-        output_shape = [x.shape[0]] + output_shape + [filters.shape[-1]]
-
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
-        if strides[j] > 1:
-            x = _add_dilations(x, strides[j], axis=j + 1)
+    if output_shape is not None and len(output_shape) != dims:
+        output_shape = output_shape[1:-1]
 
-    pad_specific = [
-        ivy.handle_padding(output_shape[i + 1], strides[i], filters.shape[i], padding)
-        for i in range(dims)
-    ]
-    extra_pad = [
-        max(
-            0,
-            output_shape[i + 1]
-            - (x.shape[i + 1] + filters.shape[i] - 1 - pad_specific[i]),
-        )
-        for i in range(dims)
-    ]
-    pad_top = [filters.shape[i] - 1 - (pad_specific[i] // 2) for i in range(dims)]
-    pad_bot = [
-        filters.shape[i] - 1 - (pad_specific[i] - pad_specific[i] // 2) + extra_pad[i]
-        for i in range(dims)
-    ]
-    pad_list = [(pad_top[i], pad_bot[i]) for i in range(dims)]
-    x = np.pad(
+    res = _conv_transpose(
         x,
-        [
-            (0, 0),
-            *pad_list,
-            (0, 0),
-        ],
-        "constant",
-    )
-    x = np.flip(x, (*range(1, dims + 1),))
-    res = np.concatenate(
-        [
-            np.flip(
-                conv_general_dilated(
-                    x[..., j : j + filters.shape[-2] // feature_group_count],
-                    filters[..., j : j + filters.shape[-2] // feature_group_count, :],
-                    1,
-                    "VALID",
-                    dims=dims,
-                    data_format=ivy.get_x_data_format(dims, "channel_last"),
-                    dilations=1,
-                ),
-                (*range(1, dims + 1),),
-            )
-            for j in range(
-                0, filters.shape[-2], filters.shape[-2] // feature_group_count
-            )
-        ],
-        axis=-1,
+        filters,
+        strides,
+        padding,
+        dilations,
+        output_shape,
+        feature_group_count=feature_group_count,
     )
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def _sigmoid_inplace(x):
+    np.negative(x, out=x)
+    np.exp(x, out=x)
+    x += 1
+    np.reciprocal(x, out=x)
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    batch_shape = x.shape[:-2]
+    timesteps = x.shape[-2]
+    out_channels = init_h.shape[-1]
+
+    # input kernel for all timesteps at once, with both biases folded in
+    Wi_x = np.matmul(x, kernel)
+    if bias is not None:
+        Wi_x += bias
+    if recurrent_bias is not None:
+        Wi_x += recurrent_bias
+    dtype = np.result_type(Wi_x, init_h, init_c, recurrent_kernel)
+    state_shape = batch_shape + (out_channels,)
+
+    # the gates are computed in place in one buffer, and the hidden states are
+    # written straight into the output
+    gates = np.empty(batch_shape + (4 * out_channels,), dtype=dtype)
+    in_forget = gates[..., : 2 * out_channels]
+    cell = gates[..., 2 * out_channels : 3 * out_channels]
+    output = gates[..., 3 * out_channels :]
+    hts = np.empty(batch_shape + (timesteps, out_channels), dtype=dtype)
+    ht = np.broadcast_to(init_h, state_shape)
+    ct = np.broadcast_to(init_c, state_shape).astype(dtype)
+
+    for t in range(timesteps):
+        np.matmul(ht, recurrent_kernel, out=gates)
+        gates += Wi_x[..., t, :]
+        _sigmoid_inplace(in_forget)
+        _sigmoid_inplace(output)
+        np.tanh(cell, out=cell)
+        ct *= gates[..., out_channels : 2 * out_channels]
+        cell *= gates[..., :out_channels]
+        ct += cell
+        ht = hts[..., t, :]
+        np.tanh(ct, out=ht)
+        ht *= output
+
+    return hts, ct
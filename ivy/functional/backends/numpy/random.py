@@ -7,11 +7,38 @@ from typing import Optional, Union, Sequence
 # local
 import ivy
 from ivy.functional.ivy.random import (
+    RNGStream,
+    _rng_stream,
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
 )
 
+# generator of the samples, which draws floats natively in single precision, rather
+# than casting double precision draws
+_generator = np.random.default_rng()
+
+
+def _reseed(seed):
+    global _generator
+    np.random.seed(seed)
+    _generator = np.random.default_rng(seed)
+
+
+def _generator_of(rng, seed=None):
+    """The generator to draw from, which is the generator of the stream `rng` or of
+    the default stream of the thread, rather than the generator shared by all
+    threads."""
+    rng = _rng_stream(rng, seed)
+    return _generator if rng is None else rng.generator
+
+
+def _draw_dtype(dtype):
+    """The float dtype to draw samples of `dtype` in."""
+    dtype = np.dtype(dtype)
+    return dtype if dtype in (np.float32, np.float64) else np.dtype(np.float32)
+
+
 # Extra #
 # ------#
 
@@ -23,10 +50,17 @@ def random_uniform(
     shape: Optional[Union[ivy.NativeShape, Sequence[int]]] = None,
     dtype: np.dtype,
     device: str,
+    rng: Optional[RNGStream] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     shape = _check_bounds_and_get_shape(low, high, shape)
-    return np.asarray(np.random.uniform(low, high, shape), dtype=dtype)
+    draw_dtype = _draw_dtype(dtype)
+    low = np.asarray(low, draw_dtype)
+    high = np.asarray(high, draw_dtype)
+    ret = _generator_of(rng).random(shape, dtype=draw_dtype)
+    ret *= high - low
+    ret += low
+    return np.asarray(ret, dtype=dtype)
 
 
 def random_normal(
@@ -37,13 +71,60 @@ def random_normal(
     device: str,
     dtype: np.dtype,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
     if seed is not None:
-        np.random.seed(seed)
-    return np.asarray(np.random.normal(mean, std, shape), dtype=dtype)
+        _reseed(seed)
+    draw_dtype = _draw_dtype(dtype)
+    ret = _generator_of(rng, seed).standard_normal(shape, dtype=draw_dtype)
+    ret *= np.asarray(std, draw_dtype)
+    ret += np.asarray(mean, draw_dtype)
+    return np.asarray(ret, dtype=dtype)
+
+
+def _multinomial_with_replacement(generator, probs, num_samples):
+    """Draw `num_samples` classes of each row of `probs` by inverting the cumulative
+    distribution. The cumulative sum runs over all the rows at once, and each draw is
+    scaled into the range of its row, so that all the draws are searched at once."""
+    num_rows, num_classes = probs.shape
+    cdf = np.cumsum(probs.reshape(-1))
+    row_ends = cdf[num_classes - 1 :: num_classes]
+    row_starts = np.concatenate([[0.0], row_ends[:-1]])
+    u = generator.random((num_rows, num_samples))
+    u *= (row_ends - row_starts)[:, None]
+    u += row_starts[:, None]
+    samples = np.searchsorted(cdf, u.reshape(-1), side="right").reshape(u.shape)
+    samples -= num_classes * np.arange(num_rows)[:, None]
+    # rounding may carry a draw past the last class with a non-zero probability
+    over = samples >= num_classes
+    if np.any(over):
+        rows = np.nonzero(over)[0]
+        samples[over] = num_classes - 1 - np.argmax(probs[rows, ::-1] > 0, -1)
+    return samples
+
+
+def _multinomial_without_replacement(generator, probs, num_samples):
+    """Draw `num_samples` distinct classes of each row of `probs`, as the classes
+    with the largest keys p / e, where e is exponentially distributed. Sorted by
+    decreasing key, they are distributed as successive draws without replacement."""
+    num_classes = probs.shape[-1]
+    ivy.assertions.check_less(
+        num_samples,
+        np.min(np.sum(probs > 0, -1)),
+        allow_equal=True,
+        message="fewer non-zero probabilities than samples to draw without "
+        "replacement",
+    )
+    if num_samples == 0:
+        return np.zeros((probs.shape[0], 0), dtype="int64")
+    keys = generator.standard_exponential(probs.shape)
+    np.divide(probs, keys, out=keys)
+    samples = np.argpartition(keys, num_classes - num_samples, -1)[:, -num_samples:]
+    order = np.argsort(-np.take_along_axis(keys, samples, -1), -1, kind="stable")
+    return np.take_along_axis(samples, order, -1)
 
 
 def multinomial(
@@ -56,31 +137,31 @@ def multinomial(
     replace: bool = True,
     device: str,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     if seed is not None:
-        np.random.seed(seed)
+        _reseed(seed)
+    generator = _generator_of(rng, seed)
     if probs is None:
-        probs = (
-            np.ones(
-                (
-                    batch_size,
-                    population_size,
-                )
-            )
-            / population_size
-        )
+        probs = np.ones((batch_size, population_size)) / population_size
     orig_probs_shape = list(probs.shape)
-    num_classes = orig_probs_shape[-1]
-    probs_flat = np.reshape(probs, (-1, orig_probs_shape[-1]))
-    probs_flat = probs_flat / np.sum(probs_flat, -1, keepdims=True, dtype="float64")
-    probs_stack = np.split(probs_flat, probs_flat.shape[0])
-    samples_stack = [
-        np.random.choice(num_classes, num_samples, replace, p=prob[0])
-        for prob in probs_stack
-    ]
-    samples_flat = np.stack(samples_stack, out=out)
-    return np.asarray(np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples]))
+    probs_flat = np.asarray(
+        np.reshape(probs, (-1, orig_probs_shape[-1])), dtype="float64"
+    )
+    # the rows share one cumulative sum, so each is normalized for a row of large
+    # probabilities not to swamp the resolution of the rows after it
+    probs_flat = probs_flat / np.sum(probs_flat, -1, keepdims=True)
+    if replace:
+        samples_flat = _multinomial_with_replacement(generator, probs_flat, num_samples)
+    else:
+        samples_flat = _multinomial_without_replacement(
+            generator, probs_flat, num_samples
+        )
+    ret = np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples])
+    if ivy.exists(out):
+        return ivy.inplace_update(out, ret)
+    return ret
 
 
 multinomial.support_native_out = True
@@ -95,6 +176,7 @@ def randint(
     device: str,
     dtype: Optional[Union[np.dtype, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     if not dtype:
@@ -103,17 +185,22 @@ def randint(
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
     if seed is not None:
-        np.random.seed(seed)
-    return np.random.randint(low, high, shape, dtype=dtype)
+        _reseed(seed)
+    return np.asarray(_generator_of(rng, seed).integers(low, high, shape, dtype=dtype))
 
 
 def seed(*, seed_value: int = 0) -> None:
-    np.random.seed(seed_value)
+    _reseed(seed_value)
 
 
 def shuffle(
-    x: np.ndarray, /, *, seed: Optional[int] = None, out: Optional[np.ndarray] = None
+    x: np.ndarray,
+    /,
+    *,
+    seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     if seed is not None:
-        np.random.seed(seed)
-    return np.random.permutation(x)
+        _reseed(seed)
+    return _generator_of(rng, seed).permutation(x)
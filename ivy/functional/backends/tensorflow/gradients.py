@@ -51,6 +51,31 @@ def execute_with_gradients(func, xs, retain_grads=False):
     return (y, grads, *rest)
 
 
+def gradient_function(func, retain_grads=False, jit=True):
+    def callback_fn(xs):
+        with tf.GradientTape(
+            persistent=retain_grads, watch_accessed_variables=False
+        ) as tape:
+            tape.watch(xs)
+            func_ret = func(xs)
+        if isinstance(func_ret, tuple):
+            y = func_ret[0]
+            rest = func_ret[1:]
+        else:
+            y = func_ret
+            rest = tuple()
+        y = ivy.to_native(y)
+        grads = [
+            tf.zeros_like(x) if g is None else g
+            for x, g in zip(xs, tape.gradient(y, xs))
+        ]
+        if not retain_grads:
+            y = tf.stop_gradient(y)
+        return y, grads, rest
+
+    return callback_fn
+
+
 def value_and_grad(func):
     def grad_fn(xs):
         grads = ivy.nested_map(xs, lambda x: ivy.zeros_like(x), include_derived=True)
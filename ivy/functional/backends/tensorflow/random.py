@@ -10,6 +10,8 @@ from typing import Optional, Union, Sequence
 # local
 import ivy
 from ivy.functional.ivy.random import (
+    RNGStream,
+    _rng_stream,
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
@@ -19,6 +21,15 @@ from ivy.functional.ivy.random import (
 # ------#
 
 
+def _stateless_seed(rng, seed=None):
+    """A seed of the stateless random ops drawn from the stream `rng` or the default
+    stream of the thread, or None to draw from the global random state."""
+    rng = _rng_stream(rng, seed)
+    if rng is None:
+        return None
+    return [rng.next_seed(), rng.next_seed()]
+
+
 def random_uniform(
     *,
     low: Union[float, tf.Tensor, tf.Variable] = 0.0,
@@ -26,12 +37,18 @@ def random_uniform(
     shape: Optional[Union[ivy.NativeShape, Sequence[int]]] = None,
     dtype: DType,
     device: str,
+    rng: Optional[RNGStream] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     shape = _check_bounds_and_get_shape(low, high, shape)
     low = tf.cast(low, dtype)
     high = tf.cast(high, dtype)
+    stateless_seed = _stateless_seed(rng)
     with tf.device(device):
+        if stateless_seed is not None:
+            return tf.random.stateless_uniform(
+                shape, stateless_seed, low, high, dtype=dtype
+            )
         return tf.random.uniform(shape, low, high, dtype=dtype)
 
 
@@ -43,13 +60,19 @@ def random_normal(
     dtype: DType,
     seed: Optional[int] = None,
     device: str,
+    rng: Optional[RNGStream] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
     mean = tf.cast(mean, dtype)
     std = tf.cast(std, dtype)
+    stateless_seed = _stateless_seed(rng, seed)
     with tf.device(device):
+        if stateless_seed is not None:
+            return tf.random.stateless_normal(
+                shape, stateless_seed, mean, std, dtype=dtype
+            )
         if seed is not None:
             tf.random.set_seed(seed)
         return tf.random.normal(shape, mean, std, dtype=dtype, seed=seed)
@@ -65,6 +88,7 @@ def multinomial(
     replace: bool = True,
     device: str,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     ivy.assertions.check_true(
@@ -81,6 +105,11 @@ def multinomial(
                 )
                 / population_size
             )
+        stateless_seed = _stateless_seed(rng, seed)
+        if stateless_seed is not None:
+            return tf.random.stateless_categorical(
+                tf.math.log(probs), num_samples, stateless_seed
+            )
         if seed is not None:
             tf.random.set_seed(seed)
         return tf.random.categorical(tf.math.log(probs), num_samples, seed=seed)
@@ -98,6 +127,7 @@ def randint(
     device: str,
     dtype: Optional[Union[DType, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
     if not dtype:
@@ -107,7 +137,15 @@ def randint(
     shape = _check_bounds_and_get_shape(low, high, shape)
     low = tf.cast(low, "float32")
     high = tf.cast(high, "float32")
+    stateless_seed = _stateless_seed(rng, seed)
     with tf.device(device):
+        if stateless_seed is not None:
+            return tf.cast(
+                tf.random.stateless_uniform(
+                    shape, stateless_seed, low, high, "float32"
+                ),
+                dtype,
+            )
         if seed is not None:
             tf.random.set_seed(seed)
         return tf.cast(tf.random.uniform(shape, low, high, "float32", seed=seed), dtype)
@@ -122,8 +160,13 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None,
 ) -> Union[tf.Tensor, tf.Variable]:
+    stateless_seed = _stateless_seed(rng, seed)
+    if stateless_seed is not None:
+        keys = tf.random.stateless_uniform(tf.shape(x)[:1], stateless_seed)
+        return tf.gather(x, tf.argsort(keys))
     if seed is not None:
         tf.random.set_seed(seed)
     return tf.random.shuffle(x, seed=seed)
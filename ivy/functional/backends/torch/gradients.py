@@ -58,6 +58,29 @@ def execute_with_gradients(func, xs, retain_grads=False):
     return (y, grads, *rest)
 
 
+def gradient_function(func, retain_grads=False, jit=True):
+    def callback_fn(xs):
+        func_ret = func(xs)
+        if isinstance(func_ret, tuple):
+            y = func_ret[0]
+            rest = func_ret[1:]
+        else:
+            y = func_ret
+            rest = tuple()
+        y = ivy.to_native(y)
+        grads = torch.autograd.grad(
+            [y],
+            xs,
+            retain_graph=retain_grads,
+            create_graph=retain_grads,
+        )
+        if not retain_grads:
+            y = y.detach()
+        return y, grads, rest
+
+    return callback_fn
+
+
 def value_and_grad(func):
     grad_fn = lambda xs: ivy.to_native(func(xs))
 
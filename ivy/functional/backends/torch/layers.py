@@ -645,3 +645,39 @@ def conv_general_transpose(
 
 
 conv_general_transpose.unsupported_dtypes = ("float16", "bfloat16")
+
+
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = tuple(x.shape[:-2])
+    timesteps = x.shape[-2]
+    out_channels = init_h.shape[-1]
+    state_shape = batch_shape + (out_channels,)
+
+    # lstm_cell expects a single batch axis and transposed weights, and shares the
+    # gate order of ivy.lstm_update
+    x = x.reshape(-1, timesteps, x.shape[-1])
+    ht = init_h.expand(state_shape).reshape(-1, out_channels)
+    ct = init_c.expand(state_shape).reshape(-1, out_channels)
+    w_ih = kernel.t()
+    w_hh = recurrent_kernel.t()
+
+    hts_list = list()
+    for t in range(timesteps):
+        ht, ct = torch.lstm_cell(x[:, t], (ht, ct), w_ih, w_hh, bias, recurrent_bias)
+        hts_list.append(ht)
+
+    hts = torch.stack(hts_list, dim=1)
+    return hts.reshape(batch_shape + (timesteps, out_channels)), ct.reshape(state_shape)
+
+
+lstm_update.unsupported_dtypes = ("float16", "bfloat16")
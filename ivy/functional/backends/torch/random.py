@@ -7,6 +7,8 @@ from typing import Optional, Union, Sequence
 # local
 import ivy
 from ivy.functional.ivy.random import (
+    RNGStream,
+    _rng_stream,
     _check_bounds_and_get_shape,
     _randint_check_dtype_and_bound,
     _check_valid_scale,
@@ -16,6 +18,15 @@ from ivy.functional.ivy.random import (
 # ------#
 
 
+def _generator_of(rng, device, seed=None):
+    """A generator on `device` seeded by the stream `rng` or the default stream of the
+    thread, or None to draw from the global random state."""
+    rng = _rng_stream(rng, seed)
+    if rng is None:
+        return None
+    return torch.Generator(device=device).manual_seed(rng.next_seed())
+
+
 def random_uniform(
     *,
     low: Union[float, torch.Tensor] = 0.0,
@@ -23,11 +34,17 @@ def random_uniform(
     shape: Optional[Union[ivy.NativeShape, Sequence[int]]] = None,
     dtype: torch.dtype,
     device: torch.device,
+    rng: Optional[RNGStream] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     shape = _check_bounds_and_get_shape(low, high, shape)
     rand_range = high - low
-    return torch.rand(shape, device=device, dtype=dtype, out=out) * rand_range + low
+    generator = _generator_of(rng, device)
+    return (
+        torch.rand(shape, generator=generator, device=device, dtype=dtype, out=out)
+        * rand_range
+        + low
+    )
 
 
 def random_normal(
@@ -38,6 +55,7 @@ def random_normal(
     dtype: torch.dtype,
     seed: Optional[int] = None,
     device: torch.device,
+    rng: Optional[RNGStream] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     _check_valid_scale(std)
@@ -45,8 +63,10 @@ def random_normal(
     if seed is not None:
         torch.manual_seed(seed)
     if isinstance(mean, (int, float)) and isinstance(std, (int, float)):
-        return torch.normal(mean, std, shape, out=out).to(device)
-    return torch.normal(mean, std, out=out).to(device)
+        generator = _generator_of(rng, "cpu", seed)
+        return torch.normal(mean, std, shape, generator=generator, out=out).to(device)
+    generator = _generator_of(rng, mean.device, seed)
+    return torch.normal(mean, std, generator=generator, out=out).to(device)
 
 
 random_normal.support_native_out = True
@@ -62,6 +82,7 @@ def multinomial(
     replace: bool = True,
     device: torch.device,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     if probs is None:
@@ -76,7 +97,10 @@ def multinomial(
         )
     if seed is not None:
         torch.manual_seed(seed)
-    return torch.multinomial(probs.float(), num_samples, replace, out=out).to(device)
+    generator = _generator_of(rng, probs.device, seed)
+    return torch.multinomial(
+        probs.float(), num_samples, replace, generator=generator, out=out
+    ).to(device)
 
 
 multinomial.support_native_out = True
@@ -91,6 +115,7 @@ def randint(
     device: torch.device,
     dtype: Optional[Union[torch.dtype, ivy.Dtype]] = None,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     if not dtype:
@@ -101,7 +126,11 @@ def randint(
     rand_range = high - low
     if seed is not None:
         torch.manual_seed(seed)
-    return torch.rand(shape, device=device).to(dtype) * rand_range + low
+    generator = _generator_of(rng, device, seed)
+    return (
+        torch.rand(shape, generator=generator, device=device).to(dtype) * rand_range
+        + low
+    )
 
 
 def seed(*, seed_value: int = 0) -> None:
@@ -115,12 +144,16 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[torch.Tensor] = None,
 ) -> torch.Tensor:
     batch_size = x.shape[0]
     if seed is not None:
         torch.manual_seed(seed)
-    return torch.index_select(x, 0, torch.randperm(batch_size), out=out)
+    generator = _generator_of(rng, "cpu", seed)
+    return torch.index_select(
+        x, 0, torch.randperm(batch_size, generator=generator), out=out
+    )
 
 
 shuffle.support_native_out = True
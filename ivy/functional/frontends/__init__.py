@@ -4,6 +4,7 @@ from . import jax
 from . import torch
 from . import tensorflow
 import importlib
+from importlib import metadata
 
 latest_version = {
     "torch": "1.12",
@@ -75,9 +76,16 @@ def set_frontend_to_specific_version(frontend):
     """
     f = str(frontend.__name__)
     f = f[f.index("frontends") + 10 :]
+    # the version is read from the installed package metadata, so that the
+    # framework itself doesn't need to be imported, unless it is installed under
+    # another distribution name, such as tensorflow-cpu or a nightly build
     try:
-        f = importlib.import_module(f)
-        f_version = f.__version__
+        f_version = metadata.version(f)
+    except metadata.PackageNotFoundError:
+        try:
+            f_version = importlib.import_module(f).__version__
+        except Exception:
+            f_version = latest_version[f]
     except Exception:
         f_version = latest_version[f]
 
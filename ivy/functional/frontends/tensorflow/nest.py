@@ -1,27 +1,34 @@
 # global
+import sys
 import ivy
-import tensorflow as tf
-import torch
+
+
+# composite arrays can only exist if their framework has already been imported, so
+# we look the frameworks up in sys.modules rather than importing them here
 
 
 def _is_composite_array(x):
-    if isinstance(x, (tf.SparseTensor, tf.RaggedTensor)):
+    tf = sys.modules.get("tensorflow")
+    if tf is not None and isinstance(x, (tf.SparseTensor, tf.RaggedTensor)):
         return True
-    if isinstance(x, torch.Tensor):
+    torch = sys.modules.get("torch")
+    if torch is not None and isinstance(x, torch.Tensor):
         if x.layout in [torch.sparse_coo, torch.sparse_csr]:
             return True
     return False
 
 
 def _flatten_composite_array(x):
-    if isinstance(x, tf.RaggedTensor):
+    tf = sys.modules.get("tensorflow")
+    torch = sys.modules.get("torch")
+    if tf is not None and isinstance(x, tf.RaggedTensor):
         new_struc = [x.flat_values]
         for row_split in x.nested_row_splits:
             new_struc.append(row_split)
         return new_struc
-    elif isinstance(x, tf.SparseTensor):
+    elif tf is not None and isinstance(x, tf.SparseTensor):
         return [x.indices, x.values, x.dense_shape]
-    elif isinstance(x, torch.Tensor):
+    elif torch is not None and isinstance(x, torch.Tensor):
         if x.layout == torch.sparse_coo:
             x = x.coalesce()
             return [x.indices(), x.values(), ivy.native_array(x.size(), dtype="int64")]
@@ -75,7 +75,7 @@ def _get_functions_from_string(func_names, module):
     for func_name in func_names:
         if hasattr(ivy, func_name) and callable(getattr(ivy, func_name)):
             ret.add(getattr(ivy, func_name))
-        elif hasattr(module, func_name) and callable(getattr(ivy, func_name)):
+        elif hasattr(module, func_name) and callable(getattr(module, func_name)):
             ret.add(getattr(module, func_name))
     return ret
 
@@ -119,6 +119,20 @@ def _nested_get(f, base_set, merge_fn, get_fn, wrapper=set):
     return out
 
 
+# The results of the function_[un]supported_* queries, memoized per backend, as the
+# recursion through the source of the functions is costly
+_support_cache = dict()
+
+
+def _cached_support(query, fn, recurse, compute):
+    key = (ivy.current_backend_str(), query, fn, recurse)
+    try:
+        return _support_cache[key]
+    except KeyError:
+        ret = _support_cache[key] = compute()
+        return ret
+
+
 # Get the list of dtypes supported by the function
 # by default returns the supported dtypes
 def _get_dtypes(fn, complement=True):
@@ -1395,13 +1409,16 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
         "supported_dtypes and unsupported_dtypes attributes cannot both exist \
         in a particular backend",
     )
-    supported_dtypes = set(_get_dtypes(fn, complement=False))
-    if recurse:
-        supported_dtypes = _nested_get(
-            fn, supported_dtypes, set.intersection, function_supported_dtypes
-        )
 
-    return tuple(supported_dtypes)
+    def _compute():
+        supported_dtypes = set(_get_dtypes(fn, complement=False))
+        if recurse:
+            supported_dtypes = _nested_get(
+                fn, supported_dtypes, set.intersection, function_supported_dtypes
+            )
+        return tuple(supported_dtypes)
+
+    return _cached_support("supported_dtypes", fn, recurse, _compute)
 
 
 @handle_nestable
@@ -1432,13 +1449,16 @@ def function_unsupported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
         "supported_dtypes and unsupported_dtypes attributes cannot both exist \
         in a particular backend",
     )
-    unsupported_dtypes = set(_get_dtypes(fn, complement=True))
-    if recurse:
-        unsupported_dtypes = _nested_get(
-            fn, unsupported_dtypes, set.union, function_unsupported_dtypes
-        )
 
-    return tuple(unsupported_dtypes)
+    def _compute():
+        unsupported_dtypes = set(_get_dtypes(fn, complement=True))
+        if recurse:
+            unsupported_dtypes = _nested_get(
+                fn, unsupported_dtypes, set.union, function_unsupported_dtypes
+            )
+        return tuple(unsupported_dtypes)
+
+    return _cached_support("unsupported_dtypes", fn, recurse, _compute)
 
 
 @handle_exceptions
@@ -2103,6 +2123,13 @@ def promote_types_of_inputs(
     as inputs only for those functions that expect an array-like or tensor-like objects,
     otherwise it might give unexpected results.
     """
+    if (
+        isinstance(x1, ivy.NativeArray)
+        and isinstance(x2, ivy.NativeArray)
+        and x1.dtype == x2.dtype
+    ):
+        # nothing to promote, which is the common case inside backend functions
+        return x1, x2
     if (hasattr(x1, "dtype") and hasattr(x2, "dtype")) or (
         not hasattr(x1, "dtype") and not hasattr(x2, "dtype")
     ):
@@ -1229,14 +1229,18 @@ def function_supported_devices(fn: Callable, recurse=True) -> Tuple:
         "supported_devices and unsupported_devices attributes cannot both \
         exist in a particular backend",
     )
-    supported_devices = set(_get_devices(fn, complement=False))
 
-    if recurse:
-        supported_devices = ivy.functional.data_type._nested_get(
-            fn, supported_devices, set.intersection, function_supported_devices
-        )
+    def _compute():
+        supported_devices = set(_get_devices(fn, complement=False))
+        if recurse:
+            supported_devices = ivy.functional.data_type._nested_get(
+                fn, supported_devices, set.intersection, function_supported_devices
+            )
+        return tuple(supported_devices)
 
-    return tuple(supported_devices)
+    return ivy.functional.data_type._cached_support(
+        "supported_devices", fn, recurse, _compute
+    )
 
 
 @handle_nestable
@@ -1261,14 +1265,18 @@ def function_unsupported_devices(fn: Callable, recurse=True) -> Tuple:
         "supported_devices and unsupported_devices attributes cannot both \
         exist in a particular backend",
     )
-    unsupported_devices = set(_get_devices(fn, complement=True))
 
-    if recurse:
-        unsupported_devices = ivy.functional.data_type._nested_get(
-            fn, unsupported_devices, set.union, function_unsupported_devices
-        )
+    def _compute():
+        unsupported_devices = set(_get_devices(fn, complement=True))
+        if recurse:
+            unsupported_devices = ivy.functional.data_type._nested_get(
+                fn, unsupported_devices, set.union, function_unsupported_devices
+            )
+        return tuple(unsupported_devices)
 
-    return tuple(unsupported_devices)
+    return ivy.functional.data_type._cached_support(
+        "unsupported_devices", fn, recurse, _compute
+    )
 
 
 # Profiler #
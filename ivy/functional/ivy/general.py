@@ -2,6 +2,7 @@
 
 import gc
 import inspect
+import json
 import math
 
 # global
@@ -3378,18 +3379,23 @@ def function_supported_devices_and_dtypes(fn: Callable, recurse=True) -> Dict:
         "supported_device_and_dtypes and unsupported_device_and_dtypes \
          attributes cannot both exist in a particular backend",
     )
-    supported_devices_dtype = _get_devices_and_dtypes(fn, complement=False)
-
-    if recurse:
-        supported_devices_dtype = ivy.functional.data_type._nested_get(
-            fn,
-            _all_dnd_combinations(),
-            _dnd_dict_intersection,
-            function_supported_devices_and_dtypes,
-            wrapper=lambda x: x,
-        )
 
-    return supported_devices_dtype
+    def _compute():
+        if recurse:
+            return ivy.functional.data_type._nested_get(
+                fn,
+                _all_dnd_combinations(),
+                _dnd_dict_intersection,
+                function_supported_devices_and_dtypes,
+                wrapper=lambda x: x,
+            )
+        return _get_devices_and_dtypes(fn, complement=False)
+
+    return dict(
+        ivy.functional.data_type._cached_support(
+            "supported_devices_and_dtypes", fn, recurse, _compute
+        )
+    )
 
 
 @handle_nestable
@@ -3415,18 +3421,93 @@ def function_unsupported_devices_and_dtypes(fn: Callable, recurse=True) -> Dict:
         "supported_device_and_dtypes and unsupported_device_and_dtypes \
          attributes cannot both exist in a particular backend",
     )
-    unsupported_devices_dtype = _get_devices_and_dtypes(fn, complement=True)
-
-    if recurse:
-        unsupported_devices_dtype = ivy.functional.data_type._nested_get(
-            fn,
-            {},
-            _dnd_dict_union,
-            function_unsupported_devices_and_dtypes,
-            wrapper=lambda x: x,
+
+    def _compute():
+        if recurse:
+            return ivy.functional.data_type._nested_get(
+                fn,
+                {},
+                _dnd_dict_union,
+                function_unsupported_devices_and_dtypes,
+                wrapper=lambda x: x,
+            )
+        return _get_devices_and_dtypes(fn, complement=True)
+
+    return dict(
+        ivy.functional.data_type._cached_support(
+            "unsupported_devices_and_dtypes", fn, recurse, _compute
         )
+    )
+
+
+def _support_table_entry(fn):
+    return {
+        "supported_dtypes": sorted(ivy.function_supported_dtypes(fn)),
+        "unsupported_dtypes": sorted(ivy.function_unsupported_dtypes(fn)),
+        "supported_devices": sorted(ivy.function_supported_devices(fn)),
+        "unsupported_devices": sorted(ivy.function_unsupported_devices(fn)),
+        "supported_devices_and_dtypes": {
+            device: sorted(dtypes)
+            for device, dtypes in function_supported_devices_and_dtypes(fn).items()
+        },
+        "unsupported_devices_and_dtypes": {
+            device: sorted(dtypes)
+            for device, dtypes in function_unsupported_devices_and_dtypes(fn).items()
+        },
+    }
+
+
+@handle_exceptions
+def function_support_table(
+    fn_names: Optional[Sequence[str]] = None, /, *, path: Optional[str] = None
+) -> Dict:
+    """Returns the supported and unsupported dtypes and devices of the functions of the
+    current backend, computing the memoized results of the function_supported_* and
+    function_unsupported_* queries for each function on the way, so that later
+    queries are lookups.
 
-    return unsupported_devices_dtype
+    Parameters
+    ----------
+    fn_names
+        The names of the functions to include. Default is all the functions of the
+        ivy namespace.
+    path
+        The JSON file to save the table to, which can be read with :mod:`json` at
+        startup, without importing the backend framework. Default is None.
+
+    Returns
+    -------
+    ret
+        dict of the backend, its version, and a dict of the function names to their
+        sorted supported and unsupported dtypes, devices and devices and dtypes.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> table = ivy.function_support_table(["acosh"])
+    >>> print(table["functions"]["acosh"]["unsupported_dtypes"])
+    ['bfloat16']
+    """
+    ivy.assertions.check_true(
+        ivy.current_backend_str(), "a backend must be set to tabulate its functions"
+    )
+    if fn_names is None:
+        fn_names = sorted(
+            k
+            for k, v in ivy.__dict__.items()
+            if inspect.isfunction(v) and v.__module__.startswith("ivy.functional.")
+        )
+    table = {
+        "backend": ivy.current_backend_str(),
+        "backend_version": str(ivy.current_backend().backend_version),
+        "functions": {
+            fn_name: _support_table_entry(getattr(ivy, fn_name)) for fn_name in fn_names
+        },
+    }
+    if path is not None:
+        with open(path, "w") as f:
+            json.dump(table, f, indent=1)
+    return table
 
 
 @handle_exceptions
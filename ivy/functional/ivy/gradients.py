@@ -417,6 +417,126 @@ def execute_with_gradients(func, xs, /, *, retain_grads=False):
 execute_with_gradients.computes_gradients = True
 
 
+def _flat_leaves(x, leaves):
+    for v in x.values():
+        if isinstance(v, dict):
+            _flat_leaves(v, leaves)
+        else:
+            leaves.append(v.data if isinstance(v, ivy.Array) else v)
+    return leaves
+
+
+def _structure_of(x):
+    return tuple(
+        (k, _structure_of(v) if isinstance(v, dict) else None) for k, v in x.items()
+    )
+
+
+def _nest_leaves(structure, leaves):
+    return {
+        k: next(leaves) if sub is None else _nest_leaves(sub, leaves)
+        for k, sub in structure
+    }
+
+
+class GradientFunction:
+    """A reusable handle calling `func` with input of xs variables, and returning the
+    first output y, the gradients [dy/dx for x in xs], and any other function outputs,
+    as :func:`execute_with_gradients` does.
+
+    The layout of the container of variables is captured on the first call, and the
+    gradient transform of the backend is built once and cached, which on jax is a
+    jitted value_and_grad, so that each later call only handles the arrays themselves.
+    Both are rebuilt when the key chains of the variables change.
+
+    Examples
+    --------
+    >>> func = lambda xs: ivy.mean(xs.w * xs.b)
+    >>> grad_fn = ivy.GradientFunction(func)
+    >>> xs = ivy.Container(w=ivy.variable(ivy.array([1., 2.])),
+    ...                    b=ivy.variable(ivy.array([3., 4.])))
+    >>> y, grads = grad_fn(xs)
+
+    """
+
+    def __init__(self, func, /, *, retain_grads=False, jit=True):
+        """Initialize the gradient function.
+
+        Parameters
+        ----------
+        func
+            Function for which we compute the gradients of the output with respect to
+            xs input.
+        retain_grads
+            Whether to retain the gradients of the returned values.
+            (Default value = False)
+        jit
+            Whether to compile the gradient transform, on backends supporting it. The
+            function must then be free of side effects. (Default value = True)
+
+        """
+        self._func = func
+        self._retain_grads = retain_grads
+        self._jit = jit
+        self._structure = None
+        self._config = None
+        self._backend = None
+        self._grad_fn = None
+
+    def _flat_func(self, leaves):
+        """Call the function on the container of the flat native variables."""
+        leaves = iter([ivy.Array(x) for x in leaves])
+        if self._structure is None:
+            return self._func(next(leaves))
+        return self._func(
+            ivy.Container(_nest_leaves(self._structure, leaves), **self._config)
+        )
+
+    def __call__(self, xs):
+        """Call the function with input of xs variables.
+
+        Parameters
+        ----------
+        xs
+            Variables for which to compute the function gradients with respective to.
+
+        Returns
+        -------
+        ret
+            the function first output y, the gradients [dy/dx for x in xs], and any
+            other extra function outputs.
+
+        """
+        if isinstance(xs, ivy.Container):
+            leaves = _flat_leaves(xs, [])
+            structure = _structure_of(xs)
+            if structure != self._structure:
+                self._structure = structure
+                self._config = xs.config
+                self._grad_fn = None
+        else:
+            leaves = [xs.data if isinstance(xs, ivy.Array) else xs]
+            if self._structure is not None:
+                self._structure = None
+                self._grad_fn = None
+        backend = current_backend(leaves[0])
+        if self._grad_fn is None or backend is not self._backend:
+            self._grad_fn = backend.gradient_function(
+                self._flat_func, self._retain_grads, self._jit
+            )
+            self._backend = backend
+        y, grads, rest = self._grad_fn(leaves)
+        if grads is not None:
+            grads = [ivy.Array(g) for g in grads]
+            if self._structure is None:
+                grads = grads[0]
+            else:
+                grads = ivy.Container(
+                    _nest_leaves(self._structure, iter(grads)), **self._config
+                )
+        return (ivy.to_ivy(y), grads, *rest)
+
+
 @to_native_arrays_and_back
 @handle_exceptions
 def value_and_grad(func):
@@ -12,6 +12,7 @@ from ivy.func_wrapper import (
     handle_nestable,
 )
 from ivy.exceptions import handle_exceptions
+from ivy.functional.ivy.random import RNGStream
 
 
 # Extra #
@@ -101,6 +102,7 @@ def dropout(
     *,
     scale: bool = True,
     dtype: ivy.Dtype = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Randomly zeroes some elements of the input tensor with probability p using
@@ -116,6 +118,10 @@ def dropout(
         Whether to scale the output by 1/(1-prob), default is True.
     dtype
 
+    rng
+        the stream to draw the dropped elements from. Default is the stream of the
+        current thread, if set with :func:`ivy.set_rng_stream`, else the global random
+        state.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -127,7 +133,8 @@ def dropout(
 
     """
     x = ivy.where(
-        ivy.random_uniform(shape=x.shape, device=ivy.dev(x), dtype=dtype) < prob,
+        ivy.random_uniform(shape=x.shape, device=ivy.dev(x), dtype=dtype, rng=rng)
+        < prob,
         ivy.zeros_like(x, dtype=dtype),
         x,
     )
@@ -1336,15 +1343,15 @@ def lstm_update(
     batch_shape = x_shape[:-2]
     timesteps = x_shape[-2]
     input_channels = x_shape[-1]
+    output_channels = init_h.shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
+    # input kernel, for all timesteps at once
     Wi = kernel
     Wi_x = ivy.reshape(
         ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
         batch_shape + [timesteps, -1],
     )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
 
     # recurrent kernel
     Wh = recurrent_kernel
@@ -1356,33 +1363,23 @@ def lstm_update(
     # lstm outputs
     hts_list = list()
 
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    # unrolled time dimension with lstm steps, where the four gates are computed
+    # together and then sliced, as three of them share the sigmoid
+    for t in range(timesteps):
+        gates = Wi_x[..., t, :] + ivy.matmul(ht, Wh)
+        if recurrent_bias is not None:
+            gates = gates + recurrent_bias
+        sig = ivy.sigmoid(gates)
+        it = sig[..., :output_channels]
+        ft = sig[..., output_channels : 2 * output_channels]
+        gt = ivy.tanh(gates[..., 2 * output_channels : 3 * output_channels])
+        ot = sig[..., 3 * output_channels :]
+        ct = ft * ct + it * gt
         ht = ot * ivy.tanh(ct)
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
+        hts_list.append(ht)
 
-    return ivy.concat(hts_list, axis=-2), ct
+    return ivy.stack(hts_list, axis=-2), ct
 
 
 # Helpers #
@@ -222,6 +222,88 @@ def _train_tasks_batched(
     return cost
 
 
+def _stack_task_batches(batch, num_tasks, sub_batch_fn=None):
+    """Stack the sub-batches of the tasks along a new leading axis, applying
+    `sub_batch_fn` to each sub-batch in turn if given."""
+    if sub_batch_fn is None:
+        return batch[0:num_tasks].map(lambda x, kc: ivy.expand_dims(x, axis=1))
+    return ivy.Container.static_stack(
+        [sub_batch_fn(b) for b in batch.unstack_conts(0, True, num_tasks)], axis=0
+    )
+
+
+def _vectorize_cost_fn(cost_fn):
+    """Map the cost function of one task over the tasks stacked along the leading axis
+    of the batch and variables, and average the costs of the tasks. The gradients of
+    the average with respect to the stacked variables are the gradients of each task,
+    divided by the number of tasks."""
+    if cost_fn is None:
+        return None
+
+    def _cost_fn(batch, v):
+        batch_leaves = batch.to_flat_list()
+        num_batch_leaves = len(batch_leaves)
+
+        def _task_cost_fn(*leaves):
+            return ivy.to_native(
+                cost_fn(
+                    batch.from_flat_list(list(leaves[:num_batch_leaves])),
+                    v=v.from_flat_list(list(leaves[num_batch_leaves:])),
+                )
+            )
+
+        return ivy.mean(ivy.vmap(_task_cost_fn)(*batch_leaves, *v.to_flat_list()))
+
+    return _cost_fn
+
+
+def _train_tasks_vectorized(
+    batch,
+    inner_sub_batch_fn,
+    outer_sub_batch_fn,
+    inner_cost_fn,
+    outer_cost_fn,
+    variables,
+    inner_grad_steps,
+    inner_learning_rate,
+    inner_optimization_step,
+    order,
+    average_across_steps,
+    inner_v,
+    keep_innver_v,
+    outer_v,
+    keep_outer_v,
+    return_inner_v,
+    num_tasks,
+    stop_gradients,
+):
+    # the inner loops of all tasks run as batched operations on a copy of the
+    # variables for each task, stacked along a new leading axis
+    variables = variables.map(
+        lambda x, kc: ivy.repeat(ivy.expand_dims(x, axis=0), num_tasks, axis=0)
+    )
+    return _train_tasks_batched(
+        batch,
+        lambda b: _stack_task_batches(b, num_tasks, inner_sub_batch_fn),
+        lambda b: _stack_task_batches(b, num_tasks, outer_sub_batch_fn),
+        _vectorize_cost_fn(inner_cost_fn),
+        _vectorize_cost_fn(outer_cost_fn),
+        variables,
+        inner_grad_steps,
+        inner_learning_rate,
+        inner_optimization_step,
+        order,
+        average_across_steps,
+        inner_v,
+        keep_innver_v,
+        outer_v,
+        keep_outer_v,
+        return_inner_v,
+        num_tasks,
+        stop_gradients,
+    )
+
+
 def _train_tasks_with_for_loop(
     batch,
     inner_sub_batch_fn,
@@ -324,6 +406,7 @@ def _train_tasks(
     return_inner_v,
     num_tasks,
     stop_gradients,
+    vectorized=False,
 ):
     if batched:
         return _train_tasks_batched(
@@ -346,6 +429,32 @@ def _train_tasks(
             num_tasks,
             stop_gradients,
         )
+    # tasks with their own inner or outer key chains are trained one at a time
+    if vectorized and not any(
+        isinstance(kcs, (list, tuple))
+        and isinstance(kcs[0], (list, tuple, dict, type(None)))
+        for kcs in (inner_v, outer_v)
+    ):
+        return _train_tasks_vectorized(
+            batch,
+            inner_batch_fn,
+            outer_batch_fn,
+            inner_cost_fn,
+            outer_cost_fn,
+            variables,
+            inner_grad_steps,
+            inner_learning_rate,
+            inner_optimization_step,
+            order,
+            average_across_steps,
+            inner_v,
+            keep_innver_v,
+            outer_v,
+            keep_outer_v,
+            return_inner_v,
+            num_tasks,
+            stop_gradients,
+        )
     return _train_tasks_with_for_loop(
         batch,
         inner_batch_fn,
@@ -395,6 +504,7 @@ def fomaml_step(
     return_inner_v: Union[str, bool] = False,
     num_tasks: Optional[int] = None,
     stop_gradients: bool = True,
+    vectorized: bool = False,
 ) -> Tuple[ivy.Array, ivy.Container, Any]:
     """Perform step of first order MAML.
 
@@ -451,6 +561,12 @@ def fomaml_step(
         batch by default.
     stop_gradients
         Whether to stop the gradients of the cost. Default is True.
+    vectorized
+        Whether to run the inner loops of all tasks as batched operations when not
+        batched, by stacking a copy of the variables for each task along a new
+        leading axis, and mapping the cost functions over the tasks with
+        :func:`ivy.vmap`. Tasks with their own inner_v or outer_v key chains are
+        still trained one at a time. Default is False.
 
     Returns
     -------
@@ -480,6 +596,7 @@ def fomaml_step(
         return_inner_v,
         num_tasks,
         stop_gradients,
+        vectorized,
     )
     cost = rets[0]
     if stop_gradients:
@@ -507,6 +624,7 @@ def reptile_step(
     return_inner_v: Union[str, bool] = False,
     num_tasks: Optional[int] = None,
     stop_gradients: bool = True,
+    vectorized: bool = False,
 ) -> Tuple[ivy.Array, ivy.Container, Any]:
     """Perform step of Reptile.
 
@@ -538,6 +656,12 @@ def reptile_step(
         batch by default.
     stop_gradients
         Whether to stop the gradients of the cost. Default is True.
+    vectorized
+        Whether to run the inner loops of all tasks as batched operations when not
+        batched, by stacking a copy of the variables for each task along a new
+        leading axis, and mapping the cost functions over the tasks with
+        :func:`ivy.vmap`. Tasks with their own inner_v or outer_v key chains are
+        still trained one at a time. Default is False.
 
     Returns
     -------
@@ -568,6 +692,7 @@ def reptile_step(
         return_inner_v,
         num_tasks,
         stop_gradients,
+        vectorized,
     )
     cost = rets[0]
     if stop_gradients:
@@ -606,6 +731,7 @@ def maml_step(
     return_inner_v: Union[str, bool] = False,
     num_tasks: Optional[int] = None,
     stop_gradients: bool = True,
+    vectorized: bool = False,
 ) -> Tuple[ivy.Array, ivy.Container, Any]:
     """Perform step of vanilla second order MAML.
 
@@ -662,6 +788,12 @@ def maml_step(
         batch by default.
     stop_gradients
         Whether to stop the gradients of the cost. Default is True.
+    vectorized
+        Whether to run the inner loops of all tasks as batched operations when not
+        batched, by stacking a copy of the variables for each task along a new
+        leading axis, and mapping the cost functions over the tasks with
+        :func:`ivy.vmap`. Tasks with their own inner_v or outer_v key chains are
+        still trained one at a time. Default is False.
 
     Returns
     -------
@@ -693,6 +825,7 @@ def maml_step(
             return_inner_v,
             num_tasks,
             False,
+            vectorized,
         ),
         variables.at_key_chains(outer_v, ignore_none=True)
         if keep_outer_v
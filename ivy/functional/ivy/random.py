@@ -1,7 +1,10 @@
 """Collection of random Ivy functions."""
 
 # global
-from typing import Optional, Union
+import threading
+from typing import List, Optional, Union
+
+import numpy as np
 
 # local
 import ivy
@@ -80,6 +83,164 @@ def _check_valid_scale(std):
     )
 
 
+# RNG Streams #
+# ------------#
+
+_bit_generators = {"philox": np.random.Philox, "pcg64": np.random.PCG64}
+
+# the stack of default streams of each thread
+_rng_streams = threading.local()
+
+
+class RNGStream:
+    """A stream of random numbers, drawn from its own generator rather than the global
+    random state of the backend.
+
+    Streams are deterministic given their seed, and are split into independent
+    child streams with :meth:`spawn`, for instance one per worker or thread, so that
+    parallel sampling is reproducible, without sharing any state. A stream is either
+    passed to the random functions as `rng`, or set as the default stream of the
+    current thread, by entering it as a context manager or with
+    :func:`set_rng_stream`.
+
+    The numpy backend draws samples straight from the generator of the stream, and
+    the other backends draw from a generator or key seeded by the stream.
+
+    Examples
+    --------
+    >>> workers = ivy.RNGStream(0).spawn(2)
+    >>> x = ivy.random_uniform(shape=(2,), rng=workers[0])
+    >>> with workers[1]:
+    ...     y = ivy.random_normal(shape=(2,))
+
+    """
+
+    def __init__(
+        self,
+        seed: Optional[Union[int, np.random.SeedSequence]] = None,
+        /,
+        *,
+        bit_generator: str = "philox",
+    ):
+        """Initialize the stream.
+
+        Parameters
+        ----------
+        seed
+            the seed of the stream, as an integer or a numpy seed sequence. Default is
+            None, for a seed drawn from the operating system.
+        bit_generator
+            the numpy bit generator of the stream, either philox or pcg64. Default is
+            philox.
+
+        """
+        ivy.assertions.check_elem_in_list(bit_generator, list(_bit_generators))
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self._seed_sequence = seed
+        self._bit_generator = bit_generator
+        self._generator = np.random.Generator(_bit_generators[bit_generator](seed))
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """The numpy generator of the stream."""
+        return self._generator
+
+    def spawn(self, num_streams: int, /) -> List["RNGStream"]:
+        """Split off `num_streams` independent child streams, deterministic given the
+        seed of this stream.
+
+        Parameters
+        ----------
+        num_streams
+            the number of child streams.
+
+        Returns
+        -------
+        ret
+            the child streams.
+
+        """
+        return [
+            RNGStream(seed, bit_generator=self._bit_generator)
+            for seed in self._seed_sequence.spawn(num_streams)
+        ]
+
+    def next_seed(self, bits: int = 63, /) -> int:
+        """Draw a seed for a backend generator or key from the stream.
+
+        Parameters
+        ----------
+        bits
+            the number of bits of the seed, which is drawn uniformly from
+            [0, 2**bits). Default is 63, the width of a signed 64-bit integer.
+
+        Returns
+        -------
+        ret
+            the seed.
+
+        """
+        return int(self._generator.integers(2**bits, dtype=np.uint64))
+
+    def __enter__(self):
+        set_rng_stream(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_rng_stream()
+
+    def __repr__(self):
+        return "RNGStream({}, entropy={})".format(
+            self._bit_generator, self._seed_sequence.entropy
+        )
+
+
+def _rng_stream_stack():
+    if not hasattr(_rng_streams, "stack"):
+        _rng_streams.stack = list()
+    return _rng_streams.stack
+
+
+def _rng_stream(rng, seed=None):
+    """The stream to draw from, which is `rng` if given, or else the default stream of
+    the current thread, unless an explicit `seed` asks for the global random state."""
+    if ivy.exists(rng) or ivy.exists(seed):
+        return rng
+    return get_rng_stream()
+
+
+@handle_exceptions
+def set_rng_stream(rng: RNGStream, /) -> None:
+    """Set the default stream of the random functions called from the current
+    thread.
+
+    Parameters
+    ----------
+    rng
+        the stream to draw from.
+
+    """
+    ivy.assertions.check_isinstance(rng, RNGStream)
+    _rng_stream_stack().append(rng)
+
+
+@handle_exceptions
+def unset_rng_stream() -> None:
+    """Restore the previous default stream of the current thread."""
+    stack = _rng_stream_stack()
+    if stack:
+        stack.pop(-1)
+
+
+@handle_exceptions
+def get_rng_stream() -> Optional[RNGStream]:
+    """Return the default stream of the current thread, or None if the random
+    functions draw from the global random state."""
+    stack = _rng_stream_stack()
+    return stack[-1] if stack else None
+
+
 # Extra #
 # ------#
 
@@ -97,6 +258,7 @@ def random_uniform(
     shape: Optional[Union[ivy.Shape, ivy.NativeShape]] = None,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Draws samples from a uniform distribution. Samples are uniformly distributed over
@@ -123,6 +285,9 @@ def random_uniform(
     dtype
          output array data type. If ``dtype`` is ``None``, the output array data
          type will be the default floating-point data type. Default ``None``
+    rng
+        the stream to draw the samples from. Default is the stream of the current
+        thread, if set with :func:`set_rng_stream`, else the global random state.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -190,7 +355,13 @@ def random_uniform(
     ivy.array([5. , 7.3])
     """
     return ivy.current_backend().random_uniform(
-        low=low, high=high, shape=shape, device=device, dtype=dtype, out=out
+        low=low,
+        high=high,
+        shape=shape,
+        device=device,
+        dtype=dtype,
+        rng=rng,
+        out=out,
     )
 
 
@@ -208,6 +379,7 @@ def random_normal(
     dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
     seed: Optional[int] = None,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -233,6 +405,9 @@ def random_normal(
     device
         device on which to create the array 'cuda:0', 'cuda:1', 'cpu' etc.
         (Default value = None).
+    rng
+        the stream to draw the samples from. Default is the stream of the current
+        thread, if set with :func:`set_rng_stream`, else the global random state.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -300,7 +475,14 @@ def random_normal(
     ivy.array([12.4, 11. ])
     """
     return ivy.current_backend().random_normal(
-        mean=mean, std=std, shape=shape, dtype=dtype, seed=seed, device=device, out=out
+        mean=mean,
+        std=std,
+        shape=shape,
+        dtype=dtype,
+        seed=seed,
+        device=device,
+        rng=rng,
+        out=out,
     )
 
 
@@ -319,6 +501,7 @@ def multinomial(
     replace: bool = True,
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -344,6 +527,9 @@ def multinomial(
         (Default value = None)
     seed
         A python integer. Used to create a random seed distribution
+    rng
+        the stream to draw the samples from. Default is the stream of the current
+        thread, if set with :func:`set_rng_stream`, else the global random state.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -408,6 +594,7 @@ def multinomial(
         replace=replace,
         device=device,
         seed=seed,
+        rng=rng,
         out=out,
     )
 
@@ -426,6 +613,7 @@ def randint(
     device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
     dtype: Optional[Union[ivy.Dtype, ivy.NativeDtype]] = None,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Returns an array filled with random integers generated uniformly between
@@ -450,6 +638,9 @@ def randint(
         type will be the default integer data type. Default ``None``
     seed
         A python integer. Used to create a random seed distribution
+    rng
+        the stream to draw the samples from. Default is the stream of the current
+        thread, if set with :func:`set_rng_stream`, else the global random state.
     out
         optional output array, for writing the result to. It must have a shape
         that the inputs broadcast to.
@@ -484,7 +675,14 @@ def randint(
 
     """
     return ivy.current_backend().randint(
-        low, high, shape=shape, device=device, dtype=dtype, seed=seed, out=out
+        low,
+        high,
+        shape=shape,
+        device=device,
+        dtype=dtype,
+        seed=seed,
+        rng=rng,
+        out=out,
     )
 
 
@@ -516,6 +714,7 @@ def shuffle(
     /,
     *,
     seed: Optional[int] = None,
+    rng: Optional[RNGStream] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """Shuffles the given array along axis 0.
@@ -526,6 +725,9 @@ def shuffle(
         Input array. Should have a numeric data type.
     seed
         A python integer. Used to create a random seed distribution
+    rng
+        the stream to draw the samples from. Default is the stream of the current
+        thread, if set with :func:`set_rng_stream`, else the global random state.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -543,4 +745,4 @@ def shuffle(
     ivy.array([2, 1, 4, 3, 5])
 
     """
-    return ivy.current_backend(x).shuffle(x, seed=seed, out=out)
+    return ivy.current_backend(x).shuffle(x, seed=seed, rng=rng, out=out)
@@ -1,5 +1,5 @@
 # local
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 import ivy
 import abc
 
@@ -25,6 +25,7 @@ class Initializer(abc.ABC):
         fan_out: float = None,
         fan_in: float = None,
         dtype: Union[ivy.Dtype, ivy.NativeDtype] = None,
+        rng: Optional[ivy.RNGStream] = None,
     ) -> ivy.Array:
         """
         Create internal variables for the layer
@@ -44,6 +45,10 @@ class Initializer(abc.ABC):
             The number of nodes in the previous layer.
         dtype
             Desired data type.
+        rng
+            The stream to draw the random values from. Default is the stream of the
+            current thread, if set with `ivy.set_rng_stream`, else the global random
+            state.
         """
         return None
 
@@ -71,6 +76,7 @@ class Constant(Initializer):
         fan_out: float = None,
         fan_in: float = None,
         dtype: Union[ivy.Dtype, ivy.NativeDtype] = None,
+        rng: Optional[ivy.RNGStream] = None,
     ) -> ivy.Array:
         return ivy.variable(
             ivy.full(var_shape, self._constant, device=device, dtype=dtype),
@@ -133,7 +139,7 @@ class Uniform(Initializer):
         self._gain = gain
 
     def create_variables(
-        self, var_shape, device, fan_out=None, fan_in=None, dtype=None
+        self, var_shape, device, fan_out=None, fan_in=None, dtype=None, rng=None
     ):
         """
         Create internal variables for the layer
@@ -153,6 +159,10 @@ class Uniform(Initializer):
             The number of nodes in the previous layer.
         dtype
             Desired data type.
+        rng
+            The stream to draw the random values from. Default is the stream of the
+            current thread, if set with `ivy.set_rng_stream`, else the global random
+            state.
         """
         if self._fan_mode == "fan_in":
             ivy.assertions.check_exists(
@@ -195,7 +205,12 @@ class Uniform(Initializer):
         wlim = ((self._numerator / fan) ** self._power) * self._gain
         return ivy.variable(
             ivy.random_uniform(
-                low=-wlim, high=wlim, shape=var_shape, device=device, dtype=dtype
+                low=-wlim,
+                high=wlim,
+                shape=var_shape,
+                device=device,
+                dtype=dtype,
+                rng=rng,
             ),
         )
 
@@ -272,6 +287,7 @@ class KaimingNormal(Initializer):
         fan_in=None,
         negative_slope=0.0,
         dtype=None,
+        rng=None,
     ):
         """
         Create internal variables for the layer
@@ -294,6 +310,10 @@ class KaimingNormal(Initializer):
             gives a relationship proportional to `1/fan`.
         dtype
             Desired data type.
+        rng
+            The stream to draw the random values from. Default is the stream of the
+            current thread, if set with `ivy.set_rng_stream`, else the global random
+            state.
         """
         if self._fan_mode == "fan_in":
             ivy.assertions.check_exists(
@@ -336,6 +356,11 @@ class KaimingNormal(Initializer):
         std = (2 / ((1 + negative_slope**2) * fan)) ** 0.5
         return ivy.variable(
             ivy.random_normal(
-                mean=self._mean, std=std, shape=var_shape, device=device, dtype=dtype
+                mean=self._mean,
+                std=std,
+                shape=var_shape,
+                device=device,
+                dtype=dtype,
+                rng=rng,
             )
         )
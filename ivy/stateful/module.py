@@ -562,6 +562,33 @@ class Module(abc.ABC):
             return ret
         return self._forward_with_tracking(*args, **kwargs)
 
+    def _call_compiled(self, *args, v=None, with_grads=None, **kwargs):
+        """
+        The forward pass of the layer, using the compiled forward function.
+
+        Parameters
+        ----------
+        v
+            Replace `v` of current layer when forwarding. Restore
+            after the forward finished.
+        with_grads
+            Whether to forward with gradients.
+
+        Returns
+        -------
+        ret
+            Result of the forward pass of the layer.
+        """
+        try:
+            return self._compiled_fn(
+                *args, v=ivy.default(v, self.v), with_grads=with_grads, **kwargs
+            )
+        except Exception as e:
+            if not self._fallback_to_non_compiled:
+                raise e
+            self._compiled = False
+            return self._call(*args, v=v, with_grads=with_grads, **kwargs)
+
     # Public #
     # -------#
 
@@ -990,25 +1017,46 @@ class Module(abc.ABC):
             track_submod_call_order,
             expected_submod_rets,
         )
-        ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        tracking = (
+            track_submod_rets
+            or track_submod_call_order
+            or ivy.exists(expected_submod_rets)
+        )
+        if self._compiled and not tracking:
+            ret = self._call_compiled(*args, v=v, with_grads=with_grads, **kwargs)
+        else:
+            ret = self._call(*args, v=v, with_grads=with_grads, **kwargs)
+        if self._compile_on_next_step and self._built:
+            # the variables are passed in explicitly, so that the compiled function
+            # sees them change between calls
+            self._compiled_fn = ivy.compile(self._call)
+            self._compiled = True
+            self._compile_on_next_step = False
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(self, weights_path, /, *, as_mmap=False):
         """
         Save the weights on the Module.
 
         Parameters
         ----------
         weights_path
-            The hdf5 file for saving the weights.
+            The file for saving the weights.
+        as_mmap
+            Whether to save the weights with :meth:`ivy.Container.to_disk_as_mmap`
+            rather than as hdf5, so that :meth:`ivy.Container.from_disk_as_mmap` can
+            load them without copying. Default is False.
 
         Returns
         -------
         None
         """
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.to_disk_as_hdf5(weights_path)
+        if as_mmap:
+            self.v.to_disk_as_mmap(weights_path)
+        else:
+            self.v.to_disk_as_hdf5(weights_path)
 
     def build(self, *args, from_call=False, device=None, dtype=None, **kwargs):
         """
@@ -9,6 +9,15 @@ from typing import Union, Optional, Callable
 import ivy
 
 
+# Helpers #
+# --------#
+
+
+def _same_leaves(v, leaves):
+    flat = v.to_flat_list()
+    return len(flat) == len(leaves) and all(a is b for a, b in zip(flat, leaves))
+
+
 # Base #
 # -----#
 
@@ -23,6 +32,7 @@ class Optimizer(abc.ABC):
         compile_on_next_step: bool = False,
         fallback_to_non_compiled: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct a general Optimizer. This is an abstract class, and must be derived.
@@ -49,6 +59,10 @@ class Optimizer(abc.ABC):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to pack the variables, gradients and optimizer state into one flat
+            buffer per data type and device, and update each buffer at once rather than
+            each variable. Default is False.
         """
         self._lr = lr
         self._inplace = inplace
@@ -61,6 +75,10 @@ class Optimizer(abc.ABC):
         self._count = ivy.array([0], device=self._dev)
         self._compiled_step_fn = None
         self._compiled = False
+        self._fused = fused
+        # the variables returned by the last fused step, their packed weights, and
+        # their leaves
+        self._fused_v = None
 
     # Private #
     # --------#
@@ -91,6 +109,82 @@ class Optimizer(abc.ABC):
 
     # Given #
 
+    def _fused_deltas(self, w: ivy.PackedContainer, grads: ivy.PackedContainer):
+        """
+        Compute the deltas subtracted from the packed variables in a fused step,
+        updating the packed optimizer state. Override this method to support fused
+        updates.
+
+        Parameters
+        ----------
+        w
+            Packed variables to update.
+        grads
+            Packed gradients, with the same structure as w.
+
+        Returns
+        -------
+        ret
+            The packed deltas, with the same structure as w.
+
+        """
+        raise ivy.exceptions.IvyNotImplementedException
+
+    def _fused_step(self, v: ivy.Container, grads: ivy.Container):
+        """
+        Update nested variables container v with one update per flat buffer of the
+        packed variables, rather than one per variable.
+
+        The returned variables are views into the packed variables, which are reused
+        rather than packed again on the next step if v still holds the same views, and
+        decremented in-place where the backend supports it.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+
+        Returns
+        -------
+        ret
+            The updated variables, following the update step.
+
+        """
+        reuse = (
+            self._fused_v is not None
+            and v is self._fused_v[0]
+            and _same_leaves(v, self._fused_v[2])
+        )
+        w = self._fused_v[1] if reuse else v.pack()
+        deltas = self._fused_deltas(w, grads.pack())
+        if reuse and self._inplace and ivy.inplace_arrays_supported():
+            for w_buffer, delta in zip(w.buffers, deltas.buffers):
+                ivy.inplace_decrement(w_buffer, delta)
+            return v
+        new_w = w - deltas
+        if self._stop_gradients:
+            new_w = new_w.map_buffers(
+                lambda x: ivy.stop_gradient(x, preserve_type=True)
+            )
+        new_v = new_w.unpack()
+        self._fused_v = (new_v, new_w, new_v.to_flat_list())
+        return new_v
+
+    def _packed_state(self, x):
+        """Pack the state x if it is a container and the optimizer is fused."""
+        if self._fused and isinstance(x, ivy.Container):
+            return x.pack()
+        return x
+
+    @staticmethod
+    def _unpacked_state(x):
+        """Unpack the state x if it is packed, so that it is returned as containers."""
+        if isinstance(x, ivy.PackedContainer):
+            return x.unpack()
+        return x
+
     def _step_fn(
         self, v: ivy.Container, grads: ivy.Container, ignore_missing: bool = False
     ):
@@ -112,6 +206,43 @@ class Optimizer(abc.ABC):
             return v.set_at_keys(self._step(v.at_key_chains(grads), grads))
         return self._step(v, grads)
 
+    def _stateless_step_fn(
+        self,
+        v: ivy.Container,
+        grads: ivy.Container,
+        state: ivy.Container,
+        count: ivy.Array,
+        ignore_missing: bool = False,
+    ):
+        """
+        Calls the step function with the optimizer state and step count passed in and
+        returned, rather than read from and written to the optimizer, so that the
+        function can be compiled.
+
+        Parameters
+        ----------
+        v
+            Nested variables to update.
+        grads
+            Nested gradients to update.
+        state
+            Nested state of the optimizer.
+        count
+            The step count.
+        ignore_missing
+            Whether to ignore keys missing from the gradients which exist in
+            the variables.
+            Default is False
+
+        Returns
+        -------
+        ret
+            The updated variables and the updated state of the optimizer.
+        """
+        self.set_state(state)
+        self._count = count
+        return self._step_fn(v, grads, ignore_missing), self.state
+
     # Public #
     # -------#
 
@@ -155,7 +286,24 @@ class Optimizer(abc.ABC):
 
         """
         self._count += 1
+        if self._compile_on_next_step and self._initialized:
+            self._compiled_step_fn = ivy.compile(
+                self._stateless_step_fn, static_argnums=4
+            )
+            self._compiled = True
+            self._compile_on_next_step = False
         self._initialized = True
+        if self._compiled:
+            try:
+                new_v, state = self._compiled_step_fn(
+                    v, grads, self.state, self._count, ignore_missing
+                )
+                self.set_state(state)
+                return new_v
+            except Exception as e:
+                if not self._fallback_to_non_compiled:
+                    raise e
+                self._compiled = False
         return self._step_fn(v, grads, ignore_missing)
 
 
@@ -170,6 +318,7 @@ class SGD(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Stochastic-Gradient-Descent (SGD) optimizer.
@@ -188,9 +337,17 @@ class SGD(Optimizer):
             Default is True.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is False.
+        fused
+            Whether to update all the variables of each data type and device at once,
+            from flat buffers, when the variables are a container. Default is False.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -213,6 +370,8 @@ class SGD(Optimizer):
             The new updated variables container, following gradient descent step.
 
         """
+        if self._fused and isinstance(v, ivy.Container):
+            return self._fused_step(v, grads)
         return ivy.gradient_descent_update(
             v,
             grads,
@@ -231,6 +390,9 @@ class SGD(Optimizer):
         """
         pass
 
+    def _fused_deltas(self, w: ivy.PackedContainer, grads: ivy.PackedContainer):
+        return grads * (self._lr if isinstance(self._lr, float) else self._lr())
+
     @property
     def state(self):
 
@@ -245,6 +407,7 @@ class LARS(Optimizer):
         inplace: bool = True,
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
+        fused: bool = False,
     ):
         """
         Construct a Layer-wise Adaptive Rate Scaling (LARS) optimizer.
@@ -265,10 +428,18 @@ class LARS(Optimizer):
             Default is True.
         compile_on_next_step
             Whether to compile the optimizer on the next step. Default is False.
+        fused
+            Whether to update all the variables of each data type and device at once,
+            from flat buffers, when the variables are a container. Default is False.
         """
         self._decay_lambda = decay_lambda
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, compile_on_next_step=compile_on_next_step
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            compile_on_next_step=compile_on_next_step,
+            fused=fused,
         )
 
     # Custom Step
@@ -291,6 +462,8 @@ class LARS(Optimizer):
             The new updated variables container, following LARS step.
 
         """
+        if self._fused and isinstance(v, ivy.Container):
+            return self._fused_step(v, grads)
         return ivy.lars_update(
             v,
             grads,
@@ -310,6 +483,26 @@ class LARS(Optimizer):
         """
         pass
 
+    def _fused_deltas(self, w: ivy.PackedContainer, grads: ivy.PackedContainer):
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        decay_lambda = self._decay_lambda
+
+        def _deltas(dcdw, w_norm, dcdw_norm):
+            layer_lr = ivy.stable_divide(w_norm * lr, dcdw_norm)
+            if decay_lambda > 0:
+                layer_lr /= w_norm * decay_lambda
+            return dcdw * layer_lr
+
+        # the layer-wise norms, repeated over the elements of each layer
+        return ivy.PackedContainer.multi_map_buffers(
+            _deltas,
+            [
+                grads,
+                w.reduce_leaves(ivy.vector_norm),
+                grads.reduce_leaves(ivy.vector_norm),
+            ],
+        )
+
     @property
     def state(self):
 
@@ -327,6 +520,7 @@ class Adam(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an ADAM optimizer.
@@ -354,6 +548,9 @@ class Adam(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all the variables of each data type and device at once,
+            from flat buffers, when the variables are a container. Default is False.
         """
         self._beta1 = beta1
         self._beta2 = beta2
@@ -364,7 +561,14 @@ class Adam(Optimizer):
         self._should_compile = False
 
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
 
     # Custom Step
@@ -387,6 +591,8 @@ class Adam(Optimizer):
             The updated variables, following Adam update step.
 
         """
+        if self._fused and isinstance(v, ivy.Container):
+            return self._fused_step(v, grads)
         if self._first_pass:
             self._mw = grads
             self._vw = grads**2
@@ -406,6 +612,30 @@ class Adam(Optimizer):
         )
         return new_v
 
+    def _fused_deltas(self, w: ivy.PackedContainer, grads: ivy.PackedContainer):
+        if self._first_pass:
+            self._mw = grads
+            self._vw = grads**2
+            self._first_pass = False
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        step = self._count
+
+        def _adam_step(dcdw, mw, vw):
+            return ivy.adam_step(
+                dcdw,
+                mw,
+                vw,
+                step,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+
+        eff_grads, self._mw, self._vw = ivy.PackedContainer.multi_map_buffers(
+            _adam_step, [grads, self._mw, self._vw]
+        )
+        return eff_grads * lr
+
     def set_state(self, state: ivy.Container):
         """
         Set state of the optimizer.
@@ -415,13 +645,18 @@ class Adam(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._mw = self._packed_state(state.mw)
+        self._vw = self._packed_state(state.vw)
 
     @property
     def state(self):
 
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {
+                "mw": self._unpacked_state(self._mw),
+                "vw": self._unpacked_state(self._vw),
+            }
+        )
 
 
 class LAMB(Optimizer):
@@ -437,6 +672,7 @@ class LAMB(Optimizer):
         stop_gradients: bool = True,
         compile_on_next_step: bool = False,
         device: Optional[Union[ivy.Device, ivy.NativeDevice]] = None,
+        fused: bool = False,
     ):
         """
         Construct an LAMB optimizer.
@@ -469,9 +705,19 @@ class LAMB(Optimizer):
         device
             Device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. (Default value = None)
+        fused
+            Whether to update all the variables of each data type and device at once,
+            from flat buffers, when the variables are a container. Default is False.
         """
         Optimizer.__init__(
-            self, lr, inplace, stop_gradients, True, compile_on_next_step, device=device
+            self,
+            lr,
+            inplace,
+            stop_gradients,
+            True,
+            compile_on_next_step,
+            device=device,
+            fused=fused,
         )
         self._beta1 = beta1
         self._beta2 = beta2
@@ -501,6 +747,8 @@ class LAMB(Optimizer):
         ret
             The updated variables, following LAMB update step.
         """
+        if self._fused and isinstance(v, ivy.Container):
+            return self._fused_step(v, grads)
         if self._first_pass:
             self._mw = grads
             self._vw = grads**2
@@ -522,6 +770,48 @@ class LAMB(Optimizer):
         )
         return new_v
 
+    def _fused_deltas(self, w: ivy.PackedContainer, grads: ivy.PackedContainer):
+        if self._first_pass:
+            self._mw = grads
+            self._vw = grads**2
+            self._first_pass = False
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        step = self._count
+
+        def _adam_step(dcdw, mw, vw):
+            return ivy.adam_step(
+                dcdw,
+                mw,
+                vw,
+                step,
+                beta1=self._beta1,
+                beta2=self._beta2,
+                epsilon=self._epsilon,
+            )
+
+        eff_grads, self._mw, self._vw = ivy.PackedContainer.multi_map_buffers(
+            _adam_step, [grads, self._mw, self._vw]
+        )
+        if self._decay_lambda > 0:
+            decayed_grads = eff_grads + self._decay_lambda * w
+        else:
+            decayed_grads = eff_grads
+        max_trust_ratio = self._max_trust_ratio
+
+        def _deltas(eff_grad, r1, r2):
+            r = ivy.minimum(ivy.stable_divide(r1, r2), max_trust_ratio)
+            return eff_grad * (r * lr)
+
+        # the layer-wise trust ratios, repeated over the elements of each layer
+        return ivy.PackedContainer.multi_map_buffers(
+            _deltas,
+            [
+                eff_grads,
+                w.reduce_leaves(ivy.vector_norm),
+                decayed_grads.reduce_leaves(ivy.vector_norm),
+            ],
+        )
+
     def set_state(self, state: ivy.Container):
         """Set state of the optimizer.
 
@@ -530,10 +820,15 @@ class LAMB(Optimizer):
         state
             Nested state to update.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        self._mw = self._packed_state(state.mw)
+        self._vw = self._packed_state(state.vw)
 
     @property
     def state(self):
 
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return ivy.Container(
+            {
+                "mw": self._unpacked_state(self._mw),
+                "vw": self._unpacked_state(self._vw),
+            }
+        )
@@ -387,3 +387,55 @@ def test_array__isub__(
             ret_from_gt=ret_gt,
             ground_truth_backend="numpy",
         )
+
+
+# lazy metadata
+@handle_cmd_line_args
+@given(
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("numeric"),
+    ),
+)
+def test_array_lazy_metadata(
+    dtype_and_x,
+):
+    dtype, x = dtype_and_x
+    data = Array(ivy.native_array(x[0], dtype=dtype[0]))
+    assert not hasattr(data, "__dict__")
+    assert data._dtype is None and data._device is None and data._size is None
+    assert data.dtype == ivy.as_ivy_dtype(dtype[0])
+    assert data.device == ivy.dev(data.data)
+    # ivy gives 0-d arrays a size of 0
+    shape = np.asarray(x[0]).shape
+    assert data.size == (int(np.prod(shape)) if len(shape) > 0 else 0)
+    assert data._dtype is not None and data._device is not None
+    # the metadata is computed with the backend the array was created under, even
+    # once another backend has been set
+    backend = ivy.current_backend_str()
+    data = Array(ivy.native_array(x[0], dtype=dtype[0]))
+    ivy.set_backend("numpy")
+    try:
+        assert data.backend == backend
+        assert data.dtype == ivy.as_ivy_dtype(dtype[0])
+        assert not data.is_variable
+    finally:
+        ivy.unset_backend()
+
+
+# instance method wrapping
+@handle_cmd_line_args
+@given(
+    dtype_and_x=helpers.dtype_and_values(
+        available_dtypes=helpers.get_dtypes("float"),
+        num_arrays=2,
+        shared_dtype=True,
+    ),
+)
+def test_array_wrapped_instance_method(
+    dtype_and_x,
+):
+    dtype, x = dtype_and_x
+    data = Array(ivy.native_array(x[0], dtype=dtype[0]))
+    other = ivy.native_array(x[1], dtype=dtype[1])
+    ret_gt = ivy.to_numpy(ivy.maximum(data, other))
+    assert np.array_equal(ivy.to_numpy(data.maximum(other)), ret_gt, equal_nan=True)
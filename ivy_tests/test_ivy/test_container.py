@@ -1380,6 +1380,51 @@ def test_container_key_chains_containing(include_empty, device):
     assert kcs[1] == "b/d_sub"
 
 
+def test_container_key_chains_matching(device):
+    dict_in = {
+        "a": {"w": ivy.array([1], device=device), "b": ivy.array([2], device=device)},
+        "c": {"w": ivy.array([3], device=device)},
+    }
+    container = Container(dict_in)
+    for _ in range(2):
+        assert container.key_chains_matching("*/w") == ["a/w", "c/w"]
+        assert container.key_chains_matching("a/*") == ["a/b", "a/w"]
+        assert container.key_chains_matching("d*") == []
+        container.index_key_chains()
+
+
+def test_container_index_key_chains(device):
+    dict_in = {
+        "a": ivy.array([1], device=device),
+        "b": {"c": ivy.array([2], device=device), "d": ivy.array([3], device=device)},
+    }
+    container = Container(dict_in).index_key_chains()
+    assert container.all_key_chains() == ["a", "b/c", "b/d"]
+    assert container.has_key_chain("b/c")
+    assert np.allclose(ivy.to_numpy(container.at_key_chain("b.d")), np.array([3]))
+
+    # leaves set in-place keep the index
+    container.set_at_key_chain("b/c", ivy.array([4], device=device), inplace=True)
+    assert np.allclose(ivy.to_numpy(container.b.c), np.array([4]))
+    assert np.allclose(ivy.to_numpy(container.at_key_chain("b/c")), np.array([4]))
+
+    # and so do leaves scattered in bulk
+    container.set_at_key_chains(
+        {"a": ivy.array([6], device=device), "b": {"d": ivy.array([7], device=device)}},
+        inplace=True,
+    )
+    assert container._kc_index is not None
+    assert np.allclose(ivy.to_numpy(container.a), np.array([6]))
+    assert np.allclose(ivy.to_numpy(container.at_key_chain("b/d")), np.array([7]))
+
+    # mutating a sub-container invalidates the index
+    container.b["e"] = ivy.array([5], device=device)
+    assert container.all_key_chains() == ["a", "b/c", "b/d", "b/e"]
+    del container.b["c"]
+    assert not container.has_key_chain("b/c")
+    assert container.all_key_chains() == ["a", "b/d", "b/e"]
+
+
 # noinspection PyUnresolvedReferences
 def test_container_set_at_keys(device):
     dict_in = {
@@ -2066,6 +2111,38 @@ def test_container_from_flat_list(device):
     assert np.allclose(ivy.to_numpy(container.b.d), np.array([6]))
 
 
+def test_container_pack(device):
+    dict_in = {
+        "a": ivy.array([1.0, 2.0], device=device),
+        "b": {
+            "c": ivy.array([[3.0]], device=device),
+            "d": ivy.array([4, 5], device=device),
+            "e": None,
+        },
+    }
+    container = Container(dict_in)
+    packed = container.pack()
+    assert len(packed.buffers) == 2
+    assert packed.key_chains == ["a", "b/c", "b/d", "b/e"]
+    assert np.allclose(ivy.to_numpy(packed["b/c"]), np.array([[3.0]]))
+
+    # elementwise functions
+    container_out = (abs(-2 * packed) + packed.add(1)).unpack()
+    assert np.allclose(ivy.to_numpy(container_out.a), np.array([4.0, 7.0]))
+    assert np.allclose(ivy.to_numpy(container_out.b.c), np.array([[10.0]]))
+    assert np.allclose(ivy.to_numpy(container_out.b.d), np.array([13, 16]))
+    assert container_out.b.e is None
+    # only elementwise functions are exposed
+    with pytest.raises(AttributeError):
+        packed.Union
+
+    # round trip
+    container_unpacked = packed.unpack()
+    assert container_unpacked.a.shape == (2,)
+    assert container_unpacked.b.c.shape == (1, 1)
+    assert np.allclose(ivy.to_numpy(container_unpacked.b.d), np.array([4, 5]))
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map(inplace, device):
     # without key_chains specification
@@ -2711,6 +2788,43 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_container_from_disk_as_hdf5_lazy_and_in_batches(prefetch, device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    dict_in = {
+        "a": ivy.array([1, 2, 3, 4, 5], device=device),
+        "b": {
+            "c": ivy.array([[1.0], [2.0], [3.0], [4.0], [5.0]], device=device),
+        },
+    }
+    container = Container(dict_in)
+    container.to_disk_as_hdf5(save_filepath)
+
+    # lazy loading
+    loaded_container = Container.from_disk_as_hdf5(
+        save_filepath, slice(1, 3), lazy=True
+    )
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), np.array([2, 3]))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.get("c")), np.array([[2.0], [3.0]])
+    )
+    # all the leaves are loaded, so the file is closed and can be written to again
+    container.to_disk_as_hdf5(save_filepath, mode="w")
+
+    # loading in batches
+    batches = list(
+        Container.from_disk_as_hdf5_in_batches(save_filepath, 2, prefetch=prefetch)
+    )
+    assert len(batches) == 3
+    assert np.array_equal(ivy.to_numpy(batches[1].a), np.array([3, 4]))
+    assert np.array_equal(ivy.to_numpy(batches[2].b.c), np.array([[5.0]]))
+
+    os.remove(save_filepath)
+
+
 def test_container_pickle(device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=device),
@@ -2768,6 +2882,43 @@ def test_container_to_and_from_disk_as_pickled(device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_mmap(device):
+    save_filepath = "container_on_disk.mmap"
+    dict_in = {
+        "a": ivy.array([np.float32(1.0), np.float32(2.0)], device=device),
+        "b": {
+            "c": ivy.array([[1, 2, 3]], dtype="int16", device=device),
+            "d": True,
+            "e": {},
+        },
+    }
+    container = Container(dict_in)
+
+    # saving
+    container.to_disk_as_mmap(save_filepath)
+    assert os.path.exists(save_filepath)
+
+    # loading
+    loaded_container = Container.from_disk_as_mmap(save_filepath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+    assert np.array_equal(
+        ivy.to_numpy(loaded_container.b.c), ivy.to_numpy(container.b.c)
+    )
+    assert ivy.dtype(loaded_container.b.c) == "int16"
+    assert loaded_container.b.d is True
+    assert isinstance(loaded_container.b.e, Container)
+    assert len(loaded_container.b.e) == 0
+
+    # modes which would write to or truncate the file are rejected
+    for mode in ["r+", "w+"]:
+        with pytest.raises(ivy.exceptions.IvyException):
+            Container.from_disk_as_mmap(save_filepath, mode=mode)
+    loaded_container = Container.from_disk_as_mmap(save_filepath, mode="r")
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+
+    os.remove(save_filepath)
+
+
 def test_container_to_and_from_disk_as_json(device):
     save_filepath = "container_on_disk.json"
     dict_in = {
@@ -4091,3 +4242,113 @@ def test_container_from_queues(device):
         worker.join()
 
     del container
+
+
+def _data_loader_sample(i):
+    return {"x": np.full((3,), i, "float32"), "meta": {"idx": i, "name": str(i)}}
+
+
+def _data_loader_double(sample):
+    sample["x"] = sample["x"] * 2
+    return sample
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_container_data_loader(shuffle, device):
+
+    if "gpu" in device:
+        # Cannot re-initialize CUDA in forked subprocess. 'spawn'
+        # start method must be used.
+        pytest.skip()
+
+    loader = ivy.DataLoader(
+        _data_loader_sample,
+        10,
+        4,
+        transforms=[_data_loader_double],
+        num_workers=2,
+        prefetch=1,
+        shuffle=shuffle,
+        seed=0,
+    )
+    assert len(loader) == 3
+    for _ in range(2):
+        idxs = list()
+        for batch in loader:
+            idx = ivy.to_numpy(batch.meta.idx)
+            assert np.allclose(ivy.to_numpy(batch.x), 2 * np.tile(idx[:, None], (1, 3)))
+            assert batch.meta.name == [str(i) for i in idx]
+            idxs += idx.tolist()
+        assert sorted(idxs) == list(range(10))
+        assert (idxs == list(range(10))) != shuffle
+
+    # an abandoned epoch is discarded
+    next(iter(loader))
+    assert len(list(loader)) == 3
+
+    # batches arrive in the background
+    iter(loader)
+    try:
+        loader.next_nowait()
+    except queue.Empty:
+        pass
+    container = loader.as_container()
+    assert container[0].x.shape == (3,)
+    loader.close()
+
+
+def test_container_shared_memory_transport(device):
+
+    if "gpu" in device:
+        # Cannot re-initialize CUDA in forked subprocess. 'spawn'
+        # start method must be used.
+        pytest.skip()
+
+    def worker_fn(transport, in_queue, out_queue):
+        handle = in_queue.get(timeout=10)
+        x = transport.get(handle)
+        out_queue.put((ivy.to_numpy(x.a).tolist(), ivy.to_numpy(x.b.c).tolist(), x.d))
+
+    transport = ivy.SharedMemoryTransport()
+    container = Container(
+        a=ivy.array([0.0, 1.0], device=device),
+        b={"c": ivy.array([[2, 3]], device=device)},
+        d="name",
+    )
+    in_queues = [multiprocessing.Queue() for _ in range(2)]
+    out_queue = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=worker_fn, args=(transport, q, out_queue))
+        for q in in_queues
+    ]
+    for worker in workers:
+        worker.start()
+
+    # fan-out to two processes, which only receive the handle
+    handle = transport.put(container, num_receivers=2)
+    assert len(pickle.dumps(handle)) < 1024
+    for in_queue in in_queues:
+        in_queue.put(handle)
+    for _ in workers:
+        assert out_queue.get(timeout=10) == ([0.0, 1.0], [[2, 3]], "name")
+    for worker in workers:
+        worker.join()
+
+    # the block is unlinked once both receivers attached it
+    with pytest.raises(FileNotFoundError):
+        ivy.container.transport.shared_memory.SharedMemory(name=handle.name)
+
+    # leaves of a single receiver view the block, which outlives the handle
+    handle = ivy.container.to_shared_memory(container)
+    received = ivy.container.from_shared_memory(handle)
+    with pytest.raises(FileNotFoundError):
+        ivy.container.transport.shared_memory.SharedMemory(name=handle.name)
+    assert np.allclose(ivy.to_numpy(received.a), [0.0, 1.0])
+    assert received.d == "name"
+
+    # a released reference counts as received
+    handle = transport.put(container, num_receivers=2)
+    transport.release(handle)
+    transport.get(handle)
+    with pytest.raises(FileNotFoundError):
+        ivy.container.transport.shared_memory.SharedMemory(name=handle.name)
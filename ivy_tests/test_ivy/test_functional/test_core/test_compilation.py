@@ -0,0 +1,149 @@
+"""Collection of tests for compilation functions."""
+
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+from ivy.functional.backends.numpy import compilation as numpy_compilation
+
+
+def _mlp(x, w, b):
+    h = ivy.relu(ivy.matmul(x, w) + b)
+    # only depends on constants, so it is folded
+    scale = ivy.exp(ivy.array(0.5))
+    # doesn't contribute to the output, so it is dropped
+    ivy.sin(h)
+    return ivy.softmax(h * scale)
+
+
+def _branch(x):
+    if ivy.sum(x) > 0:
+        return x * 2
+    return x - 1
+
+
+# compile
+@pytest.mark.parametrize("fn", [_mlp, _branch])
+def test_compile_numpy(fn, device):
+    ivy.set_backend("numpy")
+    args_list = [
+        [ivy.array([[1.0, -2.0]]), ivy.array([[1.0, 2.0], [3.0, 4.0]]), ivy.ones(2)],
+        [ivy.array([[-3.0, 5.0]]), ivy.array([[2.0, 0.0], [1.0, 4.0]]), ivy.zeros(2)],
+    ]
+    if fn is _branch:
+        args_list = [[ivy.array([1.0, 2.0])], [ivy.array([-1.0, -2.0])]]
+    compiled = ivy.compile(fn)
+    for args in args_list + args_list:
+        assert np.allclose(ivy.to_numpy(compiled(*args)), ivy.to_numpy(fn(*args)))
+    graph = list(compiled.graphs.values())[0]
+    assert len(compiled.graphs) == 1
+    if fn is _mlp:
+        assert graph.num_folded >= 2
+        assert graph.num_dropped == 1
+    ivy.unset_backend()
+
+
+# compile with an out argument
+def test_compile_numpy_out_argument(device):
+    ivy.set_backend("numpy")
+    compiled = ivy.compile(lambda x, out: ivy.add(x, x, out=out))
+    out = ivy.zeros(2)
+    for x in [ivy.array([1.0, 2.0]), ivy.array([-1.0, 3.0])]:
+        ret = compiled(x, out)
+        assert np.allclose(ivy.to_numpy(out), ivy.to_numpy(x) * 2)
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(x) * 2)
+    ivy.unset_backend()
+
+
+# compile with values computed outside of the ivy functions
+def test_compile_numpy_untraced_values(device):
+    ivy.set_backend("numpy")
+    fn = lambda x: x[0] * 2 + ivy.array(np.asarray(x.data).mean())
+    compiled = ivy.compile(fn)
+    for x in [ivy.array([1.0, 3.0]), ivy.array([10.0, 4.0])]:
+        assert np.allclose(ivy.to_numpy(compiled(x)), ivy.to_numpy(fn(x)))
+    # the graph is discarded, and the function called eagerly
+    assert list(compiled.graphs.values()) == [None]
+    ivy.unset_backend()
+
+
+# compile with arrays created from constants
+def _write_into_zeros(x):
+    y = ivy.zeros(3)
+    y[0] = x[0]
+    return y
+
+
+def test_compile_numpy_fresh_constants(device):
+    ivy.set_backend("numpy")
+    # arrays written to are created afresh by every call
+    compiled = ivy.compile(_write_into_zeros)
+    rets = [compiled(ivy.array([v])) for v in (1.0, 7.0, 9.0)]
+    for v, ret in zip((1.0, 7.0, 9.0), rets):
+        assert np.allclose(ivy.to_numpy(ret), np.array([v, 0.0, 0.0]))
+    # and so are the arrays returned, which the caller may write to
+    compiled = ivy.compile(lambda x: (x + 1, ivy.zeros(3)))
+    _, zeros = compiled(ivy.array([1.0]))
+    zeros[0] = 5.0
+    _, zeros = compiled(ivy.array([2.0]))
+    assert np.allclose(ivy.to_numpy(zeros), np.zeros(3))
+    ivy.unset_backend()
+
+
+# compile_on_next_step
+def test_module_compile_on_next_step(device):
+    ivy.set_backend("numpy")
+    module = ivy.Linear(3, 2, device=device)
+    module._compile_on_next_step = True
+    x = ivy.array([[1.0, 2.0, 3.0]])
+    ret = module(x)
+    assert module._compiled
+    assert isinstance(module._compiled_fn, numpy_compilation._CompiledFunction)
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret))
+    # the variables are inputs of the compiled function, not constants
+    module.v = module.v * 2
+    assert np.allclose(ivy.to_numpy(module(x)), ivy.to_numpy(ret) * 2)
+    ivy.unset_backend()
+
+
+@pytest.mark.parametrize("optimizer", ["SGD", "Adam", "LAMB", "LARS"])
+def test_optimizer_compile_on_next_step(optimizer, device):
+    ivy.set_backend("numpy")
+    eager = getattr(ivy, optimizer)(lr=0.1)
+    compiled = getattr(ivy, optimizer)(lr=0.1, compile_on_next_step=True)
+    v_eager = ivy.Container(w=ivy.array([1.0, 2.0]), b=ivy.array([3.0]))
+    v_compiled = v_eager.deep_copy()
+    for i in range(4):
+        grads = ivy.Container(w=ivy.array([0.1 * i, -0.2]), b=ivy.array([0.3]))
+        v_eager = eager.step(v_eager, grads)
+        v_compiled = compiled.step(v_compiled, grads)
+    assert compiled._compiled
+    assert np.allclose(ivy.to_numpy(v_eager.w), ivy.to_numpy(v_compiled.w))
+    assert np.allclose(ivy.to_numpy(v_eager.b), ivy.to_numpy(v_compiled.b))
+    ivy.unset_backend()
+
+
+# compile with buffers
+def test_compile_numpy_reuses_buffers(device):
+    ivy.set_backend("numpy")
+    network = ivy.Sequential(*[ivy.Linear(4, 4, device=device) for _ in range(6)])
+    compiled = ivy.compile(network._call)
+    for x in [
+        ivy.ones((2, 4)),
+        ivy.array([[1.0, -2.0, 3.0, 0.5], [0.0, 1.0, 2.0, -1.0]]),
+    ]:
+        for _ in range(2):
+            ret = compiled(x, v=network.v)
+            assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(network(x)), atol=1e-6)
+    graph = list(compiled.graphs.values())[0]
+    memory = graph.memory
+    assert memory["allocations"] < memory["allocations_without_buffers"]
+    assert len(graph.buffers) <= 2
+    # the returned arrays aren't overwritten by the next call
+    first = compiled(ivy.ones((2, 4)), v=network.v)
+    first_np = ivy.to_numpy(first).copy()
+    compiled(ivy.zeros((2, 4)), v=network.v)
+    assert np.allclose(ivy.to_numpy(first), first_np)
+    ivy.unset_backend()
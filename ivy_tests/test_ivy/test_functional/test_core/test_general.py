@@ -1,7 +1,10 @@
 """Collection of tests for unified general functions."""
 
 # global
+import json
+import sys
 import time
+import subprocess
 import jax.numpy as jnp
 import pytest
 from hypothesis import given, assume, strategies as st
@@ -50,6 +53,26 @@ def test_set_framework(fw_str, device):
     ivy.unset_backend()
 
 
+# set_backend dispatch table caching
+@handle_cmd_line_args
+@given(fw_str=st.sampled_from(["numpy", "jax", "torch", "tensorflow"]))
+def test_set_backend_reuses_dispatch_table(fw_str, device):
+    # the fixture may have set a backend already
+    orig_add = ivy.add
+    ivy.set_backend(fw_str)
+    try:
+        add_fn = ivy.add
+    finally:
+        ivy.unset_backend()
+    assert ivy.add is orig_add
+    ivy.set_backend(fw_str)
+    try:
+        assert ivy.add is add_fn
+    finally:
+        ivy.unset_backend()
+    assert ivy.add is orig_add
+
+
 # use_framework
 @handle_cmd_line_args
 def test_use_within_use_framework(device):
@@ -63,6 +86,28 @@ def test_use_within_use_framework(device):
         pass
 
 
+# lazy backend imports
+@pytest.mark.parametrize("fw_str", ["numpy", "jax", "torch", "tensorflow"])
+def test_import_only_loads_set_backend(fw_str):
+    # run in a fresh interpreter, as this test session has imported every backend
+    script = (
+        "import sys\n"
+        "import ivy\n"
+        "loaded = [m for m in ('jax', 'tensorflow', 'torch') if m in sys.modules]\n"
+        "assert not loaded, loaded\n"
+        "ivy.set_backend('{}')\n"
+        "loaded = [m for m in ('jax', 'tensorflow', 'torch') if m in sys.modules]\n"
+        "print(','.join(loaded))\n".format(fw_str)
+    )
+    ret = subprocess.run([sys.executable, "-c", script], capture_output=True)
+    assert ret.returncode == 0, ret.stderr.decode()
+    loaded = ret.stdout.decode().strip()
+    if fw_str == "numpy":
+        assert loaded == ""
+    else:
+        assert fw_str in loaded.split(",")
+
+
 @handle_cmd_line_args
 @given(allow_duplicates=st.booleans())
 def test_match_kwargs(allow_duplicates):
@@ -1699,6 +1744,27 @@ def test_function_unsupported_devices(func, expected):
         assert sorted(res[key]) == sorted(exp[key])
 
 
+# function_support_table
+@pytest.mark.parametrize("fn_names", [["acosh"], ["acosh", "linear", "matmul"]])
+def test_function_support_table(fn_names, tmp_path):
+    path = str(tmp_path / "support.json")
+    table = ivy.function_support_table(fn_names, path=path)
+    with open(path) as f:
+        assert json.load(f) == table
+    assert table["backend"] == ivy.current_backend_str()
+    assert sorted(table["functions"]) == sorted(fn_names)
+    for fn_name, entry in table["functions"].items():
+        fn = getattr(ivy, fn_name)
+        assert entry["supported_dtypes"] == sorted(ivy.function_supported_dtypes(fn))
+        assert entry["unsupported_devices"] == sorted(
+            ivy.function_unsupported_devices(fn)
+        )
+        res = ivy.function_unsupported_devices_and_dtypes(fn)
+        assert entry["unsupported_devices_and_dtypes"] == {
+            device: sorted(dtypes) for device, dtypes in res.items()
+        }
+
+
 # Still to Add #
 # ---------------#
 
@@ -1916,6 +1982,79 @@ def test_arg_info():
     return
 
 
+# argument scanning
+@pytest.mark.parametrize("nested", [True, False])
+def test_scan_args(nested, device):
+    x = ivy.array([1.0, 2.0])
+    y = ivy.array([3.0])
+    cont = ivy.Container(a=ivy.array([4.0]))
+    args = (1.0, [y, (x,)]) if nested else (1.0, y, x)
+    kwargs = {"z": x}
+    new_args, new_kwargs, first, found = ivy.func_wrapper._scan_args(
+        args,
+        kwargs,
+        convert=ivy.func_wrapper._to_native_leaf,
+        find_first=True,
+        check_containers=True,
+    )
+    assert not found
+    assert ivy.is_native_array(first)
+    assert np.array_equal(ivy.to_numpy(first), ivy.to_numpy(y))
+    assert ivy.is_native_array(new_kwargs["z"])
+    assert ivy.nested_any(new_args, ivy.is_ivy_array) is False
+    assert ivy.is_ivy_array(args[1][0] if nested else args[1])
+    args = (1.0, [y, (cont,)]) if nested else (1.0, y, cont)
+    new_args, new_kwargs, first, found = ivy.func_wrapper._scan_args(
+        args, kwargs, convert=ivy.func_wrapper._to_native_leaf, check_containers=True
+    )
+    assert found
+    assert new_args is args and new_kwargs is kwargs
+
+
+# fused function wrapping
+@pytest.mark.parametrize(
+    "fn_name, args, kwargs",
+    [
+        ("abs", lambda: (ivy.array([-1.0, 2.0]),), dict),
+        ("add", lambda: (ivy.array([1.0, 2.0]), ivy.native_array([3.0, 4.0])), dict),
+        ("add", lambda: (ivy.array([1.0, 2.0]), 3.0), lambda: {"out": ivy.zeros(2)}),
+        (
+            "add",
+            lambda: (ivy.Container(a=ivy.array([1.0]), b=ivy.array([2.0])), 1.0),
+            dict,
+        ),
+        ("concat", lambda: ([ivy.array([1.0]), ivy.native_array([2.0])],), dict),
+        ("zeros", lambda: ((2, 3),), lambda: {"dtype": "int32"}),
+        ("ones_like", lambda: (ivy.array([1, 2]),), dict),
+    ],
+)
+def test_fused_decorators_match_chained(fn_name, args, kwargs, device):
+    backend = ivy.current_backend()
+    original = ivy.backend_handler.ivy_original_dict[fn_name]
+    to_wrap = backend.__dict__[fn_name]
+    decorators = [
+        attr
+        for attr in ivy.func_wrapper.FN_DECORATORS
+        if hasattr(original, attr) and not hasattr(to_wrap, attr)
+    ]
+    fused = ivy.func_wrapper._fuse_decorators(to_wrap, decorators)
+    chained = ivy.func_wrapper._chain_decorators(to_wrap, decorators)
+    for attr in decorators:
+        assert getattr(fused, attr)
+    ret_fused = fused(*args(), **kwargs())
+    ret_chained = chained(*args(), **kwargs())
+    assert type(ret_fused) is type(ret_chained)
+    if ivy.is_ivy_container(ret_fused):
+        assert ivy.Container.identical_structure([ret_fused, ret_chained])
+        ret_fused = ret_fused.to_flat_list()
+        ret_chained = ret_chained.to_flat_list()
+    else:
+        ret_fused, ret_chained = [ret_fused], [ret_chained]
+    for r_fused, r_chained in zip(ret_fused, ret_chained):
+        assert r_fused.dtype == r_chained.dtype
+        assert np.array_equal(ivy.to_numpy(r_fused), ivy.to_numpy(r_chained))
+
+
 def _fn1(x, y):
     return ivy.matmul(x, y)
 
@@ -1982,3 +2121,42 @@ def test_vmap(func, arrays_and_axes, in_axes_as_cont):
         pass
     else:
         assert False, "One of the results is None while other isn't"
+
+
+def _fn4(x, w):
+    h = ivy.relu(ivy.matmul(x, w) + 1)
+    return ivy.softmax(h, axis=-1) * ivy.mean(h, axis=0, keepdims=True), ivy.sum(h)
+
+
+def _fn5(x, w):
+    if ivy.sum(x) > 0:
+        return ivy.concat([x[1:], ivy.flip(w[:1])], axis=0)
+    return ivy.concat([x[:-1], w[:1]], axis=0)
+
+
+def _fn6(x, w):
+    # the number of positive elements differs between examples
+    return x[x > 0].shape[0] * 1.0 + ivy.matmul(x, w)
+
+
+# vmap batching
+@pytest.mark.parametrize("func", [_fn1, _fn4, _fn5, _fn6])
+@pytest.mark.parametrize("in_axes", [(0, None), (1, 0)])
+def test_vmap_batched_as_loop(func, in_axes, device):
+    ivy.set_backend("numpy")
+    x = np.random.uniform(-1, 1, (4, 5, 3)).astype("float32")
+    w = np.random.uniform(-1, 1, (3, 3) if in_axes[1] is None else (5, 3, 3))
+    w = w.astype("float32")
+    vmapped_func = ivy.vmap(func, in_axes=in_axes, out_axes=0)
+    for _ in range(2):
+        ret = vmapped_func(x, w)
+        ret = ret if isinstance(ret, tuple) else (ret,)
+        for i, r in enumerate(ret):
+            expected = list()
+            for j in range(x.shape[in_axes[0]]):
+                example = func(
+                    np.take(x, j, in_axes[0]), w if in_axes[1] is None else w[j]
+                )
+                expected.append(ivy.to_numpy(example[i] if len(ret) > 1 else example))
+            assert np.allclose(ivy.to_numpy(r), np.stack(expected), atol=1e-6)
+    ivy.unset_backend()
@@ -225,6 +225,40 @@ def test_execute_with_gradients(
     )
 
 
+# GradientFunction
+@pytest.mark.parametrize("retain_grads", [True, False])
+@pytest.mark.parametrize("jit", [True, False])
+def test_gradient_function(retain_grads, jit, fw):
+    if fw == "numpy":
+        return
+    ivy.set_backend(fw)
+
+    def func(xs):
+        return ivy.mean(xs.w * xs.b.c) + ivy.sum(xs.b.d**2), xs.w * 2
+
+    try:
+        grad_fn = ivy.GradientFunction(func, retain_grads=retain_grads, jit=jit)
+        for scale, b_first in ((1.0, False), (2.0, False), (2.0, True)):
+            w = ivy.variable(ivy.array([1.0, 2.0]) * scale)
+            b = {
+                "c": ivy.variable(ivy.array([3.0, 4.0])),
+                "d": ivy.variable(ivy.array(0.5)),
+            }
+            # the same number of variables in another layout
+            xs = ivy.Container(b=b, w=w) if b_first else ivy.Container(w=w, b=b)
+            y, grads, extra = grad_fn(xs)
+            y_gt, grads_gt, extra_gt = ivy.execute_with_gradients(
+                func, xs, retain_grads=retain_grads
+            )
+            assert np.allclose(ivy.to_numpy(y), ivy.to_numpy(y_gt))
+            assert np.allclose(ivy.to_numpy(extra), ivy.to_numpy(extra_gt))
+            assert ivy.Container.identical_structure([grads, grads_gt])
+            for grad, grad_gt in zip(grads.to_flat_list(), grads_gt.to_flat_list()):
+                assert np.allclose(ivy.to_numpy(grad), ivy.to_numpy(grad_gt))
+    finally:
+        ivy.unset_backend()
+
+
 # value_and_grad
 @pytest.mark.parametrize(
     "x", [[[4.6, 2.1, 5], [2.8, 1.3, 6.2]], [[4.6, 2.1], [5, 2.8], [1.3, 6.2]]]
@@ -1104,6 +1104,73 @@ def test_maml_step_overlapping_vars(
             assert list(inner_v_rets.shape) == [1, 1]
 
 
+# Vectorized #
+# -----------#
+
+# meta steps with the inner loops of the tasks vectorized
+@pytest.mark.parametrize("step_fn", ["fomaml_step", "reptile_step", "maml_step"])
+@pytest.mark.parametrize("inner_grad_steps", [1, 2])
+@pytest.mark.parametrize("num_tasks", [1, 3])
+@pytest.mark.parametrize("return_inner_v", ["first", "all", False])
+def test_meta_step_vectorized(
+    device, step_fn, inner_grad_steps, num_tasks, return_inner_v
+):
+    if ivy.current_backend_str() == "numpy":
+        # Numpy does not support gradients
+        pytest.skip()
+
+    # variables, shared by the tasks
+    variables = ivy.Container(
+        {
+            "latent": ivy.variable(ivy.array([1.0], device=device)),
+            "weight": ivy.variable(ivy.array([0.5], device=device)),
+        }
+    )
+
+    # batch
+    batch = ivy.Container({"x": ivy.arange(1, num_tasks + 1, dtype="float32")})
+
+    # cost functions of one task
+    def inner_cost_fn(sub_batch_in, v):
+        return -(sub_batch_in["x"] * v["latent"] ** 2 * v["weight"])[0]
+
+    def outer_cost_fn(sub_batch_in, v):
+        return (sub_batch_in["x"] * v["latent"] * v["weight"] ** 2)[0]
+
+    # meta updates, with the tasks trained one at a time and vectorized
+    if step_fn == "reptile_step":
+        args = (batch, inner_cost_fn, variables, inner_grad_steps, 1e-2)
+    else:
+        args = (
+            batch,
+            inner_cost_fn,
+            outer_cost_fn,
+            variables,
+            inner_grad_steps,
+            1e-2,
+        )
+    rets, rets_vectorized = [
+        ivy.__dict__[step_fn](
+            *args,
+            batched=False,
+            return_inner_v=return_inner_v,
+            vectorized=vectorized,
+        )
+        for vectorized in (False, True)
+    ]
+    assert np.allclose(ivy.to_scalar(rets[0]), ivy.to_scalar(rets_vectorized[0]))
+    assert ivy.Container.identical_structure([rets[1], rets_vectorized[1]])
+    for grad, grad_vectorized in zip(
+        rets[1].to_flat_list(), rets_vectorized[1].to_flat_list()
+    ):
+        assert np.allclose(ivy.to_numpy(grad), ivy.to_numpy(grad_vectorized))
+    if return_inner_v:
+        assert list(rets_vectorized[2].shape) == list(rets[2].shape)
+        assert np.allclose(
+            ivy.to_numpy(rets[2].latent), ivy.to_numpy(rets_vectorized[2].latent)
+        )
+
+
 # Still to Add #
 # ---------------#
 
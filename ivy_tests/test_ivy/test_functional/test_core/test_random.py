@@ -286,6 +286,35 @@ def test_seed(seed_val):
     ivy.seed(seed_value=seed_val)
 
 
+# rng streams
+@handle_cmd_line_args
+@given(
+    seed_val=helpers.ints(min_value=0, max_value=2147483647),
+)
+def test_rng_stream(seed_val):
+    # the same seed draws the same samples
+    u = ivy.random_uniform(shape=(8,), rng=ivy.RNGStream(seed_val))
+    v = ivy.random_uniform(shape=(8,), rng=ivy.RNGStream(seed_val))
+    assert ivy.all(u == v)
+    # spawned streams are reproducible, and independent of each other
+    a = ivy.RNGStream(seed_val).spawn(2)
+    b = ivy.RNGStream(seed_val).spawn(2)
+    u = [ivy.random_normal(shape=(8,), rng=rng) for rng in a]
+    v = [ivy.random_normal(shape=(8,), rng=rng) for rng in b]
+    assert ivy.all(u[0] == v[0]) and ivy.all(u[1] == v[1])
+    assert not ivy.all(u[0] == u[1])
+    # the stream of the thread is the default while set
+    with ivy.RNGStream(seed_val):
+        u = ivy.randint(0, 100, shape=(8,))
+    with ivy.RNGStream(seed_val):
+        v = ivy.randint(0, 100, shape=(8,))
+    assert ivy.all(u == v)
+    assert ivy.get_rng_stream() is None
+    # seeds of backend generators span the requested widths
+    seeds = [ivy.RNGStream(seed_val).next_seed(bits) for bits in (63, 64)]
+    assert 0 <= seeds[0] < 2**63 and 0 <= seeds[1] < 2**64
+
+
 # shuffle
 @handle_cmd_line_args
 @given(
@@ -1,11 +1,14 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import numpy as np
+import pytest
 from hypothesis import given, strategies as st, assume
 
 # local
 import ivy
 import ivy_tests.test_ivy.helpers as helpers
+from ivy.functional.ivy.layers import lstm_update as compositional_lstm_update
 from ivy_tests.test_ivy.helpers import handle_cmd_line_args
 
 # Linear #
@@ -833,6 +836,181 @@ def test_conv3d_transpose(
     )
 
 
+def _same_padding(size, stride, kernel_size):
+    """The padding before and after an axis of `size` for SAME convolutions."""
+    pad = max((-(-size // stride) - 1) * stride + kernel_size - size, 0)
+    return pad // 2, pad - pad // 2
+
+
+def _conv_reference(x, filters, strides, padding, dilations, groups=1):
+    """Convolve the channel-last `x` with `filters` one output position and one
+    filter position at a time."""
+    dims = filters.ndim - 2
+    filter_shape = filters.shape[:dims]
+    dilated = [(k - 1) * d + 1 for k, d in zip(filter_shape, dilations)]
+    if padding == "SAME":
+        pads = [_same_padding(*a) for a in zip(x.shape[1:-1], strides, dilated)]
+        x = np.pad(x, [(0, 0), *pads, (0, 0)])
+    out_spatial = [
+        (size - k) // stride + 1
+        for size, k, stride in zip(x.shape[1:-1], dilated, strides)
+    ]
+    in_group = x.shape[-1] // groups
+    out_group = filters.shape[-1] // groups
+    res = np.zeros((x.shape[0], *out_spatial, filters.shape[-1]))
+    for o in np.ndindex(*out_spatial):
+        for k in np.ndindex(*filter_shape):
+            pos = [oi * s + ki * d for oi, ki, s, d in zip(o, k, strides, dilations)]
+            x_at = x[(slice(None), *pos)]
+            for g in range(groups):
+                out_channels = slice(g * out_group, (g + 1) * out_group)
+                res[(slice(None), *o, out_channels)] += (
+                    x_at[:, g * in_group : (g + 1) * in_group]
+                    @ filters[(*k, slice(None), out_channels)]
+                )
+    return res
+
+
+# conv engine of the numpy backend, against a direct reference
+@pytest.mark.parametrize(
+    "fn_name, strides, dilations, groups",
+    [
+        ("conv1d", 2, 2, 1),
+        ("conv2d", (1, 2), (2, 1), 1),
+        ("conv3d", (2, 1, 3), (1, 2, 1), 1),
+        ("conv_general_dilated", (3,), (2,), 2),
+        ("conv_general_dilated", (2, 1), (1, 2), 2),
+        ("conv_general_dilated", (1, 2, 1), (2, 1, 1), 3),
+    ],
+)
+@pytest.mark.parametrize("padding", ["VALID", "SAME"])
+def test_conv_numpy_reference(fn_name, strides, dilations, groups, padding, device):
+    ivy.set_backend("numpy")
+    try:
+        dims = len(strides) if isinstance(strides, tuple) else 1
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-1, 1, (2, *[7, 8, 6][:dims], 6)).astype("float32")
+        filters = rng.uniform(
+            -1, 1, (*[3, 2, 2][:dims], 6 // groups, 4 * groups)
+        ).astype("float32")
+        if fn_name == "conv_general_dilated":
+            ret = ivy.conv_general_dilated(
+                x,
+                filters,
+                strides,
+                padding,
+                dims=dims,
+                dilations=dilations,
+                feature_group_count=groups,
+            )
+        else:
+            ret = getattr(ivy, fn_name)(
+                x, filters, strides, padding, dilations=dilations
+            )
+        strides = strides if isinstance(strides, tuple) else (strides,)
+        dilations = dilations if isinstance(dilations, tuple) else (dilations,)
+        expected = _conv_reference(x, filters, strides, padding, dilations, groups)
+        assert ret.shape == expected.shape
+        assert np.allclose(ivy.to_numpy(ret), expected, atol=1e-4)
+    finally:
+        ivy.unset_backend()
+
+
+def _conv_transpose_reference(
+    x, filters, strides, padding, dilations, output_shape, groups=1
+):
+    """Transpose convolve the channel-last `x` with `filters` by adding the product
+    of each input position and filter position to the output."""
+    dims = filters.ndim - 2
+    filter_shape = filters.shape[:dims]
+    dilated = [(k - 1) * d + 1 for k, d in zip(filter_shape, dilations)]
+    in_spatial = x.shape[1:-1]
+    if output_shape is None:
+        output_shape = [
+            size * stride + (max(k - stride, 0) if padding == "VALID" else 0)
+            for size, stride, k in zip(in_spatial, strides, dilated)
+        ]
+    full = [(size - 1) * s + k for size, s, k in zip(in_spatial, strides, dilated)]
+    in_group = x.shape[-1] // groups
+    out_group = filters.shape[-1]
+    res = np.zeros((x.shape[0], *full, groups * out_group))
+    for i in np.ndindex(*in_spatial):
+        for k in np.ndindex(*filter_shape):
+            pos = [ii * s + ki * d for ii, ki, s, d in zip(i, k, strides, dilations)]
+            for g in range(groups):
+                in_channels = slice(g * in_group, (g + 1) * in_group)
+                res[(slice(None), *pos, slice(g * out_group, (g + 1) * out_group))] += (
+                    x[(slice(None), *i, in_channels)] @ filters[(*k, in_channels)]
+                )
+    # the output shape is cropped from after the padding a convolution of an input of
+    # that shape would take, and filled with zeros beyond the end of the result
+    starts = [
+        _same_padding(*a)[0] if padding == "SAME" else 0
+        for a in zip(output_shape, strides, dilated)
+    ]
+    cropped = res[
+        (slice(None), *[slice(b, b + size) for b, size in zip(starts, output_shape)])
+    ]
+    ret = np.zeros((x.shape[0], *output_shape, res.shape[-1]))
+    ret[(slice(None), *[slice(0, size) for size in cropped.shape[1:-1]])] = cropped
+    return ret
+
+
+# transposed conv engine of the numpy backend, against a direct reference
+@pytest.mark.parametrize(
+    "fn_name, strides, dilations, output_shape, groups",
+    [
+        ("conv1d_transpose", 2, 2, None, 1),
+        ("conv1d_transpose", 3, 1, [8], 1),
+        ("conv2d_transpose", (2, 3), (1, 2), None, 1),
+        ("conv2d_transpose", (2, 3), (2, 1), [6, 9], 1),
+        ("conv3d_transpose", (2, 1, 2), (2, 1, 1), None, 1),
+        ("conv3d_transpose", (1, 2, 2), (1, 1, 2), [3, 5, 4], 1),
+        ("conv_general_transpose", (2, 2), (1, 2), None, 2),
+        ("conv_general_transpose", (3, 2), (2, 1), [7, 5], 3),
+    ],
+)
+@pytest.mark.parametrize("padding", ["VALID", "SAME"])
+def test_conv_transpose_numpy_reference(
+    fn_name, strides, dilations, output_shape, groups, padding, device
+):
+    ivy.set_backend("numpy")
+    try:
+        dims = len(strides) if isinstance(strides, tuple) else 1
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-1, 1, (2, *[4, 5, 3][:dims], 6)).astype("float32")
+        filters = rng.uniform(-1, 1, (*[3, 2, 3][:dims], 6, 2)).astype("float32")
+        if fn_name == "conv_general_transpose":
+            ret = ivy.conv_general_transpose(
+                x,
+                filters,
+                strides,
+                padding,
+                dims=dims,
+                output_shape=output_shape,
+                dilations=dilations,
+                feature_group_count=groups,
+            )
+        else:
+            ret = getattr(ivy, fn_name)(
+                x,
+                filters,
+                strides,
+                padding,
+                output_shape=output_shape,
+                dilations=dilations,
+            )
+        strides = strides if isinstance(strides, tuple) else (strides,)
+        dilations = dilations if isinstance(dilations, tuple) else (dilations,)
+        expected = _conv_transpose_reference(
+            x, filters, strides, padding, dilations, output_shape, groups
+        )
+        assert ret.shape == expected.shape
+        assert np.allclose(ivy.to_numpy(ret), expected, atol=1e-4)
+    finally:
+        ivy.unset_backend()
+
+
 # LSTM #
 # -----#
 
@@ -948,3 +1126,35 @@ def test_lstm_update(
         bias=bias,
         recurrent_bias=recurrent_bias,
     )
+
+
+# lstm kernels of the backends, against the compositional implementation
+@pytest.mark.parametrize("batch_shape", [(), (2, 3)])
+@pytest.mark.parametrize("with_bias", [True, False])
+@pytest.mark.parametrize("with_recurrent_bias", [True, False])
+def test_lstm_update_kernel(batch_shape, with_bias, with_recurrent_bias, fw):
+    ivy.set_backend(fw)
+    try:
+        rng = np.random.default_rng(0)
+        timesteps, in_channels, out_channels = 3, 4, 5
+
+        def _uniform(*shape):
+            return ivy.array(rng.uniform(-1, 1, shape).astype("float32"))
+
+        x = _uniform(*batch_shape, timesteps, in_channels)
+        init_h = _uniform(*batch_shape, out_channels)
+        init_c = _uniform(*batch_shape, out_channels)
+        kernel = _uniform(in_channels, 4 * out_channels)
+        recurrent_kernel = _uniform(out_channels, 4 * out_channels)
+        bias = _uniform(4 * out_channels) if with_bias else None
+        recurrent_bias = _uniform(4 * out_channels) if with_recurrent_bias else None
+        args = (x, init_h, init_c, kernel, recurrent_kernel)
+        kwargs = dict(bias=bias, recurrent_bias=recurrent_bias)
+        hts, ct = ivy.lstm_update(*args, **kwargs)
+        hts_gt, ct_gt = compositional_lstm_update(*args, **kwargs)
+        assert hts.shape == tuple(batch_shape) + (timesteps, out_channels)
+        assert ct.shape == tuple(batch_shape) + (out_channels,)
+        assert np.allclose(ivy.to_numpy(hts), ivy.to_numpy(hts_gt), atol=1e-5)
+        assert np.allclose(ivy.to_numpy(ct), ivy.to_numpy(ct_gt), atol=1e-5)
+    finally:
+        ivy.unset_backend()
@@ -23,6 +23,7 @@ from ivy_tests.test_ivy.helpers import handle_cmd_line_args
     lr=st.floats(min_value=0.0, max_value=1.0),
     inplace=st.booleans(),
     stop_gradients=st.booleans(),
+    fused=st.booleans(),
     num_positional_args_init=helpers.num_positional_args(fn_name="SGD.__init__"),
     num_positional_args_method=helpers.num_positional_args(fn_name="SGD._step"),
 )
@@ -31,6 +32,7 @@ def test_sgd_optimizer(
     lr,
     inplace,
     stop_gradients,
+    fused,
     num_positional_args_init,
     num_positional_args_method,
     as_variable,
@@ -45,6 +47,7 @@ def test_sgd_optimizer(
             "lr": lr,
             "inplace": inplace,
             "stop_gradients": stop_gradients,
+            "fused": fused,
         },
         input_dtypes_method=input_dtype,
         as_variable_flags_method=as_variable,
@@ -73,6 +76,7 @@ def test_sgd_optimizer(
     lr=st.floats(min_value=0.0, max_value=1.0),
     decay_lambda=st.floats(min_value=0.0, max_value=1.0),
     stop_gradients=st.booleans(),
+    fused=st.booleans(),
     num_positional_args_init=helpers.num_positional_args(fn_name="LARS.__init__"),
     num_positional_args_method=helpers.num_positional_args(fn_name="LARS._step"),
 )
@@ -82,6 +86,7 @@ def test_lars_optimizer(
     decay_lambda,
     inplace,
     stop_gradients,
+    fused,
     num_positional_args_init,
     num_positional_args_method,
     as_variable,
@@ -97,6 +102,7 @@ def test_lars_optimizer(
             "decay_lambda": decay_lambda,
             "inplace": inplace,
             "stop_gradients": stop_gradients,
+            "fused": fused,
         },
         input_dtypes_method=input_dtype,
         as_variable_flags_method=as_variable,
@@ -127,6 +133,7 @@ def test_lars_optimizer(
     epsilon=st.floats(min_value=1e-07, max_value=1.0),
     inplace=st.booleans(),
     stop_gradients=st.booleans(),
+    fused=st.booleans(),
     num_positional_args_init=helpers.num_positional_args(fn_name="Adam.__init__"),
     num_positional_args_method=helpers.num_positional_args(fn_name="Adam._step"),
 )
@@ -138,6 +145,7 @@ def test_adam_optimizer(
     epsilon,
     inplace,
     stop_gradients,
+    fused,
     device,
     num_positional_args_init,
     num_positional_args_method,
@@ -156,6 +164,7 @@ def test_adam_optimizer(
             "epsilon": epsilon,
             "inplace": inplace,
             "stop_gradients": stop_gradients,
+            "fused": fused,
         },
         input_dtypes_method=input_dtype,
         as_variable_flags_method=as_variable,
@@ -189,6 +198,7 @@ def test_adam_optimizer(
     decay_lambda=st.floats(min_value=0.0, max_value=1.0),
     inplace=st.booleans(),
     stop_gradients=st.booleans(),
+    fused=st.booleans(),
     num_positional_args_init=helpers.num_positional_args(fn_name="LAMB.__init__"),
     num_positional_args_method=helpers.num_positional_args(fn_name="LAMB._step"),
 )
@@ -202,6 +212,7 @@ def test_lamb_optimizer(
     decay_lambda,
     inplace,
     stop_gradients,
+    fused,
     device,
     num_positional_args_init,
     num_positional_args_method,
@@ -222,6 +233,7 @@ def test_lamb_optimizer(
             "decay_lambda": decay_lambda,
             "inplace": inplace,
             "stop_gradients": stop_gradients,
+            "fused": fused,
         },
         input_dtypes_method=input_dtype,
         as_variable_flags_method=as_variable,